@@ -0,0 +1,69 @@
+"""add starlisting notify trigger for websocket cache invalidation
+
+Revision ID: starlisting_notify_001
+Revises: trading_pairs_002
+Create Date: 2025-11-20 00:01:00.000000
+
+This migration adds a PostgreSQL trigger and function to emit NOTIFY events
+when starlistings are inserted, updated or deleted. The WebSocket API caches
+starlisting active flags and metadata in memory; the listener evicts a
+starlisting's cache entries on notification, so activating or deactivating a
+starlisting takes effect immediately instead of after the cache expires.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "starlisting_notify_001"
+down_revision: Union[str, None] = "trading_pairs_002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add NOTIFY trigger for starlisting changes."""
+
+    # Create trigger function that sends NOTIFY with the changed starlisting's ID
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_starlisting_update()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            payload TEXT;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                payload := json_build_object('starlisting_id', OLD.id)::TEXT;
+            ELSE
+                payload := json_build_object('starlisting_id', NEW.id)::TEXT;
+            END IF;
+
+            -- Send notification on 'starlisting_updates' channel
+            PERFORM pg_notify('starlisting_updates', payload);
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    # Create trigger on starlistings table (fires AFTER INSERT, UPDATE or DELETE)
+    op.execute("""
+        CREATE TRIGGER starlisting_update_notify_trigger
+        AFTER INSERT OR UPDATE OR DELETE ON starlistings
+        FOR EACH ROW
+        EXECUTE FUNCTION notify_starlisting_update();
+    """)
+
+
+def downgrade() -> None:
+    """Remove NOTIFY trigger and function."""
+
+    # Drop trigger first (depends on function)
+    op.execute("""
+        DROP TRIGGER IF EXISTS starlisting_update_notify_trigger ON starlistings;
+    """)
+
+    # Drop trigger function
+    op.execute("""
+        DROP FUNCTION IF EXISTS notify_starlisting_update();
+    """)
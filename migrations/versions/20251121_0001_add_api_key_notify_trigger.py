@@ -0,0 +1,83 @@
+"""add api key notify trigger for websocket auth cache invalidation
+
+Revision ID: api_key_notify_001
+Revises: starlisting_notify_001
+Create Date: 2025-11-21 00:01:00.000000
+
+This migration adds a PostgreSQL trigger and function to emit NOTIFY events
+when an API key is revoked, has its expiry changed, or is deleted. Every API
+worker caches successful API key validations for WebSocket connects in memory;
+each worker's listener evicts the key on notification, so a revoke takes
+effect on all workers immediately, not only on the one that served it.
+
+Updates that only record last use do not notify, so validating a key does not
+evict it from the cache it was just added to.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "api_key_notify_001"
+down_revision: Union[str, None] = "starlisting_notify_001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add NOTIFY triggers for API key revocation."""
+
+    # Create trigger function that sends NOTIFY with the changed key's hash
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_api_key_update()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            -- Send notification on 'api_key_updates' channel
+            PERFORM pg_notify(
+                'api_key_updates',
+                json_build_object('key_hash', OLD.key_hash)::TEXT
+            );
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    # Notify when a key is (de)activated or its expiry changes, but not when
+    # only last_used_at is recorded
+    op.execute("""
+        CREATE TRIGGER api_key_update_notify_trigger
+        AFTER UPDATE ON api_keys
+        FOR EACH ROW
+        WHEN (
+            OLD.is_active IS DISTINCT FROM NEW.is_active
+            OR OLD.expires_at IS DISTINCT FROM NEW.expires_at
+            OR OLD.key_hash IS DISTINCT FROM NEW.key_hash
+        )
+        EXECUTE FUNCTION notify_api_key_update();
+    """)
+
+    op.execute("""
+        CREATE TRIGGER api_key_delete_notify_trigger
+        AFTER DELETE ON api_keys
+        FOR EACH ROW
+        EXECUTE FUNCTION notify_api_key_update();
+    """)
+
+
+def downgrade() -> None:
+    """Remove NOTIFY triggers and function."""
+
+    # Drop triggers first (depend on function)
+    op.execute("""
+        DROP TRIGGER IF EXISTS api_key_delete_notify_trigger ON api_keys;
+    """)
+    op.execute("""
+        DROP TRIGGER IF EXISTS api_key_update_notify_trigger ON api_keys;
+    """)
+
+    # Drop trigger function
+    op.execute("""
+        DROP FUNCTION IF EXISTS notify_api_key_update();
+    """)
@@ -11,12 +11,14 @@ Environment Variables:
     WEBSOCKET_URL: WebSocket URL (default: ws://localhost:8000/ws)
     STARLISTING_IDS: Comma-separated starlisting IDs to subscribe to (default: 1,2)
     HISTORY: Number of historical candles to request (default: 10)
+    COMPRESS: Request compressed historical data, "1" to enable (default: 0)
 """
 
 import asyncio
 import json
 import os
 import sys
+import zlib
 from datetime import datetime
 
 import websockets
@@ -34,6 +36,7 @@ class KirbyWebSocketClient:
         url: str = "ws://localhost:8000/ws",
         starlisting_ids: list[int] = None,
         history: int = 10,
+        compress: bool = False,
     ):
         """Initialize the WebSocket client.
 
@@ -42,12 +45,14 @@ class KirbyWebSocketClient:
             url: WebSocket URL (base URL without query params)
             starlisting_ids: List of starlisting IDs to subscribe to
             history: Number of historical candles to request
+            compress: Whether to request compressed historical data
         """
         # Add API key as query parameter
         separator = "&" if "?" in url else "?"
         self.url = f"{url}{separator}api_key={api_key}"
         self.starlisting_ids = starlisting_ids or [1, 2]
         self.history = history
+        self.compress = compress
         self.websocket = None
         self.running = False
 
@@ -76,6 +81,7 @@ class KirbyWebSocketClient:
                 "action": "subscribe",
                 "starlisting_ids": self.starlisting_ids,
                 "history": self.history,
+                "compress": self.compress,
             }
 
             print(
@@ -142,147 +148,158 @@ class KirbyWebSocketClient:
 
         try:
             async for message in self.websocket:
-                data = json.loads(message)
-                msg_type = data.get("type")
-
-                if msg_type == "success":
-                    print(f"\n✅ SUCCESS: {data.get('message')}")
-                    if data.get("starlisting_ids"):
-                        print(f"   Starlisting IDs: {data.get('starlisting_ids')}")
-
-                elif msg_type == "error":
-                    print(f"\n❌ ERROR: {data.get('message')}")
-                    if data.get("code"):
-                        print(f"   Error code: {data.get('code')}")
-
-                elif msg_type == "pong":
-                    print(f"\n🏓 PONG: {data.get('timestamp')}")
-
-                elif msg_type == "ping":
-                    print(f"\n🏓 PING: {data.get('timestamp')}")
-
-                elif msg_type == "historical":
-                    print(f"\n📊 HISTORICAL CANDLE DATA:")
-                    print(f"   Starlisting ID: {data.get('starlisting_id')}")
-                    print(
-                        f"   Trading Pair: {data.get('trading_pair')} ({data.get('exchange')})"
-                    )
-                    print(
-                        f"   Market Type: {data.get('market_type')} | Interval: {data.get('interval')}"
-                    )
-                    print(f"   Candles: {data.get('count')}")
-
-                    # Print first and last candle
-                    candles = data.get("data", [])
-                    if candles:
-                        first = candles[0]
-                        last = candles[-1]
+                # Compressed historical batches arrive as binary frames
+                if isinstance(message, bytes):
+                    message = zlib.decompress(message)
+                payload = json.loads(message)
+
+                # Historical data (and other bursts) arrive wrapped in a batch envelope
+                if payload.get("type") == "batch":
+                    batch = payload.get("messages", [])
+                else:
+                    batch = [payload]
+
+                for data in batch:
+                    msg_type = data.get("type")
+
+                    if msg_type == "success":
+                        print(f"\n✅ SUCCESS: {data.get('message')}")
+                        if data.get("starlisting_ids"):
+                            print(f"   Starlisting IDs: {data.get('starlisting_ids')}")
+
+                    elif msg_type == "error":
+                        print(f"\n❌ ERROR: {data.get('message')}")
+                        if data.get("code"):
+                            print(f"   Error code: {data.get('code')}")
+
+                    elif msg_type == "pong":
+                        print(f"\n🏓 PONG: {data.get('timestamp')}")
+
+                    elif msg_type == "ping":
+                        print(f"\n🏓 PING: {data.get('timestamp')}")
+
+                    elif msg_type == "historical":
+                        print(f"\n📊 HISTORICAL CANDLE DATA:")
+                        print(f"   Starlisting ID: {data.get('starlisting_id')}")
                         print(
-                            f"   First candle: {first.get('time')} | Close: {first.get('close')}"
+                            f"   Trading Pair: {data.get('trading_pair')} ({data.get('exchange')})"
                         )
                         print(
-                            f"   Last candle:  {last.get('time')} | Close: {last.get('close')}"
+                            f"   Market Type: {data.get('market_type')} | Interval: {data.get('interval')}"
                         )
-
-                elif msg_type == "historical_funding":
-                    print(f"\n💰 HISTORICAL FUNDING RATE DATA:")
-                    print(f"   Starlisting ID: {data.get('starlisting_id')}")
-                    print(
-                        f"   Trading Pair: {data.get('trading_pair')} ({data.get('exchange')})"
-                    )
-                    print(f"   Market Type: {data.get('market_type')}")
-                    print(f"   Snapshots: {data.get('count')}")
-
-                    # Print first and last snapshot
-                    snapshots = data.get("data", [])
-                    if snapshots:
-                        first = snapshots[0]
-                        last = snapshots[-1]
+                        print(f"   Candles: {data.get('count')}")
+
+                        # Print first and last candle
+                        candles = data.get("data", [])
+                        if candles:
+                            first = candles[0]
+                            last = candles[-1]
+                            print(
+                                f"   First candle: {first.get('time')} | Close: {first.get('close')}"
+                            )
+                            print(
+                                f"   Last candle:  {last.get('time')} | Close: {last.get('close')}"
+                            )
+
+                    elif msg_type == "historical_funding":
+                        print(f"\n💰 HISTORICAL FUNDING RATE DATA:")
+                        print(f"   Starlisting ID: {data.get('starlisting_id')}")
                         print(
-                            f"   First snapshot: {first.get('time')} | Rate: {first.get('funding_rate')}"
+                            f"   Trading Pair: {data.get('trading_pair')} ({data.get('exchange')})"
                         )
+                        print(f"   Market Type: {data.get('market_type')}")
+                        print(f"   Snapshots: {data.get('count')}")
+
+                        # Print first and last snapshot
+                        snapshots = data.get("data", [])
+                        if snapshots:
+                            first = snapshots[0]
+                            last = snapshots[-1]
+                            print(
+                                f"   First snapshot: {first.get('time')} | Rate: {first.get('funding_rate')}"
+                            )
+                            print(
+                                f"   Last snapshot:  {last.get('time')} | Rate: {last.get('funding_rate')}"
+                            )
+
+                    elif msg_type == "historical_oi":
+                        print(f"\n📈 HISTORICAL OPEN INTEREST DATA:")
+                        print(f"   Starlisting ID: {data.get('starlisting_id')}")
                         print(
-                            f"   Last snapshot:  {last.get('time')} | Rate: {last.get('funding_rate')}"
+                            f"   Trading Pair: {data.get('trading_pair')} ({data.get('exchange')})"
                         )
-
-                elif msg_type == "historical_oi":
-                    print(f"\n📈 HISTORICAL OPEN INTEREST DATA:")
-                    print(f"   Starlisting ID: {data.get('starlisting_id')}")
-                    print(
-                        f"   Trading Pair: {data.get('trading_pair')} ({data.get('exchange')})"
-                    )
-                    print(f"   Market Type: {data.get('market_type')}")
-                    print(f"   Snapshots: {data.get('count')}")
-
-                    # Print first and last snapshot
-                    snapshots = data.get("data", [])
-                    if snapshots:
-                        first = snapshots[0]
-                        last = snapshots[-1]
+                        print(f"   Market Type: {data.get('market_type')}")
+                        print(f"   Snapshots: {data.get('count')}")
+
+                        # Print first and last snapshot
+                        snapshots = data.get("data", [])
+                        if snapshots:
+                            first = snapshots[0]
+                            last = snapshots[-1]
+                            print(
+                                f"   First snapshot: {first.get('time')} | OI: {first.get('open_interest')}"
+                            )
+                            print(
+                                f"   Last snapshot:  {last.get('time')} | OI: {last.get('open_interest')}"
+                            )
+
+                    elif msg_type == "candle":
+                        candle_data = data.get("data", {})
+                        print(f"\n🕯️  NEW CANDLE UPDATE:")
+                        print(f"   Starlisting ID: {data.get('starlisting_id')}")
                         print(
-                            f"   First snapshot: {first.get('time')} | OI: {first.get('open_interest')}"
+                            f"   Trading Pair: {data.get('trading_pair')} ({data.get('exchange')})"
                         )
                         print(
-                            f"   Last snapshot:  {last.get('time')} | OI: {last.get('open_interest')}"
+                            f"   Market Type: {data.get('market_type')} | Interval: {data.get('interval')}"
                         )
+                        print(f"   Time: {candle_data.get('time')}")
+                        print(
+                            f"   OHLC: {candle_data.get('open')} / {candle_data.get('high')} / "
+                            f"{candle_data.get('low')} / {candle_data.get('close')}"
+                        )
+                        print(f"   Volume: {candle_data.get('volume')}")
+                        if candle_data.get("num_trades"):
+                            print(f"   Trades: {candle_data.get('num_trades')}")
+
+                    elif msg_type == "funding":
+                        funding_data = data.get("data", {})
+                        print(f"\n💰 NEW FUNDING RATE UPDATE:")
+                        print(f"   Starlisting ID: {data.get('starlisting_id')}")
+                        print(
+                            f"   Trading Pair: {data.get('trading_pair')} ({data.get('exchange')})"
+                        )
+                        print(f"   Market Type: {data.get('market_type')}")
+                        print(f"   Time: {funding_data.get('time')}")
+                        print(f"   Funding Rate: {funding_data.get('funding_rate')}")
+                        print(f"   Premium: {funding_data.get('premium')}")
+                        if funding_data.get("mark_price"):
+                            print(f"   Mark Price: {funding_data.get('mark_price')}")
+                        if funding_data.get("index_price"):
+                            print(f"   Index Price: {funding_data.get('index_price')}")
+                        if funding_data.get("next_funding_time"):
+                            print(f"   Next Funding: {funding_data.get('next_funding_time')}")
+
+                    elif msg_type == "open_interest":
+                        oi_data = data.get("data", {})
+                        print(f"\n📈 NEW OPEN INTEREST UPDATE:")
+                        print(f"   Starlisting ID: {data.get('starlisting_id')}")
+                        print(
+                            f"   Trading Pair: {data.get('trading_pair')} ({data.get('exchange')})"
+                        )
+                        print(f"   Market Type: {data.get('market_type')}")
+                        print(f"   Time: {oi_data.get('time')}")
+                        print(f"   Open Interest: {oi_data.get('open_interest')}")
+                        if oi_data.get("notional_value"):
+                            print(f"   Notional Value: {oi_data.get('notional_value')}")
+                        if oi_data.get("day_base_volume"):
+                            print(f"   Day Volume: {oi_data.get('day_base_volume')}")
 
-                elif msg_type == "candle":
-                    candle_data = data.get("data", {})
-                    print(f"\n🕯️  NEW CANDLE UPDATE:")
-                    print(f"   Starlisting ID: {data.get('starlisting_id')}")
-                    print(
-                        f"   Trading Pair: {data.get('trading_pair')} ({data.get('exchange')})"
-                    )
-                    print(
-                        f"   Market Type: {data.get('market_type')} | Interval: {data.get('interval')}"
-                    )
-                    print(f"   Time: {candle_data.get('time')}")
-                    print(
-                        f"   OHLC: {candle_data.get('open')} / {candle_data.get('high')} / "
-                        f"{candle_data.get('low')} / {candle_data.get('close')}"
-                    )
-                    print(f"   Volume: {candle_data.get('volume')}")
-                    if candle_data.get("num_trades"):
-                        print(f"   Trades: {candle_data.get('num_trades')}")
-
-                elif msg_type == "funding":
-                    funding_data = data.get("data", {})
-                    print(f"\n💰 NEW FUNDING RATE UPDATE:")
-                    print(f"   Starlisting ID: {data.get('starlisting_id')}")
-                    print(
-                        f"   Trading Pair: {data.get('trading_pair')} ({data.get('exchange')})"
-                    )
-                    print(f"   Market Type: {data.get('market_type')}")
-                    print(f"   Time: {funding_data.get('time')}")
-                    print(f"   Funding Rate: {funding_data.get('funding_rate')}")
-                    print(f"   Premium: {funding_data.get('premium')}")
-                    if funding_data.get("mark_price"):
-                        print(f"   Mark Price: {funding_data.get('mark_price')}")
-                    if funding_data.get("index_price"):
-                        print(f"   Index Price: {funding_data.get('index_price')}")
-                    if funding_data.get("next_funding_time"):
-                        print(f"   Next Funding: {funding_data.get('next_funding_time')}")
-
-                elif msg_type == "open_interest":
-                    oi_data = data.get("data", {})
-                    print(f"\n📈 NEW OPEN INTEREST UPDATE:")
-                    print(f"   Starlisting ID: {data.get('starlisting_id')}")
-                    print(
-                        f"   Trading Pair: {data.get('trading_pair')} ({data.get('exchange')})"
-                    )
-                    print(f"   Market Type: {data.get('market_type')}")
-                    print(f"   Time: {oi_data.get('time')}")
-                    print(f"   Open Interest: {oi_data.get('open_interest')}")
-                    if oi_data.get("notional_value"):
-                        print(f"   Notional Value: {oi_data.get('notional_value')}")
-                    if oi_data.get("day_base_volume"):
-                        print(f"   Day Volume: {oi_data.get('day_base_volume')}")
-
-                else:
-                    print(f"\n📨 Unknown message type: {msg_type}")
-                    print(f"   Data: {json.dumps(data, indent=2)}")
+                    else:
+                        print(f"\n📨 Unknown message type: {msg_type}")
+                        print(f"   Data: {json.dumps(data, indent=2)}")
 
-                print("-" * 80)
+                    print("-" * 80)
 
         except websockets.exceptions.ConnectionClosed:
             print(f"\n[{datetime.now()}] Connection closed by server")
@@ -337,6 +354,7 @@ async def main():
     url = os.getenv("WEBSOCKET_URL", "ws://localhost:8000/ws")
     starlisting_ids_str = os.getenv("STARLISTING_IDS", "1,2")
     history = int(os.getenv("HISTORY", "10"))
+    compress = os.getenv("COMPRESS", "0") == "1"
 
     # Parse starlisting IDs
     starlisting_ids = [int(sid.strip()) for sid in starlisting_ids_str.split(",")]
@@ -357,6 +375,7 @@ async def main():
         url=url,
         starlisting_ids=starlisting_ids,
         history=history,
+        compress=compress,
     )
 
     await client.run()
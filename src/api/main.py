@@ -1,6 +1,7 @@
 """
 Main FastAPI application for Kirby API.
 """
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
@@ -25,7 +26,11 @@ async def lifespan(app: FastAPI):
     logger = structlog.get_logger("kirby.api")
 
     # Startup
-    logger.info("Starting Kirby API", environment=settings.environment)
+    logger.info(
+        "Starting Kirby API",
+        environment=settings.environment,
+        event_loop=type(asyncio.get_running_loop()).__module__,
+    )
 
     # Set up logging
     setup_logging()
@@ -38,6 +43,9 @@ async def lifespan(app: FastAPI):
     connection_manager = ConnectionManager(
         max_connections=settings.websocket_max_connections,
         heartbeat_interval=settings.websocket_heartbeat_interval,
+        send_queue_size=settings.websocket_send_queue_size,
+        compression_threshold=settings.websocket_compression_threshold,
+        raw_frames=settings.websocket_raw_frames,
     )
     websocket.set_connection_manager(connection_manager)
     logger.info(
@@ -59,6 +67,9 @@ async def lifespan(app: FastAPI):
     await postgres_listener.stop()
     logger.info("PostgreSQL notification listener stopped")
 
+    # Let sockets of dropped slow clients finish closing
+    await connection_manager.wait_closed()
+
     # Close database connections
     await close_db()
     logger.info("Database connections closed")
@@ -1,7 +1,8 @@
 """Authentication middleware for API key validation."""
 
+import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, Optional
 
 from fastapi import Depends, HTTPException, Security, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -15,6 +16,13 @@ from src.utils.auth import hash_api_key, is_key_expired
 # Security scheme for API key in Authorization header
 security_scheme = HTTPBearer(auto_error=False)
 
+# Recently validated API keys: key hash -> (user, api_key, cached_until).
+# Lets bursts of WebSocket (re)connects with the same key skip the database.
+# Revoking a key evicts it; other changes are picked up once the entry lapses.
+API_KEY_CACHE_TTL = 60.0
+API_KEY_CACHE_MAX_SIZE = 10_000
+_api_key_cache: Dict[str, tuple[User, APIKey, float]] = {}
+
 
 class AuthenticatedUser:
     """Container for authenticated user and API key information."""
@@ -125,6 +133,56 @@ async def validate_api_key(
     return user, api_key_obj
 
 
+async def validate_api_key_cached(
+    session: AsyncSession,
+    api_key: str,
+) -> tuple[User, APIKey]:
+    """Validate an API key, reusing a successful validation for API_KEY_CACHE_TTL.
+
+    Only successful validations are cached, and a cached key is still checked for
+    expiry. On a cache hit the database is not touched, so last_used_at is only
+    refreshed when the key is (re)validated against the database.
+
+    Args:
+        session: Database session (only used on a cache miss)
+        api_key: The API key to validate
+
+    Returns:
+        Tuple of (User, APIKey)
+
+    Raises:
+        HTTPException: If the API key is invalid, inactive, or expired
+    """
+    key_hash = hash_api_key(api_key)
+    now = time.monotonic()
+
+    cached = _api_key_cache.get(key_hash)
+    if cached and cached[2] > now and not is_key_expired(cached[1].expires_at):
+        return cached[0], cached[1]
+
+    user, api_key_obj = await validate_api_key(session, api_key)
+
+    if len(_api_key_cache) >= API_KEY_CACHE_MAX_SIZE:
+        # Make room by dropping the oldest entry
+        del _api_key_cache[next(iter(_api_key_cache))]
+    _api_key_cache.pop(key_hash, None)
+    _api_key_cache[key_hash] = (user, api_key_obj, now + API_KEY_CACHE_TTL)
+
+    return user, api_key_obj
+
+
+def invalidate_api_key_cache(key_hash: str | None = None) -> None:
+    """Evict a cached API key validation, or all of them.
+
+    Args:
+        key_hash: Hash of the key to evict (None evicts every key)
+    """
+    if key_hash is None:
+        _api_key_cache.clear()
+    else:
+        _api_key_cache.pop(key_hash, None)
+
+
 async def get_current_user(
     session: AsyncSession = Depends(get_db_session),
     api_key: Optional[str] = Security(get_api_key_from_header),
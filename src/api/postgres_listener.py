@@ -7,17 +7,23 @@ broadcasts it to all subscribed WebSocket clients.
 
 This approach provides near real-time updates (typically < 100ms latency) without
 requiring a separate message broker like Redis.
+
+Changes to starlistings are notified too, and evict the WebSocket API's cached
+starlisting flags and metadata. Revoked API keys are evicted from the cached
+WebSocket key validations the same way, so a revoke reaches every API worker.
 """
 
 import asyncio
-import json
 from datetime import datetime
 from decimal import Decimal
 from typing import Any, Dict
 
 import asyncpg
+import orjson
 from structlog import get_logger
 
+from src.api.middleware.auth import invalidate_api_key_cache
+from src.api.starlisting_cache import clear_starlisting_cache
 from src.api.websocket_manager import ConnectionManager
 from src.config.settings import settings
 from src.db.connection import get_asyncpg_pool
@@ -31,10 +37,12 @@ class PostgresNotificationListener:
     This class maintains a dedicated asyncpg connection for LISTEN/NOTIFY operations,
     separate from the main connection pool to avoid blocking other queries.
 
-    Handles three types of notifications:
+    Handles five types of notifications:
     - candle_updates: New OHLCV candle data
     - funding_updates: New funding rate data
     - oi_updates: New open interest data
+    - starlisting_updates: Starlisting changes (evicts cached starlisting data)
+    - api_key_updates: API key revocations (evicts cached key validations)
     """
 
     def __init__(self, connection_manager: ConnectionManager):
@@ -48,13 +56,19 @@ class PostgresNotificationListener:
         self.listener_task: asyncio.Task | None = None
         self.is_running = False
 
+        # Notifications (channel, id, time) whose handler has not queried the database
+        # yet. A repeat of one of these is dropped: the pending query runs after the
+        # repeat's commit, so it already reads (and broadcasts) the newest data.
+        self._pending_notifications: set[tuple[str, int, str]] = set()
+
         logger.info("postgres_listener_initialized")
 
     async def start(self) -> None:
         """Start the notification listener.
 
         Creates a dedicated asyncpg connection and starts listening for notifications
-        on three channels: candle_updates, funding_updates, and oi_updates.
+        on five channels: candle_updates, funding_updates, oi_updates,
+        starlisting_updates, and api_key_updates.
         """
         if self.is_running:
             logger.warning("postgres_listener_already_running")
@@ -68,12 +82,25 @@ class PostgresNotificationListener:
             await self.connection.add_listener("candle_updates", self._notification_callback)
             await self.connection.add_listener("funding_updates", self._notification_callback)
             await self.connection.add_listener("oi_updates", self._notification_callback)
+            await self.connection.add_listener(
+                "starlisting_updates", self._notification_callback
+            )
+            await self.connection.add_listener("api_key_updates", self._notification_callback)
 
             # Start listener task
             self.is_running = True
             self.listener_task = asyncio.create_task(self._listen_loop())
 
-            logger.info("postgres_listener_started", channels=["candle_updates", "funding_updates", "oi_updates"])
+            logger.info(
+                "postgres_listener_started",
+                channels=[
+                    "candle_updates",
+                    "funding_updates",
+                    "oi_updates",
+                    "starlisting_updates",
+                    "api_key_updates",
+                ],
+            )
 
         except Exception as e:
             logger.error("postgres_listener_start_failed", error=str(e))
@@ -100,9 +127,17 @@ class PostgresNotificationListener:
             await self.connection.remove_listener("candle_updates", self._notification_callback)
             await self.connection.remove_listener("funding_updates", self._notification_callback)
             await self.connection.remove_listener("oi_updates", self._notification_callback)
+            await self.connection.remove_listener(
+                "starlisting_updates", self._notification_callback
+            )
+            await self.connection.remove_listener(
+                "api_key_updates", self._notification_callback
+            )
             await self.connection.close()
             self.connection = None
 
+        self._pending_notifications.clear()
+
         logger.info("postgres_listener_stopped")
 
     def _notification_callback(
@@ -116,12 +151,31 @@ class PostgresNotificationListener:
         Args:
             connection: The asyncpg connection
             pid: PostgreSQL backend process ID
-            channel: Channel name ('candle_updates', 'funding_updates', or 'oi_updates')
-            payload: JSON payload with starlisting_id/trading_pair_id and time
+            channel: Channel name ('candle_updates', 'funding_updates', 'oi_updates',
+                'starlisting_updates', or 'api_key_updates')
+            payload: JSON payload with starlisting_id/trading_pair_id and time, or
+                the key_hash of a revoked API key
         """
         try:
             # Parse notification payload
-            data = json.loads(payload)
+            data = orjson.loads(payload)
+
+            if channel == "starlisting_updates":
+                # Starlisting changes carry no time; evict the cached data right away
+                starlisting_id = data.get("starlisting_id")
+                if starlisting_id:
+                    clear_starlisting_cache(starlisting_id)
+                    logger.debug("starlisting_cache_evicted", starlisting_id=starlisting_id)
+                return
+
+            if channel == "api_key_updates":
+                # Stop accepting a revoked key on this worker's WebSocket connects
+                key_hash = data.get("key_hash")
+                if key_hash:
+                    invalidate_api_key_cache(key_hash)
+                    logger.debug("api_key_cache_evicted")
+                return
+
             time_str = data.get("time")
 
             if not time_str:
@@ -143,9 +197,10 @@ class PostgresNotificationListener:
                         payload=payload,
                     )
                     return
-                asyncio.create_task(
-                    self._handle_candle_notification(starlisting_id, time_str)
-                )
+                if self._claim_notification(channel, starlisting_id, time_str):
+                    asyncio.create_task(
+                        self._handle_candle_notification(starlisting_id, time_str)
+                    )
             elif channel == "funding_updates":
                 # Funding uses trading_pair_id (shared across intervals)
                 trading_pair_id = data.get("trading_pair_id")
@@ -156,9 +211,10 @@ class PostgresNotificationListener:
                         payload=payload,
                     )
                     return
-                asyncio.create_task(
-                    self._handle_funding_notification(trading_pair_id, time_str)
-                )
+                if self._claim_notification(channel, trading_pair_id, time_str):
+                    asyncio.create_task(
+                        self._handle_funding_notification(trading_pair_id, time_str)
+                    )
             elif channel == "oi_updates":
                 # OI uses trading_pair_id (shared across intervals)
                 trading_pair_id = data.get("trading_pair_id")
@@ -169,13 +225,14 @@ class PostgresNotificationListener:
                         payload=payload,
                     )
                     return
-                asyncio.create_task(
-                    self._handle_oi_notification(trading_pair_id, time_str)
-                )
+                if self._claim_notification(channel, trading_pair_id, time_str):
+                    asyncio.create_task(
+                        self._handle_oi_notification(trading_pair_id, time_str)
+                    )
             else:
                 logger.warning("unknown_notification_channel", channel=channel)
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(
                 "notification_json_parse_failed",
                 channel=channel,
@@ -189,6 +246,23 @@ class PostgresNotificationListener:
                 error=str(e),
             )
 
+    def _claim_notification(self, channel: str, record_id: int, time_str: str) -> bool:
+        """Mark a notification as pending unless an identical one already is.
+
+        Args:
+            channel: Notification channel
+            record_id: starlisting_id (candles) or trading_pair_id (funding/OI)
+            time_str: ISO timestamp of the record
+
+        Returns:
+            True if a handler should be scheduled, False if one is already pending
+        """
+        key = (channel, record_id, time_str)
+        if key in self._pending_notifications:
+            return False
+        self._pending_notifications.add(key)
+        return True
+
     async def _handle_candle_notification(self, starlisting_id: int, time_str: str) -> None:
         """Handle a candle notification by querying the database and broadcasting.
 
@@ -196,6 +270,9 @@ class PostgresNotificationListener:
             starlisting_id: The starlisting ID of the new candle
             time_str: ISO timestamp of the candle
         """
+        # From here on, repeats of this notification need a fresh query
+        self._pending_notifications.discard(("candle_updates", starlisting_id, time_str))
+
         try:
             # Check if anyone is subscribed to this starlisting
             subscriber_count = self.connection_manager.get_subscriber_count(starlisting_id)
@@ -244,6 +321,9 @@ class PostgresNotificationListener:
             trading_pair_id: The trading pair ID of the new funding rate
             time_str: ISO timestamp of the funding rate
         """
+        # From here on, repeats of this notification need a fresh query
+        self._pending_notifications.discard(("funding_updates", trading_pair_id, time_str))
+
         try:
             # Get all starlisting IDs for this trading pair
             starlisting_ids = await self._get_starlistings_for_trading_pair(trading_pair_id)
@@ -255,18 +335,25 @@ class PostgresNotificationListener:
                 )
                 return
 
+            # Only query for starlistings someone is subscribed to
+            subscribed_ids = [
+                starlisting_id
+                for starlisting_id in starlisting_ids
+                if self.connection_manager.get_subscriber_count(starlisting_id) > 0
+            ]
+
+            # Query database for full funding rate data + starlisting metadata,
+            # concurrently for all subscribed starlistings
+            results = await asyncio.gather(
+                *(
+                    self._query_funding_data(trading_pair_id, starlisting_id, time_str)
+                    for starlisting_id in subscribed_ids
+                )
+            )
+
             # Broadcast to each starlisting's subscribers
             total_sent = 0
-            for starlisting_id in starlisting_ids:
-                # Check if anyone is subscribed to this starlisting
-                subscriber_count = self.connection_manager.get_subscriber_count(starlisting_id)
-                if subscriber_count == 0:
-                    # No subscribers, skip query
-                    continue
-
-                # Query database for full funding rate data + starlisting metadata
-                funding_data = await self._query_funding_data(trading_pair_id, starlisting_id, time_str)
-
+            for starlisting_id, funding_data in zip(subscribed_ids, results, strict=True):
                 if not funding_data:
                     logger.warning(
                         "notification_funding_not_found",
@@ -308,6 +395,9 @@ class PostgresNotificationListener:
             trading_pair_id: The trading pair ID of the new OI record
             time_str: ISO timestamp of the OI record
         """
+        # From here on, repeats of this notification need a fresh query
+        self._pending_notifications.discard(("oi_updates", trading_pair_id, time_str))
+
         try:
             # Get all starlisting IDs for this trading pair
             starlisting_ids = await self._get_starlistings_for_trading_pair(trading_pair_id)
@@ -319,18 +409,25 @@ class PostgresNotificationListener:
                 )
                 return
 
+            # Only query for starlistings someone is subscribed to
+            subscribed_ids = [
+                starlisting_id
+                for starlisting_id in starlisting_ids
+                if self.connection_manager.get_subscriber_count(starlisting_id) > 0
+            ]
+
+            # Query database for full OI data + starlisting metadata,
+            # concurrently for all subscribed starlistings
+            results = await asyncio.gather(
+                *(
+                    self._query_oi_data(trading_pair_id, starlisting_id, time_str)
+                    for starlisting_id in subscribed_ids
+                )
+            )
+
             # Broadcast to each starlisting's subscribers
             total_sent = 0
-            for starlisting_id in starlisting_ids:
-                # Check if anyone is subscribed to this starlisting
-                subscriber_count = self.connection_manager.get_subscriber_count(starlisting_id)
-                if subscriber_count == 0:
-                    # No subscribers, skip query
-                    continue
-
-                # Query database for full OI data + starlisting metadata
-                oi_data = await self._query_oi_data(trading_pair_id, starlisting_id, time_str)
-
+            for starlisting_id, oi_data in zip(subscribed_ids, results, strict=True):
                 if not oi_data:
                     logger.warning(
                         "notification_oi_not_found",
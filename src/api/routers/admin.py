@@ -13,7 +13,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.dependencies import get_db_session
-from src.api.middleware.auth import get_current_admin_user, AuthenticatedUser
+from src.api.middleware.auth import (
+    get_current_admin_user,
+    invalidate_api_key_cache,
+    AuthenticatedUser,
+)
 from src.db.models import APIKey, User
 from src.schemas.auth import (
     APIKeyCreate,
@@ -291,3 +295,7 @@ async def revoke_api_key(
     # Deactivate the key (don't delete for audit trail)
     api_key.is_active = False
     await session.commit()
+
+    # Stop accepting the key on this worker's WebSocket connects right away; the
+    # api_key_updates notification evicts it on every other worker
+    invalidate_api_key_cache(api_key.key_hash)
@@ -3,10 +3,11 @@ API router for candle data endpoints.
 
 All endpoints require authentication via API key (X-API-Key header).
 """
+import functools
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from sqlalchemy import Select, bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.dependencies import get_db_session
@@ -18,6 +19,30 @@ from src.schemas.candles import CandleListResponse, CandleMetadata, CandleRespon
 router = APIRouter(prefix="/candles", tags=["candles"])
 
 
+@functools.cache
+def _starlisting_lookup_stmt() -> Select:
+    """Build the starlisting lookup by its path components, built once and reused.
+
+    The components are bound parameters, so every request executes the same
+    statement (and its cached compiled SQL) instead of rebuilding the joins.
+    """
+    return (
+        select(Starlisting.id, Starlisting.active)
+        .join(Exchange, Starlisting.exchange_id == Exchange.id)
+        .join(Coin, Starlisting.coin_id == Coin.id)
+        .join(QuoteCurrency, Starlisting.quote_currency_id == QuoteCurrency.id)
+        .join(MarketType, Starlisting.market_type_id == MarketType.id)
+        .join(Interval, Starlisting.interval_id == Interval.id)
+        .where(
+            Exchange.name == bindparam("exchange"),
+            Coin.symbol == bindparam("coin"),
+            QuoteCurrency.symbol == bindparam("quote"),
+            MarketType.name == bindparam("market_type"),
+            Interval.name == bindparam("interval"),
+        )
+    )
+
+
 @router.get(
     "/{exchange}/{coin}/{quote}/{market_type}/{interval}",
     response_model=CandleListResponse,
@@ -54,23 +79,16 @@ async def get_candles(
     """
     # Find starlisting by components - just get the ID and active status
     # Avoid loading relationships to prevent greenlet errors
-    stmt = (
-        select(Starlisting.id, Starlisting.active)
-        .join(Exchange, Starlisting.exchange_id == Exchange.id)
-        .join(Coin, Starlisting.coin_id == Coin.id)
-        .join(QuoteCurrency, Starlisting.quote_currency_id == QuoteCurrency.id)
-        .join(MarketType, Starlisting.market_type_id == MarketType.id)
-        .join(Interval, Starlisting.interval_id == Interval.id)
-        .where(
-            Exchange.name == exchange,
-            Coin.symbol == coin.upper(),
-            QuoteCurrency.symbol == quote.upper(),
-            MarketType.name == market_type,
-            Interval.name == interval,
-        )
+    result = await session.execute(
+        _starlisting_lookup_stmt(),
+        {
+            "exchange": exchange,
+            "coin": coin.upper(),
+            "quote": quote.upper(),
+            "market_type": market_type,
+            "interval": interval,
+        },
     )
-
-    result = await session.execute(stmt)
     row = result.one_or_none()
 
     if not row:
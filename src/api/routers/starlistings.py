@@ -1,18 +1,23 @@
 """
 API router for starlisting endpoints.
 
-All endpoints require authentication via API key (X-API-Key header).
+All endpoints require authentication via API key (X-API-Key header). Authentication
+is applied once at the router level so every route shares a single dependency.
 """
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.dependencies import get_db_session
-from src.api.middleware.auth import get_current_user, AuthenticatedUser
+from src.api.middleware.auth import get_current_user
 from src.config.loader import ConfigLoader
 from src.db.repositories import StarlistingRepository
 from src.schemas.starlistings import StarlistingListResponse, StarlistingResponse
 
-router = APIRouter(prefix="/starlistings", tags=["starlistings"])
+router = APIRouter(
+    prefix="/starlistings",
+    tags=["starlistings"],
+    dependencies=[Depends(get_current_user)],
+)
 
 
 @router.get(
@@ -24,7 +29,6 @@ router = APIRouter(prefix="/starlistings", tags=["starlistings"])
 async def list_starlistings(
     active_only: bool = True,
     session: AsyncSession = Depends(get_db_session),
-    current_user: AuthenticatedUser = Depends(get_current_user),
 ) -> StarlistingListResponse:
     """
     List all configured starlistings.
@@ -85,7 +89,6 @@ async def list_starlistings(
 async def get_starlisting(
     starlisting_id: int,
     session: AsyncSession = Depends(get_db_session),
-    current_user: AuthenticatedUser = Depends(get_current_user),
 ) -> StarlistingResponse:
     """
     Get a specific starlisting by ID.
@@ -7,18 +7,38 @@ request historical data on connection.
 Authentication is required via API key passed as query parameter: ws://host/ws?api_key=kb_xxx
 """
 
-import json
+import asyncio
+import functools
+import itertools
+import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
+from operator import attrgetter
 from typing import Any, Dict
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
 from pydantic import ValidationError
-from sqlalchemy import select
+from sqlalchemy import Select, Text, bindparam, cast, select, true
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 from structlog import get_logger
 
-from src.api.dependencies import get_db_session
-from src.api.middleware.auth import validate_api_key
-from src.api.websocket_manager import ConnectionManager
+from src.api.middleware.auth import validate_api_key_cached
+from src.api.starlisting_cache import (
+    STARLISTING_CACHE_TTL,
+    starlisting_active_cache,
+    starlisting_meta_cache,
+)
+from src.api.websocket_manager import (
+    MSGPACK_AVAILABLE,
+    MSGPACK_SUBPROTOCOL,
+    ConnectionManager,
+)
+from src.db.connection import (
+    get_readonly_session,
+    get_readonly_session_factory,
+    get_session_factory,
+)
 from src.db.models import (
     APIKey,
     Candle,
@@ -32,17 +52,8 @@ from src.db.models import (
     Starlisting,
     User,
 )
-from src.schemas.candles import CandleResponse
-from src.schemas.funding import FundingRateResponse, OpenInterestResponse
 from src.schemas.websocket import (
-    WebSocketErrorMessage,
-    WebSocketHistoricalDataMessage,
-    WebSocketHistoricalFundingMessage,
-    WebSocketHistoricalOIMessage,
-    WebSocketPingMessage,
-    WebSocketPongMessage,
     WebSocketSubscribeMessage,
-    WebSocketSuccessMessage,
     WebSocketUnsubscribeMessage,
 )
 
@@ -52,6 +63,31 @@ router = APIRouter(tags=["websocket"])
 # Global connection manager (initialized in main.py)
 connection_manager: ConnectionManager | None = None
 
+# Rows fetched per round-trip when streaming historical query results
+HISTORY_STREAM_BATCH_SIZE = 2000
+
+_by_starlisting_id = attrgetter("starlisting_id")
+
+# Pong reply shared by all pings within the same second (see _current_pong)
+_pong_second = -1
+_pong: tuple[str, Dict[str, Any]] = ("", {})
+
+# Bound parameters of the prebuilt starlisting and historical batch statements
+_STARLISTING_IDS_PARAM = bindparam("starlisting_ids", expanding=True)
+_LIMIT_PARAM = bindparam("limit")
+
+
+@functools.cache
+def _starlisting_status_stmt() -> Select:
+    """Build the starlisting active-flag lookup used by subscribe, built once and reused.
+
+    The IDs are an expanding bound parameter, so one statement (and its compiled
+    SQL) validates any number of starlistings in a single round-trip.
+    """
+    return select(Starlisting.id, Starlisting.active).where(
+        Starlisting.id.in_(_STARLISTING_IDS_PARAM)
+    )
+
 
 def set_connection_manager(manager: ConnectionManager) -> None:
     """Set the global connection manager.
@@ -110,25 +146,27 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         logger.warning("websocket_connection_rejected_no_api_key")
         return
 
-    # Validate API key
+    # Validate API key (a database check records last use, so this needs a
+    # writable session; recently validated keys skip the database entirely)
     user: User | None = None
     api_key_obj: APIKey | None = None
 
-    async for session in get_db_session():
-        try:
-            user, api_key_obj = await validate_api_key(session, api_key)
-        except Exception as e:
-            await websocket.close(
-                code=status.WS_1008_POLICY_VIOLATION,
-                reason=f"Authentication failed: {str(e)}",
-            )
-            logger.warning("websocket_connection_rejected_invalid_api_key", error=str(e))
-            return
-        finally:
-            await session.close()
+    try:
+        async with get_session_factory()() as auth_session:
+            user, api_key_obj = await validate_api_key_cached(auth_session, api_key)
+    except Exception as e:
+        await websocket.close(
+            code=status.WS_1008_POLICY_VIOLATION,
+            reason=f"Authentication failed: {str(e)}",
+        )
+        logger.warning("websocket_connection_rejected_invalid_api_key", error=str(e))
+        return
 
-    # Accept connection
-    accepted = await connection_manager.connect(websocket)
+    # Accept connection, switching to MessagePack frames if the client asks for them
+    subprotocol = None
+    if MSGPACK_AVAILABLE and MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", ()):
+        subprotocol = MSGPACK_SUBPROTOCOL
+    accepted = await connection_manager.connect(websocket, subprotocol=subprotocol)
     if not accepted:
         await websocket.close(
             code=status.WS_1008_POLICY_VIOLATION,
@@ -136,6 +174,11 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         )
         return
 
+    # One read-only session serves this connection's subscribe validation. It is
+    # closed after each use, which hands its pooled connection back without
+    # discarding the session, so idle WebSockets never pin a database connection.
+    session = await get_readonly_session()
+
     logger.info(
         "websocket_authenticated_connection",
         user_id=user.id,
@@ -146,15 +189,21 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     try:
         # Main message loop
         while True:
-            # Receive message from client
-            data = await websocket.receive_text()
+            # Receive message from client. Text and binary frames both carry JSON;
+            # orjson parses either as-is, so neither is decoded or re-encoded here.
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", status.WS_1000_NORMAL_CLOSURE))
+            data = frame.get("bytes")
+            if data is None:
+                data = frame["text"]
 
             try:
-                message = json.loads(data)
+                message = orjson.loads(data)
                 action = message.get("action")
 
                 if action == "subscribe":
-                    await handle_subscribe(websocket, message)
+                    await handle_subscribe(websocket, message, session)
                 elif action == "unsubscribe":
                     await handle_unsubscribe(websocket, message)
                 elif action == "ping":
@@ -166,7 +215,7 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
                         "unknown_action",
                     )
 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 await send_error(websocket, "Invalid JSON", "invalid_json")
             except ValidationError as e:
                 await send_error(
@@ -190,16 +239,21 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     except Exception as e:
         logger.error("websocket_connection_error", error=str(e))
     finally:
-        # Clean up connection
+        # Clean up connection, and its session in case a subscribe was cancelled
+        # mid-query
         await connection_manager.disconnect(websocket)
+        await session.close()
 
 
-async def handle_subscribe(websocket: WebSocket, message: Dict[str, Any]) -> None:
+async def handle_subscribe(
+    websocket: WebSocket, message: Dict[str, Any], session: AsyncSession
+) -> None:
     """Handle subscribe action.
 
     Args:
         websocket: The WebSocket connection
         message: The subscribe message dict
+        session: The connection's read-only database session (closed again after use)
     """
     # Validate message
     try:
@@ -212,25 +266,36 @@ async def handle_subscribe(websocket: WebSocket, message: Dict[str, Any]) -> Non
     valid_starlisting_ids = []
     invalid_starlisting_ids = []
 
-    async for session in get_db_session():
+    # Serve what we can from the cache, then look up the rest in a single query
+    now = time.monotonic()
+    active_by_id: Dict[int, bool] = {}
+    uncached_ids = []
+    for starlisting_id in set(subscribe_msg.starlisting_ids):
+        cached = starlisting_active_cache.get(starlisting_id)
+        if cached and cached[1] > now:
+            active_by_id[starlisting_id] = cached[0]
+        else:
+            uncached_ids.append(starlisting_id)
+
+    if uncached_ids:
         try:
-            for starlisting_id in subscribe_msg.starlisting_ids:
-                # Check if starlisting exists and is active
-                stmt = select(Starlisting.id, Starlisting.active).where(
-                    Starlisting.id == starlisting_id
-                )
-                result = await session.execute(stmt)
-                row = result.one_or_none()
-
-                if not row:
-                    invalid_starlisting_ids.append(starlisting_id)
-                elif not row[1]:  # not active
-                    invalid_starlisting_ids.append(starlisting_id)
-                else:
-                    valid_starlisting_ids.append(starlisting_id)
+            result = await session.execute(
+                _starlisting_status_stmt(), {"starlisting_ids": uncached_ids}
+            )
+            expires_at = now + STARLISTING_CACHE_TTL
+            for row in result.all():
+                active_by_id[row.id] = row.active
+                starlisting_active_cache[row.id] = (row.active, expires_at)
         finally:
             await session.close()
 
+    for starlisting_id in subscribe_msg.starlisting_ids:
+        # Missing or inactive starlistings are invalid
+        if active_by_id.get(starlisting_id):
+            valid_starlisting_ids.append(starlisting_id)
+        else:
+            invalid_starlisting_ids.append(starlisting_id)
+
     # Send error if any invalid starlistings
     if invalid_starlisting_ids:
         await send_error(
@@ -245,16 +310,21 @@ async def handle_subscribe(websocket: WebSocket, message: Dict[str, Any]) -> Non
     await connection_manager.subscribe(websocket, valid_starlisting_ids)
 
     # Send success confirmation
-    success_msg = WebSocketSuccessMessage(
-        type="success",
-        message=f"Subscribed to {len(valid_starlisting_ids)} starlisting(s)",
-        starlisting_ids=valid_starlisting_ids,
+    await send_success(
+        websocket,
+        f"Subscribed to {len(valid_starlisting_ids)} starlisting(s)",
+        valid_starlisting_ids,
     )
-    await connection_manager.send_to_client(websocket, success_msg.model_dump())
 
     # Send historical data if requested
     if subscribe_msg.history and subscribe_msg.history > 0:
-        await send_historical_data(websocket, valid_starlisting_ids, subscribe_msg.history)
+        await send_historical_data(
+            websocket,
+            valid_starlisting_ids,
+            subscribe_msg.history,
+            compress=subscribe_msg.compress,
+            chunk_size=subscribe_msg.chunk_size,
+        )
 
 
 async def handle_unsubscribe(websocket: WebSocket, message: Dict[str, Any]) -> None:
@@ -275,12 +345,33 @@ async def handle_unsubscribe(websocket: WebSocket, message: Dict[str, Any]) -> N
     await connection_manager.unsubscribe(websocket, unsubscribe_msg.starlisting_ids)
 
     # Send success confirmation
-    success_msg = WebSocketSuccessMessage(
-        type="success",
-        message=f"Unsubscribed from {len(unsubscribe_msg.starlisting_ids)} starlisting(s)",
-        starlisting_ids=unsubscribe_msg.starlisting_ids,
+    await send_success(
+        websocket,
+        f"Unsubscribed from {len(unsubscribe_msg.starlisting_ids)} starlisting(s)",
+        unsubscribe_msg.starlisting_ids,
     )
-    await connection_manager.send_to_client(websocket, success_msg.model_dump())
+
+
+def _current_pong() -> tuple[str, Dict[str, Any]]:
+    """Get the pong message for the current second.
+
+    The message (and its ISO timestamp) is rebuilt and serialized at most once per
+    second and shared by every ping answered within that second.
+
+    Returns:
+        The pong message as JSON, and as a dict (for MessagePack clients)
+    """
+    global _pong_second, _pong
+
+    second = int(time.time())
+    if second != _pong_second:
+        _pong_second = second
+        pong_message = {
+            "type": "pong",
+            "timestamp": datetime.fromtimestamp(second, timezone.utc).isoformat(),
+        }
+        _pong = (orjson.dumps(pong_message).decode(), pong_message)
+    return _pong
 
 
 async def handle_ping(websocket: WebSocket, message: Dict[str, Any]) -> None:
@@ -290,30 +381,70 @@ async def handle_ping(websocket: WebSocket, message: Dict[str, Any]) -> None:
         websocket: The WebSocket connection
         message: The ping message dict
     """
-    # Validate message
-    try:
-        WebSocketPingMessage(**message)
-    except ValidationError as e:
-        await send_error(websocket, str(e), "validation_error")
-        return
+    # A ping carries nothing beyond its action (already matched), so there is
+    # nothing to validate; reply with the pong for the current second
+    await connection_manager.send_serialized(websocket, *_current_pong())
+
+
+@functools.cache
+def _historical_candles_stmt() -> Select:
+    """Build the historical candles batch statement, built once and reused.
+
+    Each requested starlisting is LATERAL-joined to its last N candles, so Postgres
+    reads exactly N rows per starlisting off the (starlisting_id, time) index instead
+    of numbering its whole history with a window function. The starlisting IDs and
+    limit are bound parameters, so the statement and its compiled SQL are shared by
+    all calls to fetch_historical_candles_batch. Numeric columns are projected as
+    text: the values are only ever sent as strings, so Postgres renders them directly
+    instead of the driver building Decimals. Starlisting metadata is not joined in;
+    it comes from _starlisting_meta_stmt.
+    """
+    # Last N candles of one starlisting, newest first
+    recent = (
+        select(
+            Candle.time,
+            Candle.open,
+            Candle.high,
+            Candle.low,
+            Candle.close,
+            Candle.volume,
+            Candle.num_trades,
+        )
+        .where(Candle.starlisting_id == Starlisting.id)
+        .order_by(Candle.time.desc())
+        .limit(_LIMIT_PARAM)
+        .lateral()
+    )
 
-    # Send pong response
-    pong_msg = WebSocketPongMessage(
-        type="pong",
-        timestamp=datetime.now(timezone.utc).isoformat(),
+    stmt = (
+        select(
+            recent.c.time,
+            cast(recent.c.open, Text).label("open"),
+            cast(recent.c.high, Text).label("high"),
+            cast(recent.c.low, Text).label("low"),
+            cast(recent.c.close, Text).label("close"),
+            cast(recent.c.volume, Text).label("volume"),
+            recent.c.num_trades,
+            Starlisting.id.label("starlisting_id"),
+        )
+        .select_from(Starlisting)
+        .join(recent, true())
+        .where(Starlisting.id.in_(_STARLISTING_IDS_PARAM))
+        .order_by(Starlisting.id, recent.c.time)
     )
-    await connection_manager.send_to_client(websocket, pong_msg.model_dump())
+
+    return stmt.execution_options(yield_per=HISTORY_STREAM_BATCH_SIZE)
 
 
 async def fetch_historical_candles_batch(
     session,
     starlisting_ids: list[int],
     limit: int,
-) -> list:
+) -> AsyncResult:
     """Fetch historical candles for multiple starlistings in a single batch query.
 
-    Uses window function to get last N candles per starlisting, then joins with
-    metadata tables. More efficient than N separate queries.
+    Fetches the last N candles of every starlisting in one query. More efficient
+    than N separate queries.
 
     Args:
         session: Database session
@@ -321,70 +452,70 @@ async def fetch_historical_candles_batch(
         limit: Number of candles per starlisting
 
     Returns:
-        List of rows with candle data and metadata
+        Streaming result of rows with candle data, ordered by starlisting_id and time
     """
-    from sqlalchemy import func
-    from sqlalchemy.sql import label
+    return await session.stream(
+        _historical_candles_stmt(),
+        {"starlisting_ids": starlisting_ids, "limit": limit},
+    )
+
 
-    # Subquery: Use row_number() to get last N candles per starlisting
-    subq = (
+@functools.cache
+def _historical_funding_stmt() -> Select:
+    """Build the historical funding rates batch statement, built once and reused.
+
+    Each requested starlisting is LATERAL-joined to the last N funding rates of its
+    trading pair. The starlisting IDs and limit are bound parameters, so the
+    statement and its compiled SQL are shared by all calls to
+    fetch_historical_funding_batch. Numeric columns are projected as text and
+    metadata is left out (see _historical_candles_stmt).
+    """
+    # Last N funding rates of one starlisting's trading pair, newest first
+    recent = (
         select(
-            Candle.starlisting_id,
-            Candle.time,
-            Candle.open,
-            Candle.high,
-            Candle.low,
-            Candle.close,
-            Candle.volume,
-            Candle.num_trades,
-            func.row_number()
-            .over(
-                partition_by=Candle.starlisting_id,
-                order_by=Candle.time.desc()
-            )
-            .label("row_num"),
+            FundingRate.time,
+            FundingRate.funding_rate,
+            FundingRate.premium,
+            FundingRate.mark_price,
+            FundingRate.index_price,
+            FundingRate.oracle_price,
+            FundingRate.mid_price,
+            FundingRate.next_funding_time,
         )
-        .where(Candle.starlisting_id.in_(starlisting_ids))
-        .subquery()
+        .where(FundingRate.trading_pair_id == Starlisting.trading_pair_id)
+        .order_by(FundingRate.time.desc())
+        .limit(_LIMIT_PARAM)
+        .lateral()
     )
 
-    # Main query: Join with metadata tables
+    # This will return one set of rows per starlisting (even if multiple
+    # starlistings share the same trading pair)
     stmt = (
         select(
-            subq.c.time,
-            subq.c.open,
-            subq.c.high,
-            subq.c.low,
-            subq.c.close,
-            subq.c.volume,
-            subq.c.num_trades,
-            subq.c.starlisting_id,
-            Exchange.name.label("exchange"),
-            Coin.symbol.label("coin"),
-            QuoteCurrency.symbol.label("quote"),
-            MarketType.name.label("market_type"),
-            Interval.name.label("interval"),
+            recent.c.time,
+            cast(recent.c.funding_rate, Text).label("funding_rate"),
+            cast(recent.c.premium, Text).label("premium"),
+            cast(recent.c.mark_price, Text).label("mark_price"),
+            cast(recent.c.index_price, Text).label("index_price"),
+            cast(recent.c.oracle_price, Text).label("oracle_price"),
+            cast(recent.c.mid_price, Text).label("mid_price"),
+            recent.c.next_funding_time,
+            Starlisting.id.label("starlisting_id"),
         )
-        .select_from(subq)
-        .join(Starlisting, subq.c.starlisting_id == Starlisting.id)
-        .join(Exchange, Starlisting.exchange_id == Exchange.id)
-        .join(Coin, Starlisting.coin_id == Coin.id)
-        .join(QuoteCurrency, Starlisting.quote_currency_id == QuoteCurrency.id)
-        .join(MarketType, Starlisting.market_type_id == MarketType.id)
-        .join(Interval, Starlisting.interval_id == Interval.id)
-        .where(subq.c.row_num <= limit)
-        .order_by(subq.c.starlisting_id, subq.c.time)
+        .select_from(Starlisting)
+        .join(recent, true())
+        .where(Starlisting.id.in_(_STARLISTING_IDS_PARAM))
+        .order_by(Starlisting.id, recent.c.time)
     )
 
-    result = await session.execute(stmt)
-    return result.all()
+    return stmt.execution_options(yield_per=HISTORY_STREAM_BATCH_SIZE)
 
 
 async def fetch_historical_funding_batch(
     session,
     starlisting_ids: list[int],
     limit: int,
-) -> list:
+) -> AsyncResult:
     """Fetch historical funding rates for multiple starlistings in a single batch query.
 
     Since funding rates are stored per trading_pair_id (not per starlisting_id),
@@ -399,72 +530,65 @@ async def fetch_historical_funding_batch(
         limit: Number of funding rate snapshots per trading pair
 
     Returns:
-        List of rows with funding rate data and metadata (one row per starlisting)
+        Streaming result of rows with funding rate data (one set of rows per
+        starlisting), ordered by starlisting_id and time
     """
-    from sqlalchemy import func
+    return await session.stream(
+        _historical_funding_stmt(),
+        {"starlisting_ids": starlisting_ids, "limit": limit},
+    )
+
 
-    # Subquery: Use row_number() to get last N funding rates per trading pair
-    subq = (
+@functools.cache
+def _historical_oi_stmt() -> Select:
+    """Build the historical open interest batch statement, built once and reused.
+
+    Each requested starlisting is LATERAL-joined to the last N OI snapshots of its
+    trading pair. The starlisting IDs and limit are bound parameters, so the
+    statement and its compiled SQL are shared by all calls to
+    fetch_historical_oi_batch. Numeric columns are projected as text and metadata
+    is left out (see _historical_candles_stmt).
+    """
+    # Last N OI snapshots of one starlisting's trading pair, newest first
+    recent = (
         select(
-            FundingRate.trading_pair_id,
-            FundingRate.time,
-            FundingRate.funding_rate,
-            FundingRate.premium,
-            FundingRate.mark_price,
-            FundingRate.index_price,
-            FundingRate.oracle_price,
-            FundingRate.mid_price,
-            FundingRate.next_funding_time,
-            func.row_number()
-            .over(
-                partition_by=FundingRate.trading_pair_id,
-                order_by=FundingRate.time.desc()
-            )
-            .label("row_num"),
+            OpenInterest.time,
+            OpenInterest.open_interest,
+            OpenInterest.notional_value,
+            OpenInterest.day_base_volume,
+            OpenInterest.day_notional_volume,
         )
-        .join(Starlisting, FundingRate.trading_pair_id == Starlisting.trading_pair_id)
-        .where(Starlisting.id.in_(starlisting_ids))
-        .subquery()
+        .where(OpenInterest.trading_pair_id == Starlisting.trading_pair_id)
+        .order_by(OpenInterest.time.desc())
+        .limit(_LIMIT_PARAM)
+        .lateral()
     )
 
-    # Main query: Join with metadata tables
-    # This will return one row per starlisting (even if multiple starlistings share the same trading pair)
+    # This will return one set of rows per starlisting (even if multiple
+    # starlistings share the same trading pair)
     stmt = (
         select(
-            subq.c.time,
-            subq.c.funding_rate,
-            subq.c.premium,
-            subq.c.mark_price,
-            subq.c.index_price,
-            subq.c.oracle_price,
-            subq.c.mid_price,
-            subq.c.next_funding_time,
+            recent.c.time,
+            cast(recent.c.open_interest, Text).label("open_interest"),
+            cast(recent.c.notional_value, Text).label("notional_value"),
+            cast(recent.c.day_base_volume, Text).label("day_base_volume"),
+            cast(recent.c.day_notional_volume, Text).label("day_notional_volume"),
             Starlisting.id.label("starlisting_id"),
-            Exchange.name.label("exchange"),
-            Coin.symbol.label("coin"),
-            QuoteCurrency.symbol.label("quote"),
-            MarketType.name.label("market_type"),
         )
-        .select_from(subq)
-        .join(Starlisting, subq.c.trading_pair_id == Starlisting.trading_pair_id)
-        .join(Exchange, Starlisting.exchange_id == Exchange.id)
-        .join(Coin, Starlisting.coin_id == Coin.id)
-        .join(QuoteCurrency, Starlisting.quote_currency_id == QuoteCurrency.id)
-        .join(MarketType, Starlisting.market_type_id == MarketType.id)
-        .where(subq.c.row_num <= limit)
-        .where(Starlisting.id.in_(starlisting_ids))
-        .order_by(Starlisting.id, subq.c.time)
+        .select_from(Starlisting)
+        .join(recent, true())
+        .where(Starlisting.id.in_(_STARLISTING_IDS_PARAM))
+        .order_by(Starlisting.id, recent.c.time)
     )
 
-    result = await session.execute(stmt)
-    return result.all()
+    return stmt.execution_options(yield_per=HISTORY_STREAM_BATCH_SIZE)
 
 
 async def fetch_historical_oi_batch(
     session,
     starlisting_ids: list[int],
     limit: int,
-) -> list:
+) -> AsyncResult:
     """Fetch historical open interest for multiple starlistings in a single batch query.
 
     Since open interest is stored per trading_pair_id (not per starlisting_id),
@@ -479,251 +603,434 @@ async def fetch_historical_oi_batch(
         limit: Number of OI snapshots per trading pair
 
     Returns:
-        List of rows with OI data and metadata (one row per starlisting)
+        Streaming result of rows with OI data (one set of rows per starlisting),
+        ordered by starlisting_id and time
     """
-    from sqlalchemy import func
-
-    # Subquery: Use row_number() to get last N OI snapshots per trading pair
-    subq = (
-        select(
-            OpenInterest.trading_pair_id,
-            OpenInterest.time,
-            OpenInterest.open_interest,
-            OpenInterest.notional_value,
-            OpenInterest.day_base_volume,
-            OpenInterest.day_notional_volume,
-            func.row_number()
-            .over(
-                partition_by=OpenInterest.trading_pair_id,
-                order_by=OpenInterest.time.desc()
-            )
-            .label("row_num"),
-        )
-        .join(Starlisting, OpenInterest.trading_pair_id == Starlisting.trading_pair_id)
-        .where(Starlisting.id.in_(starlisting_ids))
-        .subquery()
+    return await session.stream(
+        _historical_oi_stmt(),
+        {"starlisting_ids": starlisting_ids, "limit": limit},
     )
 
-    # Main query: Join with metadata tables
-    # This will return one row per starlisting (even if multiple starlistings share the same trading pair)
-    stmt = (
+
+@functools.cache
+def _starlisting_meta_stmt() -> Select:
+    """Build the starlisting metadata lookup, built once and reused.
+
+    Resolves the exchange, coin, quote, market type and interval names that every
+    historical message carries, for any number of starlistings in one query.
+    """
+    return (
         select(
-            subq.c.time,
-            subq.c.open_interest,
-            subq.c.notional_value,
-            subq.c.day_base_volume,
-            subq.c.day_notional_volume,
-            Starlisting.id.label("starlisting_id"),
+            Starlisting.id,
             Exchange.name.label("exchange"),
             Coin.symbol.label("coin"),
             QuoteCurrency.symbol.label("quote"),
             MarketType.name.label("market_type"),
+            Interval.name.label("interval"),
         )
-        .select_from(subq)
-        .join(Starlisting, subq.c.trading_pair_id == Starlisting.trading_pair_id)
         .join(Exchange, Starlisting.exchange_id == Exchange.id)
         .join(Coin, Starlisting.coin_id == Coin.id)
         .join(QuoteCurrency, Starlisting.quote_currency_id == QuoteCurrency.id)
         .join(MarketType, Starlisting.market_type_id == MarketType.id)
-        .where(subq.c.row_num <= limit)
-        .where(Starlisting.id.in_(starlisting_ids))
-        .order_by(Starlisting.id, subq.c.time)
+        .join(Interval, Starlisting.interval_id == Interval.id)
+        .where(Starlisting.id.in_(_STARLISTING_IDS_PARAM))
     )
 
-    result = await session.execute(stmt)
-    return result.all()
+
+async def _get_starlisting_meta(
+    starlisting_ids: list[int],
+) -> Dict[int, tuple[Dict[str, Any], str]]:
+    """Get the message metadata of starlistings, querying only those not yet cached.
+
+    Args:
+        starlisting_ids: List of starlisting IDs
+
+    Returns:
+        Mapping of starlisting_id -> (exchange/coin/quote/trading_pair/market_type
+        header fields in message order, interval name)
+    """
+    uncached_ids = [
+        starlisting_id
+        for starlisting_id in starlisting_ids
+        if starlisting_id not in starlisting_meta_cache
+    ]
+
+    if uncached_ids:
+        async with get_readonly_session_factory()() as session:
+            result = await session.execute(
+                _starlisting_meta_stmt(), {"starlisting_ids": uncached_ids}
+            )
+            for row in result.all():
+                header = {
+                    "exchange": row.exchange,
+                    "coin": row.coin,
+                    "quote": row.quote,
+                    "trading_pair": f"{row.coin}/{row.quote}",
+                    "market_type": row.market_type,
+                }
+                starlisting_meta_cache[row.id] = (header, row.interval)
+
+    return {
+        starlisting_id: starlisting_meta_cache[starlisting_id]
+        for starlisting_id in starlisting_ids
+        if starlisting_id in starlisting_meta_cache
+    }
+
+
+# Row converters unpack rows positionally, in the column order of the statements above
+# (starlisting_id last), which is cheaper than looking each column up by name.
+
+
+def _candle_row_to_dict(row: Any) -> Dict[str, Any]:
+    """Convert a historical candle row to its JSON-ready message form."""
+    time_, open_, high, low, close, volume, num_trades, _ = row
+    return {
+        "time": time_.isoformat(),
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": volume,
+        "num_trades": num_trades,
+    }
+
+
+def _funding_row_to_dict(row: Any) -> Dict[str, Any]:
+    """Convert a historical funding rate row to its JSON-ready message form."""
+    (
+        time_,
+        funding_rate,
+        premium,
+        mark_price,
+        index_price,
+        oracle_price,
+        mid_price,
+        next_funding_time,
+        _,
+    ) = row
+    return {
+        "time": time_.isoformat(),
+        "funding_rate": funding_rate,
+        "premium": premium,
+        "mark_price": mark_price,
+        "index_price": index_price,
+        "oracle_price": oracle_price,
+        "mid_price": mid_price,
+        "next_funding_time": next_funding_time.isoformat() if next_funding_time else None,
+    }
+
+
+def _oi_row_to_dict(row: Any) -> Dict[str, Any]:
+    """Convert a historical open interest row to its JSON-ready message form."""
+    time_, open_interest, notional_value, day_base_volume, day_notional_volume, _ = row
+    return {
+        "time": time_.isoformat(),
+        "open_interest": open_interest,
+        "notional_value": notional_value,
+        "day_base_volume": day_base_volume,
+        "day_notional_volume": day_notional_volume,
+    }
+
+
+async def _stream_with_session(
+    fetch: Callable[[AsyncSession, list[int], int], Awaitable[AsyncResult]],
+    starlisting_ids: list[int],
+    limit: int,
+    row_to_dict: Callable[[Any], Dict[str, Any]],
+) -> Dict[int, list[Dict[str, Any]]]:
+    """Run a historical batch query on a dedicated read-only session and group its rows.
+
+    Rows are streamed from a server-side cursor and converted to their message form
+    one partition at a time, so the full row set is never materialized. Since the
+    queries order rows by starlisting_id, each partition is grouped in runs rather
+    than row by row.
+
+    Args:
+        fetch: One of the fetch_historical_*_batch functions
+        starlisting_ids: List of starlisting IDs to fetch
+        limit: Number of records per starlisting
+        row_to_dict: Converts a row to its JSON-ready message form
+
+    Returns:
+        Mapping of starlisting_id -> converted records
+    """
+    grouped: Dict[int, list[Dict[str, Any]]] = {}
+
+    async with get_readonly_session_factory()() as session:
+        result = await fetch(session, starlisting_ids, limit)
+        async for partition in result.partitions():
+            # Rows are ordered by starlisting_id, so each partition is a few long runs
+            for starlisting_id, run in itertools.groupby(partition, key=_by_starlisting_id):
+                records = grouped.get(starlisting_id)
+                if records is None:
+                    records = grouped[starlisting_id] = []
+                records.extend(map(row_to_dict, run))
+
+    return grouped
+
+
+async def _stream_chunks_with_session(
+    websocket: WebSocket,
+    fetch: Callable[[AsyncSession, list[int], int], Awaitable[AsyncResult]],
+    starlisting_ids: list[int],
+    limit: int,
+    row_to_dict: Callable[[Any], Dict[str, Any]],
+    message_type: str,
+    meta_by_id: Dict[int, tuple[Dict[str, Any], str]],
+    chunk_size: int,
+    compress: bool = False,
+) -> None:
+    """Run a historical batch query and send its rows in chunks as they are streamed.
+
+    Unlike _stream_with_session, records are never collected per starlisting: each
+    chunk of up to chunk_size records is sent as soon as it is full, so the database
+    and network I/O overlap. Sending a chunk waits while the client's queue is half
+    full (see ConnectionManager.send_history_chunk), so the stream is paced by the
+    client and the chunks held in memory stay bounded. Chunks of a starlisting are
+    numbered from 0 by seq, and the last one is marked final.
+
+    Args:
+        websocket: The WebSocket connection
+        fetch: One of the fetch_historical_*_batch functions
+        starlisting_ids: List of starlisting IDs to fetch
+        limit: Number of records per starlisting
+        row_to_dict: Converts a row to its JSON-ready message form
+        message_type: Type of the historical messages sent
+        meta_by_id: Starlisting metadata, as returned by _get_starlisting_meta
+        chunk_size: Maximum number of records per message
+        compress: Whether the client accepts compressed binary frames
+    """
+    include_interval = message_type == "historical"
+    current_id: int | None = None
+    seq = 0
+    chunk: list[Dict[str, Any]] = []
+
+    async def send_chunk(final: bool) -> bool:
+        header, interval = meta_by_id[current_id]
+        message = {"type": message_type, "starlisting_id": current_id, **header}
+        if include_interval:
+            message["interval"] = interval
+        message.update(count=len(chunk), seq=seq, final=final, data=chunk)
+        return await connection_manager.send_history_chunk(websocket, message, compress)
+
+    async with get_readonly_session_factory()() as session:
+        result = await fetch(session, starlisting_ids, limit)
+        async for partition in result.partitions():
+            for starlisting_id, run in itertools.groupby(partition, key=_by_starlisting_id):
+                if starlisting_id != current_id:
+                    if chunk and not await send_chunk(final=True):
+                        return
+                    current_id, seq, chunk = starlisting_id, 0, []
+                if current_id not in meta_by_id:
+                    continue
+                for row in run:
+                    # Only send a full chunk once another record follows it, so
+                    # the last chunk of a starlisting can always be marked final
+                    if len(chunk) == chunk_size:
+                        if not await send_chunk(final=False):
+                            return
+                        seq, chunk = seq + 1, []
+                    chunk.append(row_to_dict(row))
+
+    if chunk:
+        await send_chunk(final=True)
+
+
+async def send_success(
+    websocket: WebSocket, message: str, starlisting_ids: list[int]
+) -> None:
+    """Send a success message to the client.
+
+    The message follows WebSocketSuccessMessage, built directly as a dict: its
+    fields are already known to be valid, so there is nothing for a model to check.
+
+    Args:
+        websocket: The WebSocket connection
+        message: Success message
+        starlisting_ids: Starlisting IDs the action applied to
+    """
+    await connection_manager.send_to_client(
+        websocket,
+        {"type": "success", "message": message, "starlisting_ids": starlisting_ids},
+    )
 
 
 async def send_error(websocket: WebSocket, message: str, code: str) -> None:
     """Send an error message to the client.
 
+    The message follows WebSocketErrorMessage, built directly as a dict.
+
     Args:
         websocket: The WebSocket connection
         message: Error message
         code: Error code
     """
-    error_msg = WebSocketErrorMessage(
-        type="error",
-        message=message,
-        code=code,
+    await connection_manager.send_to_client(
+        websocket,
+        {"type": "error", "message": message, "code": code},
     )
-    await connection_manager.send_to_client(websocket, error_msg.model_dump())
 
 
 async def send_historical_data(
-    websocket: WebSocket, starlisting_ids: list[int], limit: int
+    websocket: WebSocket,
+    starlisting_ids: list[int],
+    limit: int,
+    compress: bool = False,
+    chunk_size: int | None = None,
 ) -> None:
     """Query and send historical data (candles, funding, OI) for subscribed starlistings.
 
     Uses batch queries for performance - fetches all starlistings in 3 queries total
-    (one per data type) instead of N*3 queries.
+    (one per data type) instead of N*3 queries, run concurrently so the round-trips
+    overlap. Starlisting metadata comes from a process-wide cache rather than being
+    joined into each query. The candle, funding and OI messages for each starlisting
+    are delivered together in a single batch frame. Rows are streamed and converted
+    to plain dicts (matching the shape of the WebSocketHistorical*Message schemas)
+    partition by partition rather than materialized and wrapped in per-row Pydantic
+    models.
+
+    With chunk_size, each data type is instead sent in messages of up to chunk_size
+    records as its rows are streamed (see _stream_chunks_with_session).
 
     Args:
         websocket: The WebSocket connection
         starlisting_ids: List of starlisting IDs to fetch history for
         limit: Number of historical records to fetch per starlisting
+        compress: Whether the client accepts compressed binary frames
+        chunk_size: Optional maximum number of records per historical message
     """
-    from collections import defaultdict
-
-    async for session in get_db_session():
-        try:
-            # Batch query 1: Fetch candles for all starlistings
-            candle_rows = await fetch_historical_candles_batch(session, starlisting_ids, limit)
-
-            # Batch query 2: Fetch funding rates for all starlistings
-            funding_rows = await fetch_historical_funding_batch(session, starlisting_ids, limit)
-
-            # Batch query 3: Fetch open interest for all starlistings
-            oi_rows = await fetch_historical_oi_batch(session, starlisting_ids, limit)
-
-            # Group rows by starlisting_id
-            candles_by_id = defaultdict(list)
-            for row in candle_rows:
-                candles_by_id[row.starlisting_id].append(row)
-
-            funding_by_id = defaultdict(list)
-            for row in funding_rows:
-                funding_by_id[row.starlisting_id].append(row)
-
-            oi_by_id = defaultdict(list)
-            for row in oi_rows:
-                oi_by_id[row.starlisting_id].append(row)
-
-            # Send historical data for each starlisting
-            for starlisting_id in starlisting_ids:
-                # Send candle history if available
-                if starlisting_id in candles_by_id:
-                    rows = candles_by_id[starlisting_id]
-                    candles = [
-                        CandleResponse(
-                            time=row.time,
-                            open=row.open,
-                            high=row.high,
-                            low=row.low,
-                            close=row.close,
-                            volume=row.volume,
-                            num_trades=row.num_trades,
-                        )
-                        for row in rows
-                    ]
-
-                    first_row = rows[0]
-                    trading_pair = f"{first_row.coin}/{first_row.quote}"
-
-                    candle_msg = WebSocketHistoricalDataMessage(
-                        type="historical",
-                        starlisting_id=starlisting_id,
-                        exchange=first_row.exchange,
-                        coin=first_row.coin,
-                        quote=first_row.quote,
-                        trading_pair=trading_pair,
-                        market_type=first_row.market_type,
-                        interval=first_row.interval,
-                        count=len(candles),
-                        data=candles,
-                    )
+    try:
+        if chunk_size:
+            meta_by_id = await _get_starlisting_meta(starlisting_ids)
+            await asyncio.gather(
+                _stream_chunks_with_session(
+                    websocket,
+                    fetch_historical_candles_batch,
+                    starlisting_ids,
+                    limit,
+                    _candle_row_to_dict,
+                    "historical",
+                    meta_by_id,
+                    chunk_size,
+                    compress,
+                ),
+                _stream_chunks_with_session(
+                    websocket,
+                    fetch_historical_funding_batch,
+                    starlisting_ids,
+                    limit,
+                    _funding_row_to_dict,
+                    "historical_funding",
+                    meta_by_id,
+                    chunk_size,
+                    compress,
+                ),
+                _stream_chunks_with_session(
+                    websocket,
+                    fetch_historical_oi_batch,
+                    starlisting_ids,
+                    limit,
+                    _oi_row_to_dict,
+                    "historical_oi",
+                    meta_by_id,
+                    chunk_size,
+                    compress,
+                ),
+            )
+            return
 
-                    await connection_manager.send_to_client(
-                        websocket, candle_msg.model_dump(mode="json")
-                    )
+        # Run the three batch queries (and any metadata lookup) concurrently, each on
+        # its own session (an AsyncSession cannot run statements concurrently)
+        meta_by_id, candles_by_id, funding_by_id, oi_by_id = await asyncio.gather(
+            _get_starlisting_meta(starlisting_ids),
+            _stream_with_session(
+                fetch_historical_candles_batch, starlisting_ids, limit, _candle_row_to_dict
+            ),
+            _stream_with_session(
+                fetch_historical_funding_batch, starlisting_ids, limit, _funding_row_to_dict
+            ),
+            _stream_with_session(
+                fetch_historical_oi_batch, starlisting_ids, limit, _oi_row_to_dict
+            ),
+        )
 
-                    logger.debug(
-                        "sent_historical_candles",
-                        starlisting_id=starlisting_id,
-                        count=len(candles),
-                    )
+        # Send historical data for each starlisting
+        for starlisting_id in starlisting_ids:
+            if starlisting_id not in meta_by_id:
+                continue
+            header, interval = meta_by_id[starlisting_id]
+
+            # Messages for this starlisting, sent together in one frame
+            batch: list[Dict[str, Any]] = []
+
+            # Send candle history if available
+            if starlisting_id in candles_by_id:
+                candles = candles_by_id[starlisting_id]
+                batch.append(
+                    {
+                        "type": "historical",
+                        "starlisting_id": starlisting_id,
+                        **header,
+                        "interval": interval,
+                        "count": len(candles),
+                        "data": candles,
+                    }
+                )
 
-                # Send funding rate history if available
-                if starlisting_id in funding_by_id:
-                    rows = funding_by_id[starlisting_id]
-                    funding_rates = [
-                        FundingRateResponse(
-                            time=row.time,
-                            funding_rate=row.funding_rate,
-                            premium=row.premium,
-                            mark_price=row.mark_price,
-                            index_price=row.index_price,
-                            oracle_price=row.oracle_price,
-                            mid_price=row.mid_price,
-                            next_funding_time=row.next_funding_time,
-                        )
-                        for row in rows
-                    ]
-
-                    first_row = rows[0]
-                    trading_pair = f"{first_row.coin}/{first_row.quote}"
-
-                    funding_msg = WebSocketHistoricalFundingMessage(
-                        type="historical_funding",
-                        starlisting_id=starlisting_id,
-                        exchange=first_row.exchange,
-                        coin=first_row.coin,
-                        quote=first_row.quote,
-                        trading_pair=trading_pair,
-                        market_type=first_row.market_type,
-                        count=len(funding_rates),
-                        data=funding_rates,
-                    )
+                logger.debug(
+                    "batched_historical_candles",
+                    starlisting_id=starlisting_id,
+                    count=len(candles),
+                )
 
-                    await connection_manager.send_to_client(
-                        websocket, funding_msg.model_dump(mode="json")
-                    )
+            # Send funding rate history if available
+            if starlisting_id in funding_by_id:
+                funding_rates = funding_by_id[starlisting_id]
+                batch.append(
+                    {
+                        "type": "historical_funding",
+                        "starlisting_id": starlisting_id,
+                        **header,
+                        "count": len(funding_rates),
+                        "data": funding_rates,
+                    }
+                )
 
-                    logger.debug(
-                        "sent_historical_funding",
-                        starlisting_id=starlisting_id,
-                        count=len(funding_rates),
-                    )
+                logger.debug(
+                    "batched_historical_funding",
+                    starlisting_id=starlisting_id,
+                    count=len(funding_rates),
+                )
 
-                # Send open interest history if available
-                if starlisting_id in oi_by_id:
-                    rows = oi_by_id[starlisting_id]
-                    oi_snapshots = [
-                        OpenInterestResponse(
-                            time=row.time,
-                            open_interest=row.open_interest,
-                            notional_value=row.notional_value,
-                            day_base_volume=row.day_base_volume,
-                            day_notional_volume=row.day_notional_volume,
-                        )
-                        for row in rows
-                    ]
-
-                    first_row = rows[0]
-                    trading_pair = f"{first_row.coin}/{first_row.quote}"
-
-                    oi_msg = WebSocketHistoricalOIMessage(
-                        type="historical_oi",
-                        starlisting_id=starlisting_id,
-                        exchange=first_row.exchange,
-                        coin=first_row.coin,
-                        quote=first_row.quote,
-                        trading_pair=trading_pair,
-                        market_type=first_row.market_type,
-                        count=len(oi_snapshots),
-                        data=oi_snapshots,
-                    )
+            # Send open interest history if available
+            if starlisting_id in oi_by_id:
+                oi_snapshots = oi_by_id[starlisting_id]
+                batch.append(
+                    {
+                        "type": "historical_oi",
+                        "starlisting_id": starlisting_id,
+                        **header,
+                        "count": len(oi_snapshots),
+                        "data": oi_snapshots,
+                    }
+                )
 
-                    await connection_manager.send_to_client(
-                        websocket, oi_msg.model_dump(mode="json")
-                    )
+                logger.debug(
+                    "batched_historical_oi",
+                    starlisting_id=starlisting_id,
+                    count=len(oi_snapshots),
+                )
 
-                    logger.debug(
-                        "sent_historical_oi",
-                        starlisting_id=starlisting_id,
-                        count=len(oi_snapshots),
-                    )
+            await connection_manager.send_batch(websocket, batch, compress=compress)
 
-        except Exception as e:
-            logger.error(
-                "send_historical_data_error",
-                starlisting_ids=starlisting_ids,
-                error=str(e),
-            )
-            await send_error(
-                websocket,
-                "Failed to fetch historical data",
-                "historical_data_error",
-            )
-        finally:
-            await session.close()
+    except Exception as e:
+        logger.error(
+            "send_historical_data_error",
+            starlisting_ids=starlisting_ids,
+            error=str(e),
+        )
+        await send_error(
+            websocket,
+            "Failed to fetch historical data",
+            "historical_data_error",
+        )
@@ -0,0 +1,34 @@
+"""Process-wide caches of starlisting data used by the WebSocket API.
+
+The WebSocket router fills them; the PostgreSQL notification listener evicts a
+starlisting's entries when it is notified that the starlisting changed.
+"""
+
+from typing import Any, Dict
+
+# Active flag of recently validated starlistings: starlisting_id -> (active, expires_at).
+# Starlistings change rarely, so subscribes within the TTL skip the database. Only
+# starlistings that exist are cached, so bogus IDs cannot grow the cache. Entries of a
+# changed starlisting are evicted as soon as the listener is notified of the change;
+# the TTL only bounds staleness should a notification be missed.
+STARLISTING_CACHE_TTL = 300.0
+starlisting_active_cache: Dict[int, tuple[bool, float]] = {}
+
+# Message metadata of starlistings: starlisting_id -> (header fields, interval name).
+# Exchange/coin/quote/market type/interval never change for a starlisting, so the
+# joins that resolve them run once per starlisting rather than on every history fetch.
+starlisting_meta_cache: Dict[int, tuple[Dict[str, Any], str]] = {}
+
+
+def clear_starlisting_cache(starlisting_id: int | None = None) -> None:
+    """Forget cached starlisting active flags and metadata.
+
+    Args:
+        starlisting_id: Only forget this starlisting (default: all of them)
+    """
+    if starlisting_id is None:
+        starlisting_active_cache.clear()
+        starlisting_meta_cache.clear()
+    else:
+        starlisting_active_cache.pop(starlisting_id, None)
+        starlisting_meta_cache.pop(starlisting_id, None)
@@ -9,20 +9,302 @@ Features:
 - Subscription management (subscribe/unsubscribe to starlistings)
 - Heartbeat/ping mechanism to keep connections alive
 - Broadcast to specific subscribers based on starlisting_id
+- Per-client bounded send queue drained by a dedicated writer task
+- Coalescing of superseded real-time updates for clients that fall behind
+- Batched delivery of several messages in a single frame
+- Optional zlib compression of large batches (sent as binary frames)
+- Optional MessagePack encoding (binary frames) via the kirby.msgpack subprotocol
+- Optional raw transport writes of shared text frames (uvicorn websockets-sansio only)
 - Connection limits and error handling
 """
 
 import asyncio
-import json
-from collections import defaultdict
+import struct
+import zlib
+from collections import defaultdict, deque
 from datetime import datetime, timezone
-from typing import Any, Dict, Set
+from typing import Any, Dict, Hashable, Set
 
-from fastapi import WebSocket
+import orjson
+from fastapi import WebSocket, status
 from structlog import get_logger
 
+try:
+    import ormsgpack
+except ImportError:  # Optional: only needed for the kirby.msgpack subprotocol
+    ormsgpack = None
+
 logger = get_logger(__name__)
 
+# WebSocket subprotocol a client requests to receive MessagePack instead of JSON
+MSGPACK_SUBPROTOCOL = "kirby.msgpack"
+MSGPACK_AVAILABLE = ormsgpack is not None
+
+# Default size (serialized bytes) from which batches are compressed for clients that opt in
+COMPRESSION_THRESHOLD = 4096
+
+# Real-time message types that are snapshots of a record: a newer update for the same
+# record supersedes older ones still waiting in a backlogged client's queue
+COALESCABLE_TYPES = frozenset({"candle", "funding", "open_interest"})
+
+# A queued frame: (coalesce key or None, JSON message or binary frame)
+QueuedFrame = tuple[Hashable | None, str | bytes]
+
+
+def _dumps(message: Dict[str, Any]) -> str:
+    """Serialize a message to a JSON string for a text frame.
+
+    Uses orjson, which handles datetime natively; Decimal values fall back to str.
+
+    Args:
+        message: The message to serialize
+
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(message, default=str).decode()
+
+
+def _packb(message: Dict[str, Any]) -> bytes:
+    """Serialize a message to MessagePack for a binary frame.
+
+    Uses ormsgpack, which handles datetime natively; Decimal values fall back to str.
+
+    Args:
+        message: The message to serialize
+
+    Returns:
+        MessagePack bytes
+    """
+    return ormsgpack.packb(message, default=str)
+
+
+def _coalesce_key(starlisting_id: int, message: Dict[str, Any]) -> Hashable | None:
+    """Identify the record a real-time update is a snapshot of.
+
+    Args:
+        starlisting_id: The starlisting the message is broadcast for
+        message: The message being broadcast
+
+    Returns:
+        (type, starlisting_id, record time) for coalescable updates, None otherwise
+    """
+    message_type = message.get("type")
+    if message_type not in COALESCABLE_TYPES:
+        return None
+    data = message.get("data")
+    if not isinstance(data, dict):
+        return None
+    return (message_type, starlisting_id, data.get("time"))
+
+
+def _drop_superseded(frames: list[QueuedFrame]) -> list[QueuedFrame]:
+    """Keep only the newest queued update of each record.
+
+    Frames without a coalesce key (historical data, control messages, errors) are
+    always kept. Order is otherwise preserved, with each surviving update at the
+    position of the newest one.
+
+    Args:
+        frames: Queued frames, oldest first
+
+    Returns:
+        The frames to send, oldest first
+    """
+    seen = set()
+    kept = []
+    for frame in reversed(frames):
+        key = frame[0]
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append(frame)
+    kept.reverse()
+    return kept
+
+
+_BATCH_PREFIX = '{"type":"batch","messages":['
+
+# Heartbeat pings only differ in their timestamp, so they are formatted from a template
+_PING_TEMPLATE = '{{"type":"ping","timestamp":"{}"}}'
+
+
+def _join_messages(messages: list[str]) -> str:
+    """Combine serialized messages into one text frame.
+
+    Batch envelopes among the messages are flattened into the combined batch.
+
+    Args:
+        messages: Serialized messages, in send order
+
+    Returns:
+        The single message, or a batch envelope holding all of them
+    """
+    if len(messages) == 1:
+        return messages[0]
+
+    parts = [
+        message[len(_BATCH_PREFIX):-2] if message.startswith(_BATCH_PREFIX) else message
+        for message in messages
+    ]
+    return _BATCH_PREFIX + ",".join(parts) + "]}"
+
+
+def _find_raw_protocol(websocket: WebSocket) -> Any | None:
+    """Find the uvicorn protocol a WebSocket's frames can be written through directly.
+
+    Follows the ASGI send callable through the closures Starlette wraps it in, down
+    to uvicorn's websockets-sansio protocol. Frames can only be written raw when no
+    extension (per-message deflate) was negotiated, since they are then plain
+    unmasked server frames.
+
+    Args:
+        websocket: An accepted WebSocket connection
+
+    Returns:
+        The protocol, or None if the connection is served some other way
+    """
+    send = getattr(websocket, "_send", None)
+    for _ in range(8):
+        protocol = getattr(send, "__self__", None)
+        if protocol is not None:
+            conn = getattr(protocol, "conn", None)
+            if (
+                getattr(protocol, "transport", None) is not None
+                and getattr(conn, "extensions", None) == []
+                and hasattr(protocol, "writable")
+            ):
+                return protocol
+            return None
+        # Starlette wraps send in closures; the wrapped callable is a free variable
+        cells = getattr(send, "__closure__", None) or ()
+        send = next(
+            (
+                cell.cell_contents
+                for cell in cells
+                if callable(getattr(cell, "cell_contents", None))
+            ),
+            None,
+        )
+    return None
+
+
+def _text_frame(payload: bytes) -> bytes:
+    """Encode a complete, unmasked server text frame (RFC 6455).
+
+    Args:
+        payload: UTF-8 encoded message
+
+    Returns:
+        The frame bytes
+    """
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x81, length)
+    elif length < 65536:
+        header = struct.pack("!BBH", 0x81, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x81, 127, length)
+    return header + payload
+
+
+class _SendQueue:
+    """Bounded FIFO of frames for one client, drained by its writer task.
+
+    A lean stand-in for asyncio.Queue: broadcasts put a frame into every
+    subscriber's queue, and with a single consumer the task accounting and getter
+    bookkeeping of asyncio.Queue.put_nowait are pure overhead on that loop.
+
+    Producers that can wait (streamed history) use put instead, which holds them
+    until the writer has taken frames out, until the queue is closed.
+    """
+
+    __slots__ = ("_frames", "_maxsize", "_waiter", "_putters", "_closed")
+
+    def __init__(self, maxsize: int):
+        """Initialize an empty queue.
+
+        Args:
+            maxsize: Maximum number of pending frames
+        """
+        self._frames: deque[QueuedFrame] = deque()
+        self._maxsize = maxsize
+        self._waiter: asyncio.Future | None = None
+        self._putters: list[asyncio.Future] = []
+        self._closed = False
+
+    def qsize(self) -> int:
+        """Return the number of pending frames."""
+        return len(self._frames)
+
+    def empty(self) -> bool:
+        """Return True if no frames are pending."""
+        return not self._frames
+
+    def put_nowait(self, frame: QueuedFrame) -> None:
+        """Append a frame, waking the writer if it is waiting.
+
+        Raises:
+            asyncio.QueueFull: If maxsize frames are already pending
+        """
+        if len(self._frames) >= self._maxsize:
+            raise asyncio.QueueFull
+        self._frames.append(frame)
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def put(self, frame: QueuedFrame, limit: int) -> bool:
+        """Append a frame once fewer than limit frames are pending.
+
+        Args:
+            frame: The frame to append
+            limit: Pending frames at which to wait for the writer (at most maxsize)
+
+        Returns:
+            True if appended, False if the queue was closed first
+        """
+        while not self._closed and len(self._frames) >= limit:
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            await putter
+        if self._closed:
+            return False
+        self.put_nowait(frame)
+        return True
+
+    async def get(self) -> QueuedFrame:
+        """Remove and return the oldest frame, waiting until one is available."""
+        while not self._frames:
+            self._waiter = asyncio.get_running_loop().create_future()
+            await self._waiter
+        if self._putters:
+            self._wake_putters()
+        return self._frames.popleft()
+
+    def drain(self) -> list[QueuedFrame]:
+        """Remove and return all pending frames, oldest first."""
+        frames = list(self._frames)
+        self._frames.clear()
+        if self._putters:
+            self._wake_putters()
+        return frames
+
+    def close(self) -> None:
+        """Release every waiting put, which then fails (the client is gone)."""
+        self._closed = True
+        self._wake_putters()
+
+    def _wake_putters(self) -> None:
+        """Let waiting puts check for room again."""
+        for putter in self._putters:
+            if not putter.done():
+                putter.set_result(None)
+        self._putters.clear()
+
 
 class ConnectionManager:
     """Manages WebSocket connections and subscriptions for real-time streaming.
@@ -34,17 +316,51 @@ class ConnectionManager:
     The dual mapping enables efficient operations in both directions:
     - Find all subscriptions for a client (for disconnect cleanup)
     - Find all clients subscribed to a starlisting (for broadcasting)
+
+    A starlisting's subscriber set is created on first subscribe and kept once it
+    empties, since the same (validated) starlistings are subscribed to again and again.
+
+    Outbound messages are never written to the socket by the caller. Each client has a
+    bounded queue of serialized messages and a writer task that drains it, so a slow
+    client cannot stall broadcasts or its own receive loop. When several messages are
+    pending the writer coalesces them into a single batch frame, and once a backlog
+    passes half the queue size it also drops real-time updates that a newer update of
+    the same record supersedes. A client whose queue overflows is disconnected.
+
+    Clients connected with the kirby.msgpack subprotocol are sent every message as a
+    MessagePack binary frame instead of JSON text. Binary frames are never merged, so
+    their messages are written one per frame.
+
+    With raw_frames, a text message sent on its own (typically a broadcast update
+    shared by every subscriber) is framed once and written straight to each
+    connection's transport, skipping the per-send ASGI dispatch. This relies on
+    uvicorn's websockets-sansio internals; other connections use the regular send.
     """
 
-    def __init__(self, max_connections: int = 100, heartbeat_interval: int = 30):
+    def __init__(
+        self,
+        max_connections: int = 100,
+        heartbeat_interval: int = 30,
+        send_queue_size: int = 1000,
+        compression_threshold: int = COMPRESSION_THRESHOLD,
+        raw_frames: bool = False,
+    ):
         """Initialize the connection manager.
 
         Args:
             max_connections: Maximum number of concurrent WebSocket connections
             heartbeat_interval: Seconds between heartbeat pings
+            send_queue_size: Maximum number of pending outbound messages per client
+            compression_threshold: Minimum batch size (bytes) compressed for clients
+                that opt in
+            raw_frames: Write single text frames directly to the transport
         """
         self.max_connections = max_connections
         self.heartbeat_interval = heartbeat_interval
+        self.send_queue_size = send_queue_size
+        self.coalesce_threshold = send_queue_size // 2
+        self.compression_threshold = compression_threshold
+        self.raw_frames = raw_frames
 
         # WebSocket -> Set of starlisting_ids
         self.connections: Dict[WebSocket, Set[int]] = {}
@@ -52,13 +368,33 @@ class ConnectionManager:
         # starlisting_id -> Set of WebSockets
         self.subscribers: Dict[int, Set[WebSocket]] = defaultdict(set)
 
-        # Active heartbeat tasks (one per WebSocket)
-        self._heartbeat_tasks: Dict[WebSocket, asyncio.Task] = {}
+        # Heartbeat task pinging every connection (running while any are connected)
+        self._heartbeat_task: asyncio.Task | None = None
+
+        # Outbound queues of serialized messages and their writer tasks (one per WebSocket).
+        # Text entries are JSON messages; bytes entries are compressed or MessagePack frames.
+        self._send_queues: Dict[WebSocket, _SendQueue] = {}
+        self._writer_tasks: Dict[WebSocket, asyncio.Task] = {}
+
+        # Tasks closing the sockets of dropped slow clients (referenced until done,
+        # since the event loop only holds tasks weakly)
+        self._close_tasks: Set[asyncio.Task] = set()
+
+        # Connections that negotiated the MessagePack subprotocol
+        self._msgpack_clients: Set[WebSocket] = set()
+
+        # uvicorn protocols of connections written to directly (raw_frames only), and
+        # the last text frame encoded, which the writers of all its subscribers reuse
+        self._raw_protocols: Dict[WebSocket, Any] = {}
+        self._last_text_frame: tuple[str, bytes] | None = None
 
         logger.info(
             "connection_manager_initialized",
             max_connections=max_connections,
             heartbeat_interval=heartbeat_interval,
+            send_queue_size=send_queue_size,
+            compression_threshold=compression_threshold,
+            raw_frames=raw_frames,
         )
 
     @property
@@ -71,11 +407,15 @@ class ConnectionManager:
         """Check if connection limit is reached."""
         return self.connection_count >= self.max_connections
 
-    async def connect(self, websocket: WebSocket) -> bool:
+    async def connect(
+        self, websocket: WebSocket, subprotocol: str | None = None
+    ) -> bool:
         """Register a new WebSocket connection.
 
         Args:
             websocket: The WebSocket connection to register
+            subprotocol: Subprotocol to accept the connection with
+                (MSGPACK_SUBPROTOCOL switches the client to MessagePack frames)
 
         Returns:
             True if connection was accepted, False if at capacity
@@ -89,16 +429,28 @@ class ConnectionManager:
             return False
 
         # Accept the WebSocket connection
-        await websocket.accept()
+        await websocket.accept(subprotocol=subprotocol)
 
         # Initialize empty subscription set for this connection
         self.connections[websocket] = set()
-
-        # Start heartbeat task for this connection
-        self._heartbeat_tasks[websocket] = asyncio.create_task(
-            self._heartbeat_loop(websocket)
+        if subprotocol == MSGPACK_SUBPROTOCOL:
+            self._msgpack_clients.add(websocket)
+
+        if self.raw_frames:
+            protocol = _find_raw_protocol(websocket)
+            if protocol is not None:
+                self._raw_protocols[websocket] = protocol
+
+        # Start writer task draining this connection's send queue
+        self._send_queues[websocket] = _SendQueue(self.send_queue_size)
+        self._writer_tasks[websocket] = asyncio.create_task(
+            self._writer_loop(websocket)
         )
 
+        # Start the shared heartbeat task with the first connection
+        if self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
         logger.info(
             "websocket_connected",
             total_connections=self.connection_count,
@@ -115,25 +467,30 @@ class ConnectionManager:
         if websocket not in self.connections:
             return
 
-        # Cancel heartbeat task
-        if websocket in self._heartbeat_tasks:
-            self._heartbeat_tasks[websocket].cancel()
-            del self._heartbeat_tasks[websocket]
+        # Cancel writer task and drop any unsent messages
+        if websocket in self._writer_tasks:
+            self._writer_tasks[websocket].cancel()
+            del self._writer_tasks[websocket]
+        queue = self._send_queues.pop(websocket, None)
+        if queue is not None:
+            queue.close()
+        self._msgpack_clients.discard(websocket)
+        self._raw_protocols.pop(websocket, None)
 
         # Get all starlistings this client was subscribed to
         starlisting_ids = self.connections[websocket]
 
-        # Remove client from all subscription lists
+        # Remove client from all subscription lists (emptied sets are kept for reuse)
         for starlisting_id in starlisting_ids:
-            if starlisting_id in self.subscribers:
-                self.subscribers[starlisting_id].discard(websocket)
+            subscribers = self.subscribers.get(starlisting_id)
+            if subscribers is not None:
+                subscribers.discard(websocket)
 
-                # Clean up empty subscriber sets
-                if not self.subscribers[starlisting_id]:
-                    del self.subscribers[starlisting_id]
-
-        # Remove connection
+        # Remove connection, stopping the heartbeat with the last one
         del self.connections[websocket]
+        if not self.connections and self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
 
         logger.info(
             "websocket_disconnected",
@@ -182,13 +539,10 @@ class ConnectionManager:
             # Remove from client's subscription set
             self.connections[websocket].discard(starlisting_id)
 
-            # Remove client from starlisting's subscriber set
-            if starlisting_id in self.subscribers:
-                self.subscribers[starlisting_id].discard(websocket)
-
-                # Clean up empty subscriber sets
-                if not self.subscribers[starlisting_id]:
-                    del self.subscribers[starlisting_id]
+            # Remove client from starlisting's subscriber set (kept even when empty)
+            subscribers = self.subscribers.get(starlisting_id)
+            if subscribers is not None:
+                subscribers.discard(websocket)
 
         logger.info(
             "websocket_unsubscribed",
@@ -223,50 +577,67 @@ class ConnectionManager:
     ) -> int:
         """Broadcast a message to all clients subscribed to a starlisting.
 
+        The message is queued for each subscriber; delivery happens in the
+        subscribers' writer tasks.
+
         Args:
             starlisting_id: The starlisting ID
             message: The message to broadcast (will be JSON serialized)
 
         Returns:
-            Number of clients the message was sent to
+            Number of clients the message was queued for
         """
-        if starlisting_id not in self.subscribers:
+        # Only this starlisting's subscribers are visited, never every connection
+        subscribers = self.subscribers.get(starlisting_id)
+        if not subscribers:
             return 0
 
-        # Get all subscribers for this starlisting
-        subscribers = self.subscribers[starlisting_id].copy()
+        # Serialize message once per encoding in use; every subscriber's queue shares
+        # the same frame
+        coalesce_key = _coalesce_key(starlisting_id, message)
+        frame = None
+        packed_frame = None
 
-        # Serialize message once (more efficient than per-client)
-        message_json = json.dumps(message)
-
-        # Track successful sends
+        # Track successful sends; the list of slow clients is only allocated if needed
         sent_count = 0
-        failed_websockets = []
+        slow_websockets = None
 
-        # Broadcast to all subscribers
+        # Queue for all subscribers (plain put_nowait, no per-subscriber coroutine).
+        # Nothing here awaits, so the set cannot change mid-loop and is not copied;
+        # slow clients are only dropped once the loop is done.
+        get_queue = self._send_queues.get
+        msgpack_clients = self._msgpack_clients
         for websocket in subscribers:
+            queue = get_queue(websocket)
+            if queue is None:
+                continue
+            if websocket in msgpack_clients:
+                if packed_frame is None:
+                    packed_frame = (coalesce_key, _packb(message))
+                item = packed_frame
+            else:
+                if frame is None:
+                    frame = (coalesce_key, _dumps(message))
+                item = frame
             try:
-                await websocket.send_text(message_json)
+                queue.put_nowait(item)
                 sent_count += 1
-            except Exception as e:
-                logger.error(
-                    "broadcast_send_failed",
-                    starlisting_id=starlisting_id,
-                    error=str(e),
-                )
-                # Mark for cleanup
-                failed_websockets.append(websocket)
-
-        # Clean up failed connections
-        for websocket in failed_websockets:
-            await self.disconnect(websocket)
+            except asyncio.QueueFull:
+                if slow_websockets is None:
+                    slow_websockets = []
+                slow_websockets.append(websocket)
+
+        # Drop clients that are not keeping up
+        if slow_websockets:
+            for websocket in slow_websockets:
+                await self._drop_slow_client(websocket)
 
         if sent_count > 0:
             logger.debug(
                 "broadcast_sent",
                 starlisting_id=starlisting_id,
                 sent_count=sent_count,
-                failed_count=len(failed_websockets),
+                failed_count=len(slow_websockets) if slow_websockets else 0,
             )
 
         return sent_count
@@ -281,48 +652,319 @@ class ConnectionManager:
             message: The message to send (will be JSON serialized)
 
         Returns:
-            True if sent successfully, False otherwise
+            True if queued successfully, False otherwise
         """
-        try:
-            message_json = json.dumps(message)
-            await websocket.send_text(message_json)
+        return await self._enqueue(websocket, self._serialize_for(websocket, message))
+
+    async def send_serialized(
+        self, websocket: WebSocket, message_json: str, message: Dict[str, Any]
+    ) -> bool:
+        """Send an already serialized JSON message to a specific client.
+
+        For messages that are serialized once and reused, such as the pong reply.
+
+        Args:
+            websocket: The WebSocket connection
+            message_json: The JSON-encoded message
+            message: The same message, encoded instead for MessagePack clients
+
+        Returns:
+            True if queued successfully, False otherwise
+        """
+        if websocket in self._msgpack_clients:
+            return await self._enqueue(websocket, _packb(message))
+        return await self._enqueue(websocket, message_json)
+
+    async def send_batch(
+        self,
+        websocket: WebSocket,
+        messages: list[Dict[str, Any]],
+        compress: bool = False,
+    ) -> bool:
+        """Send several messages to a client in a single frame.
+
+        The messages are queued as one batch envelope:
+        {"type": "batch", "messages": [...]}
+
+        With compress=True, a batch of at least compression_threshold bytes is instead
+        sent on its own as a binary frame holding the zlib-compressed envelope.
+        MessagePack clients get the envelope as a MessagePack frame, never compressed.
+
+        Args:
+            websocket: The WebSocket connection
+            messages: The messages to send (will be JSON serialized)
+            compress: Whether the client accepts compressed binary frames
+
+        Returns:
+            True if queued successfully (or nothing to send), False otherwise
+        """
+        if not messages:
             return True
-        except Exception as e:
-            logger.error(
-                "send_to_client_failed",
-                error=str(e),
+
+        if websocket in self._msgpack_clients:
+            return await self._enqueue(
+                websocket, _packb({"type": "batch", "messages": messages})
             )
-            # Clean up failed connection
-            await self.disconnect(websocket)
+
+        # Serialize to bytes, so the threshold is compared in bytes and the
+        # compressed path does not decode and re-encode the envelope
+        envelope = orjson.dumps({"type": "batch", "messages": messages}, default=str)
+        if compress and len(envelope) >= self.compression_threshold:
+            return await self._enqueue(websocket, zlib.compress(envelope, 1))
+
+        # Uncompressed batches go out as text frames
+        return await self._enqueue(websocket, envelope.decode())
+
+    async def send_history_chunk(
+        self,
+        websocket: WebSocket,
+        message: Dict[str, Any],
+        compress: bool = False,
+    ) -> bool:
+        """Send one chunk of streamed history, waiting for room in the client's queue.
+
+        Unlike the other sends, this waits while half the client's queue
+        (coalesce_threshold) is pending instead of queueing right away, so a history
+        stream advances at the pace the client reads it: the chunks in memory stay
+        bounded, and a long history cannot overflow the queue and get the client
+        dropped. The other half stays free for real-time updates.
+
+        With compress=True, a chunk of at least compression_threshold bytes is sent
+        as a binary frame holding the zlib-compressed batch envelope of the chunk,
+        like a compressed historical batch.
+
+        Args:
+            websocket: The WebSocket connection
+            message: The chunk message
+            compress: Whether the client accepts compressed binary frames
+
+        Returns:
+            True if queued, False if the client is gone
+        """
+        queue = self._send_queues.get(websocket)
+        if queue is None:
+            return False
+
+        if websocket in self._msgpack_clients:
+            frame: str | bytes = _packb(message)
+        else:
+            body = orjson.dumps(message, default=str)
+            if compress and len(body) >= self.compression_threshold:
+                envelope = _BATCH_PREFIX.encode() + body + b"]}"
+                frame = zlib.compress(envelope, 1)
+            else:
+                frame = body.decode()
+
+        return await queue.put((None, frame), max(1, self.coalesce_threshold))
+
+    def _serialize_for(self, websocket: WebSocket, message: Dict[str, Any]) -> str | bytes:
+        """Serialize a message in the encoding a client negotiated.
+
+        Args:
+            websocket: The WebSocket connection
+            message: The message to serialize
+
+        Returns:
+            MessagePack bytes for MessagePack clients, a JSON string otherwise
+        """
+        if websocket in self._msgpack_clients:
+            return _packb(message)
+        return _dumps(message)
+
+    async def _enqueue(self, websocket: WebSocket, message_json: str | bytes) -> bool:
+        """Queue a serialized message for a client's writer task.
+
+        A client whose queue is full is not keeping up and is disconnected.
+
+        Args:
+            websocket: The WebSocket connection
+            message_json: The serialized message, or a binary (compressed or
+                MessagePack) frame
+
+        Returns:
+            True if queued, False if the client is gone or was dropped
+        """
+        queue = self._send_queues.get(websocket)
+        if queue is None:
+            return False
+
+        try:
+            queue.put_nowait((None, message_json))
+            return True
+        except asyncio.QueueFull:
+            await self._drop_slow_client(websocket)
             return False
 
-    async def _heartbeat_loop(self, websocket: WebSocket) -> None:
-        """Background task that sends periodic pings to keep connection alive.
+    async def _drop_slow_client(self, websocket: WebSocket) -> None:
+        """Disconnect a client whose send queue is full and close its socket.
+
+        Args:
+            websocket: The WebSocket connection
+        """
+        logger.warning(
+            "send_queue_full",
+            queue_size=self.send_queue_size,
+        )
+        await self.disconnect(websocket)
+        task = asyncio.create_task(self._close_quietly(websocket))
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+    async def wait_closed(self) -> None:
+        """Wait for the sockets of dropped slow clients to finish closing."""
+        if self._close_tasks:
+            await asyncio.gather(*self._close_tasks, return_exceptions=True)
+
+    async def _close_quietly(self, websocket: WebSocket) -> None:
+        """Close a WebSocket that was dropped by the manager, ignoring errors.
 
         Args:
             websocket: The WebSocket connection
         """
         try:
-            while websocket in self.connections:
-                await asyncio.sleep(self.heartbeat_interval)
+            await websocket.close(
+                code=status.WS_1008_POLICY_VIOLATION,
+                reason="Client too slow",
+            )
+        except Exception:
+            pass
+
+    async def _writer_loop(self, websocket: WebSocket) -> None:
+        """Background task that writes queued messages to the socket.
 
-                # Send ping message
-                ping_message = {
-                    "type": "ping",
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
+        All messages already waiting when the writer wakes up are coalesced into one
+        batch frame; a single pending message is sent as-is. Binary frames (compressed
+        or MessagePack) are never merged and are written in order between the text
+        frames. When the
+        backlog exceeds coalesce_threshold, superseded real-time updates are dropped.
 
-                success = await self.send_to_client(websocket, ping_message)
-                if not success:
-                    # Connection failed, task will be cancelled in disconnect()
-                    break
+        Args:
+            websocket: The WebSocket connection
+        """
+        queue = self._send_queues[websocket]
+        raw_protocol = self._raw_protocols.get(websocket)
+
+        try:
+            while True:
+                frame = await queue.get()
+                if queue.empty():
+                    item = frame[1]
+                    # Common case: write the shared serialized frame as-is
+                    if isinstance(item, bytes):
+                        await websocket.send_bytes(item)
+                    elif raw_protocol is not None and self._can_write_raw(raw_protocol):
+                        raw_protocol.transport.write(self._encode_text_frame(item))
+                    else:
+                        await websocket.send_text(item)
+                    continue
+
+                pending = [frame]
+                pending.extend(queue.drain())
+
+                if len(pending) > self.coalesce_threshold:
+                    backlog = len(pending)
+                    pending = _drop_superseded(pending)
+                    logger.debug(
+                        "send_queue_coalesced",
+                        backlog=backlog,
+                        remaining=len(pending),
+                    )
+
+                texts: list[str] = []
+                for _, item in pending:
+                    if isinstance(item, bytes):
+                        if texts:
+                            await websocket.send_text(_join_messages(texts))
+                            texts = []
+                        await websocket.send_bytes(item)
+                    else:
+                        texts.append(item)
+
+                if texts:
+                    await websocket.send_text(_join_messages(texts))
 
         except asyncio.CancelledError:
             # Normal shutdown
             pass
         except Exception as e:
             logger.error(
-                "heartbeat_loop_error",
+                "send_to_client_failed",
                 error=str(e),
             )
+            # Clean up failed connection
             await self.disconnect(websocket)
+
+    @staticmethod
+    def _can_write_raw(protocol: Any) -> bool:
+        """Check that a frame can be written to a connection's transport right now.
+
+        When the transport is paused (a slow client) or closing, frames go through the
+        regular send instead, which waits for the client or raises.
+        """
+        return (
+            protocol.writable.is_set()
+            and not protocol.close_sent
+            and not protocol.transport.is_closing()
+        )
+
+    def _encode_text_frame(self, message: str) -> bytes:
+        """Frame a text message for raw writes, reusing the last frame if it matches.
+
+        A broadcast queues the same string object for every subscriber, so their
+        writers encode it only once between them.
+        """
+        last = self._last_text_frame
+        if last is not None and last[0] is message:
+            return last[1]
+        frame = _text_frame(message.encode())
+        self._last_text_frame = (message, frame)
+        return frame
+
+    async def _heartbeat_loop(self) -> None:
+        """Background task that sends periodic pings to keep connections alive.
+
+        One task serves every connection: each tick formats the ping once per
+        encoding in use and queues it for all clients, rather than each connection
+        running its own timer.
+        """
+        try:
+            while True:
+                await asyncio.sleep(self.heartbeat_interval)
+                try:
+                    await self._send_pings()
+                except Exception as e:
+                    logger.error(
+                        "heartbeat_loop_error",
+                        error=str(e),
+                    )
+
+        except asyncio.CancelledError:
+            # Normal shutdown
+            pass
+
+    async def _send_pings(self) -> None:
+        """Queue a timestamped ping for every connection."""
+        timestamp = datetime.now(timezone.utc).isoformat()
+        ping = (None, _PING_TEMPLATE.format(timestamp))
+        packed_ping = None
+
+        slow_websockets = None
+        msgpack_clients = self._msgpack_clients
+        for websocket, queue in self._send_queues.items():
+            if websocket in msgpack_clients:
+                if packed_ping is None:
+                    packed_ping = (None, _packb({"type": "ping", "timestamp": timestamp}))
+                item = packed_ping
+            else:
+                item = ping
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                if slow_websockets is None:
+                    slow_websockets = []
+                slow_websockets.append(websocket)
+
+        # Drop clients that are not keeping up
+        if slow_websockets:
+            for websocket in slow_websockets:
+                await self._drop_slow_client(websocket)
@@ -0,0 +1,20 @@
+"""
+Gunicorn worker class for serving the Kirby API.
+"""
+from uvicorn.workers import UvicornWorker
+
+
+class KirbyUvicornWorker(UvicornWorker):
+    """
+    Uvicorn worker configured like the uvicorn command line in docker-compose.
+
+    Runs on uvloop and httptools, and does not negotiate permessage-deflate:
+    live updates are too small to gain from it, and large historical batches
+    are already zlib-compressed for clients that opt in.
+    """
+
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "ws_per_message_deflate": False,
+    }
@@ -2,9 +2,10 @@
 Base collector framework for exchange data collection.
 """
 import asyncio
+import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 from typing import Any
 
 import structlog
@@ -15,15 +16,24 @@ from src.db.repositories import CandleRepository, StarlistingRepository
 from src.utils.helpers import utc_now
 
 
-class CollectorStatus(Enum):
+class CollectorStatus(IntEnum):
     """Collector status states."""
 
-    IDLE = "idle"
-    STARTING = "starting"
-    RUNNING = "running"
-    STOPPING = "stopping"
-    STOPPED = "stopped"
-    ERROR = "error"
+    IDLE = 0
+    STARTING = 1
+    RUNNING = 2
+    STOPPING = 3
+    STOPPED = 4
+    ERROR = 5
+
+    @property
+    def label(self) -> str:
+        """Lowercase status name, as reported by health checks."""
+        return _STATUS_LABELS[self]
+
+
+# Indexed by CollectorStatus value
+_STATUS_LABELS = tuple(status.name.lower() for status in CollectorStatus)
 
 
 class BaseCollector(ABC):
@@ -43,6 +53,8 @@ class BaseCollector(ABC):
         """
         self.exchange_name = exchange_name
         self.logger = structlog.get_logger(f"kirby.collector.{exchange_name}")
+        # Underlying stdlib logger, to check the level before building hot-path debug logs
+        self._stdlib_logger = logging.getLogger(f"kirby.collector.{exchange_name}")
         self.status = CollectorStatus.IDLE
         self.starlistings: list[dict[str, Any]] = []
         self.retry_count = 0
@@ -51,6 +63,14 @@ class BaseCollector(ABC):
         self._stop_event = asyncio.Event()
         self._connection_healthy = False
 
+        # Candle repository on the shared asyncpg pool, created once (see store_candles)
+        self.candle_repo: CandleRepository | None = None
+
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether debug logs are emitted (checked before logging per message)."""
+        return self._stdlib_logger.isEnabledFor(logging.DEBUG)
+
     async def initialize(self) -> None:
         """
         Initialize the collector by loading starlistings.
@@ -86,6 +106,9 @@ class BaseCollector(ABC):
                 exchange=self.exchange_name,
             )
 
+        # Set up storage once rather than on every write
+        self.candle_repo = CandleRepository(await get_asyncpg_pool())
+
     async def start(self) -> None:
         """
         Start the collector with auto-restart on failure.
@@ -115,6 +138,11 @@ class BaseCollector(ABC):
                 # Run collection loop
                 await self.collect()
 
+                # collect() only returns once the connection has ended normally;
+                # close it before reconnecting
+                if not self._stop_event.is_set():
+                    await self.disconnect()
+
             except asyncio.CancelledError:
                 self.logger.info("Collector cancelled", exchange=self.exchange_name)
                 break
@@ -143,6 +171,9 @@ class BaseCollector(ABC):
 
                 self.retry_count += 1
 
+                # Close the failed connection before waiting to retry
+                await self.disconnect()
+
                 # Wait before retry
                 if not self._stop_event.is_set():
                     self.logger.info(
@@ -152,8 +183,8 @@ class BaseCollector(ABC):
                     )
                     await asyncio.sleep(settings.collector_restart_delay)
 
-            finally:
-                await self.disconnect()
+        # Close the connection the loop last ran on
+        await self.disconnect()
 
         self.status = CollectorStatus.STOPPED
         self.logger.info("Collector stopped", exchange=self.exchange_name)
@@ -191,14 +222,15 @@ class BaseCollector(ABC):
     async def store_candles(
         self,
         candles: list[dict[str, Any]],
-        starlisting_id: int,
+        starlisting_id: int | None = None,
     ) -> int:
         """
         Store candles to database using bulk insert.
 
         Args:
             candles: List of candle dictionaries
-            starlisting_id: Starlisting ID
+            starlisting_id: Starlisting ID of all the candles (omit if each candle
+                already carries its own starlisting_id)
 
         Returns:
             Number of candles inserted
@@ -207,23 +239,25 @@ class BaseCollector(ABC):
             return 0
 
         try:
-            # Add starlisting_id to each candle
-            for candle in candles:
-                candle["starlisting_id"] = starlisting_id
+            # Build the rows directly rather than tagging each candle dict with
+            # starlisting_id, so the caller's candles are left untouched
+            to_record = CandleRepository.to_record
+            records = [to_record(candle, starlisting_id) for candle in candles]
 
             # Use asyncpg for high-performance bulk insert
-            pool = await get_asyncpg_pool()
-            candle_repo = CandleRepository(pool)
-            count = await candle_repo.upsert_candles(candles)
+            if self.candle_repo is None:
+                self.candle_repo = CandleRepository(await get_asyncpg_pool())
+            count = await self.candle_repo.upsert_records(records)
 
             self.last_collection_time = utc_now()
 
-            self.logger.debug(
-                "Stored candles",
-                exchange=self.exchange_name,
-                starlisting_id=starlisting_id,
-                count=count,
-            )
+            if self.debug_enabled:
+                self.logger.debug(
+                    "Stored candles",
+                    exchange=self.exchange_name,
+                    starlisting_id=starlisting_id,
+                    count=count,
+                )
 
             return count
 
@@ -246,8 +280,8 @@ class BaseCollector(ABC):
         """
         return {
             "exchange": self.exchange_name,
-            "status": self.status.value,
-            "healthy": self._connection_healthy and self.status == CollectorStatus.RUNNING,
+            "status": self.status.label,
+            "healthy": self._connection_healthy and self.status is CollectorStatus.RUNNING,
             "last_collection": self.last_collection_time.isoformat() if self.last_collection_time else None,
             "retry_count": self.retry_count,
             "last_error": str(self.last_error) if self.last_error else None,
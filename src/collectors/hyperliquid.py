@@ -4,21 +4,52 @@ Hyperliquid exchange collector.
 Collects real-time candle data via WebSocket.
 """
 import asyncio
-import json
+from datetime import datetime, timezone
 from typing import Any
 
+import orjson
 import websockets
-from websockets.client import WebSocketClientProtocol
+from websockets.asyncio.client import ClientConnection
 
 from src.collectors.base import BaseCollector
-from src.utils.helpers import normalize_candle_data, validate_candle
+from src.config.settings import settings
+from src.utils.helpers import validate_ohlcv
+
+
+def _normalize_hl(candle_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Normalize a Hyperliquid candle to Kirby format.
+
+    Specialization of normalize_candle_data(..., source="hyperliquid") for the
+    collector hot path: no source dispatch, and candle start times are always
+    milliseconds.
+
+    Args:
+        candle_data: Hyperliquid candle ({t, T, s, i, o, c, h, l, v, n})
+
+    Returns:
+        Normalized candle dict
+    """
+    return {
+        "time": datetime.fromtimestamp(candle_data["t"] / 1000, tz=timezone.utc),
+        "open": float(candle_data["o"]),
+        "high": float(candle_data["h"]),
+        "low": float(candle_data["l"]),
+        "close": float(candle_data["c"]),
+        "volume": float(candle_data.get("v", 0)),
+        "num_trades": candle_data.get("n"),
+    }
 
 
 class HyperliquidCollector(BaseCollector):
     """
     Hyperliquid WebSocket collector for real-time candle data.
 
-    Subscribes to candle updates for configured starlistings.
+    Subscribes to candle updates for configured starlistings. Updates are buffered
+    and written in batches, every collector_candle_flush_interval seconds or as soon
+    as collector_candle_batch_size candles are pending, so one upsert carries the
+    updates of all subscriptions. Hyperliquid resends the open candle on every
+    trade, so only the latest update of each candle is kept.
     """
 
     WEBSOCKET_URL = "wss://api.hyperliquid.xyz/ws"
@@ -26,8 +57,14 @@ class HyperliquidCollector(BaseCollector):
     def __init__(self):
         """Initialize Hyperliquid collector."""
         super().__init__("hyperliquid")
-        self.ws: WebSocketClientProtocol | None = None
-        self.subscriptions: dict[str, int] = {}  # subscription_key -> starlisting_id
+        self.ws: ClientConnection | None = None
+        self.subscriptions: dict[tuple[str, str], int] = {}  # (coin, interval) -> starlisting_id
+
+        # Buffering for batched writes
+        # (starlisting_id, candle time) -> latest candle
+        self.candle_buffer: dict[tuple[int, datetime], dict[str, Any]] = {}
+        self.flush_task: asyncio.Task | None = None
+        self._flush_requested = asyncio.Event()
 
     async def connect(self) -> None:
         """Connect to Hyperliquid WebSocket API."""
@@ -36,9 +73,17 @@ class HyperliquidCollector(BaseCollector):
         try:
             self.ws = await websockets.connect(
                 self.WEBSOCKET_URL,
-                ping_interval=20,
-                ping_timeout=10,
+                # The candle feed is busy enough that a dead connection shows up
+                # quickly as missing data, so keepalive pings can be infrequent
+                ping_interval=60,
+                ping_timeout=30,
                 close_timeout=10,
+                # Frames are a few hundred bytes; inflating them costs more CPU
+                # than the bandwidth it saves
+                compression=None,
+                # Frames are small, so buffer plenty of them before websockets
+                # pauses reading the socket (the default is 16)
+                max_queue=256,
             )
 
             self.logger.info("Connected to Hyperliquid WebSocket")
@@ -46,6 +91,9 @@ class HyperliquidCollector(BaseCollector):
             # Subscribe to candles for all starlistings
             await self._subscribe_to_candles()
 
+            # Start periodic flush task
+            await self._start_flush_task()
+
         except Exception as e:
             self.logger.error(
                 "Failed to connect to Hyperliquid WebSocket",
@@ -56,6 +104,10 @@ class HyperliquidCollector(BaseCollector):
 
     async def disconnect(self) -> None:
         """Disconnect from Hyperliquid WebSocket."""
+        # Stop flush task first, then write whatever is still buffered
+        await self._stop_flush_task()
+        await self._flush_buffer()
+
         if self.ws:
             try:
                 await self.ws.close()
@@ -76,34 +128,40 @@ class HyperliquidCollector(BaseCollector):
         if not self.ws:
             raise RuntimeError("WebSocket not connected")
 
+        # Build every subscription frame up front, then send them all at once
+        # rather than awaiting each send in turn
+        frames = []
         for starlisting in self.starlistings:
             coin = starlisting.coin.symbol
             interval = starlisting.interval.name
 
-            # Create subscription message
-            subscription = {
-                "method": "subscribe",
-                "subscription": {
-                    "type": "candle",
-                    "coin": coin,
-                    "interval": interval,
-                },
-            }
-
-            # Send subscription
-            await self.ws.send(json.dumps(subscription))
+            frames.append(
+                orjson.dumps(
+                    {
+                        "method": "subscribe",
+                        "subscription": {
+                            "type": "candle",
+                            "coin": coin,
+                            "interval": interval,
+                        },
+                    }
+                )
+            )
 
             # Track subscription
-            sub_key = f"{coin}_{interval}"
-            self.subscriptions[sub_key] = starlisting.id
+            self.subscriptions[(coin, interval)] = starlisting.id
 
             self.logger.info(
-                "Subscribed to candles",
+                "Subscribing to candles",
                 coin=coin,
                 interval=interval,
                 starlisting_id=starlisting.id,
             )
 
+        # Send the UTF-8 bytes as text frames, as Hyperliquid expects
+        send = self.ws.send
+        await asyncio.gather(*(send(frame, text=True) for frame in frames))
+
         self.logger.info(
             "Subscribed to all candles",
             subscription_count=len(self.subscriptions),
@@ -120,25 +178,42 @@ class HyperliquidCollector(BaseCollector):
 
         self.logger.info("Starting candle collection")
 
+        # Bind everything used per message to locals once, outside the loop
+        recv = self.ws.recv
+        loads = orjson.loads
+        decode_error = orjson.JSONDecodeError
+        process_message = self._process_message
+        stop_requested = self._stop_event.is_set
+
         try:
-            async for message in self.ws:
+            while True:
+                # Take text frames as raw UTF-8 bytes, which orjson parses directly,
+                # rather than having websockets decode them to str first. recv()
+                # returns already-buffered frames without suspending, so a burst is
+                # drained in one pass and the loop only yields once it is empty.
+                try:
+                    message = await recv(decode=False)
+                except websockets.ConnectionClosedOK:
+                    # Normal closure ends collection, as iterating the connection would
+                    break
+
                 # Check if stop requested
-                if self._stop_event.is_set():
+                if stop_requested():
                     self.logger.info("Stop event detected, exiting collection loop")
                     break
 
                 try:
                     # Parse message
-                    data = json.loads(message)
+                    data = loads(message)
 
                     # Process candle update
-                    await self._process_message(data)
+                    process_message(data)
 
-                except json.JSONDecodeError as e:
+                except decode_error as e:
                     self.logger.warning(
                         "Failed to parse WebSocket message",
                         error=str(e),
-                        message=message[:200],  # Log first 200 chars
+                        message=message[:200].decode(errors="replace"),  # Log first 200 bytes
                     )
                 except Exception as e:
                     self.logger.error(
@@ -162,54 +237,47 @@ class HyperliquidCollector(BaseCollector):
             )
             raise
 
-    async def _process_message(self, data: dict[str, Any]) -> None:
+    def _process_message(self, data: dict[str, Any]) -> None:
         """
         Process a WebSocket message.
 
+        Synchronous: buffering a candle never waits on I/O, so the collect loop
+        handles each frame without creating and awaiting a coroutine.
+
         Args:
             data: Parsed JSON message from WebSocket
         """
         # Check if this is a candle update
         if data.get("channel") != "candle":
             # Not a candle update, might be subscription confirmation
-            self.logger.debug("Received non-candle message", data=data)
-            return
-
-        # Extract candle data
-        candle_data = data.get("data")
-        if not candle_data:
-            self.logger.warning("Candle message missing data field", data=data)
+            if self.debug_enabled:
+                self.logger.debug("Received non-candle message", data=data)
             return
 
-        # Get coin and interval from candle data
-        coin = candle_data.get("s")  # symbol
-        interval = candle_data.get("i")  # interval
-
-        if not coin or not interval:
-            self.logger.warning(
-                "Candle data missing coin or interval",
-                candle_data=candle_data,
-            )
-            return
-
-        # Find corresponding starlisting
-        sub_key = f"{coin}_{interval}"
-        starlisting_id = self.subscriptions.get(sub_key)
-
-        if not starlisting_id:
-            self.logger.warning(
-                "Received candle for unknown subscription",
-                coin=coin,
-                interval=interval,
-            )
+        # Well-formed candle for a known subscription: look everything up in one
+        # pass and leave diagnosing malformed messages to the slow path
+        try:
+            candle_data = data["data"]
+            coin = candle_data["s"]  # symbol
+            interval = candle_data["i"]  # interval
+            starlisting_id = self.subscriptions[(coin, interval)]
+        except (KeyError, TypeError):
+            self._log_rejected_candle(data)
             return
 
         try:
             # Normalize candle data
-            normalized_candle = normalize_candle_data(candle_data, source="hyperliquid")
-
-            # Validate candle
-            if not validate_candle(normalized_candle):
+            normalized_candle = _normalize_hl(candle_data)
+
+            # Validate candle; the normalized values are already floats, so check
+            # them directly rather than through the generic validate_candle
+            if not validate_ohlcv(
+                normalized_candle["open"],
+                normalized_candle["high"],
+                normalized_candle["low"],
+                normalized_candle["close"],
+                normalized_candle["volume"],
+            ):
                 self.logger.warning(
                     "Invalid candle data",
                     coin=coin,
@@ -218,17 +286,21 @@ class HyperliquidCollector(BaseCollector):
                 )
                 return
 
-            # Store candle
-            await self.store_candles([normalized_candle], starlisting_id)
+            # Buffer candle (replacing any pending update of the same candle)
+            normalized_candle["starlisting_id"] = starlisting_id
+            self.candle_buffer[(starlisting_id, normalized_candle["time"])] = normalized_candle
+            if len(self.candle_buffer) >= settings.collector_candle_batch_size:
+                self._flush_requested.set()
 
-            self.logger.debug(
-                "Processed candle",
-                coin=coin,
-                interval=interval,
-                starlisting_id=starlisting_id,
-                time=normalized_candle["time"].isoformat(),
-                close=normalized_candle["close"],
-            )
+            if self.debug_enabled:
+                self.logger.debug(
+                    "Buffered candle",
+                    coin=coin,
+                    interval=interval,
+                    starlisting_id=starlisting_id,
+                    time=normalized_candle["time"].isoformat(),
+                    close=normalized_candle["close"],
+                )
 
         except Exception as e:
             self.logger.error(
@@ -238,3 +310,103 @@ class HyperliquidCollector(BaseCollector):
                 error=str(e),
                 exc_info=True,
             )
+
+    def _log_rejected_candle(self, data: dict[str, Any]) -> None:
+        """
+        Log why a candle message could not be matched to a subscription.
+
+        Args:
+            data: Parsed candle channel message
+        """
+        candle_data = data.get("data")
+        if not candle_data or not isinstance(candle_data, dict):
+            self.logger.warning("Candle message missing data field", data=data)
+            return
+
+        coin = candle_data.get("s")
+        interval = candle_data.get("i")
+        if not coin or not interval:
+            self.logger.warning(
+                "Candle data missing coin or interval",
+                candle_data=candle_data,
+            )
+            return
+
+        self.logger.warning(
+            "Received candle for unknown subscription",
+            coin=coin,
+            interval=interval,
+        )
+
+    async def _start_flush_task(self) -> None:
+        """Start the periodic flush task."""
+        if self.flush_task is not None:
+            self.logger.warning("Flush task already running")
+            return
+
+        self.flush_task = asyncio.create_task(self._flush_loop())
+        self.logger.info(
+            "Started flush task",
+            flush_interval=settings.collector_candle_flush_interval,
+            batch_size=settings.collector_candle_batch_size,
+        )
+
+    async def _stop_flush_task(self) -> None:
+        """Stop the periodic flush task."""
+        if self.flush_task is None:
+            return
+
+        self.flush_task.cancel()
+        try:
+            await self.flush_task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.flush_task = None
+            self.logger.info("Stopped flush task")
+
+    async def _flush_loop(self) -> None:
+        """
+        Periodic flush loop.
+
+        Writes buffered candles every collector_candle_flush_interval seconds, or
+        earlier once collector_candle_batch_size candles are pending.
+        """
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(
+                        self._flush_requested.wait(),
+                        timeout=settings.collector_candle_flush_interval,
+                    )
+                except TimeoutError:
+                    pass
+                self._flush_requested.clear()
+
+                await self._flush_buffer()
+
+            except asyncio.CancelledError:
+                self.logger.info("Flush loop cancelled")
+                raise
+            except Exception as e:
+                self.logger.error(
+                    "Error in flush loop",
+                    error=str(e),
+                    exc_info=True,
+                )
+
+    async def _flush_buffer(self) -> None:
+        """Write all buffered candles to the database in a single upsert."""
+        if not self.candle_buffer:
+            return
+
+        # Swap the buffer out so updates arriving during the write start a new batch
+        buffer = self.candle_buffer
+        self.candle_buffer = {}
+
+        try:
+            await self.store_candles(list(buffer.values()))
+        except Exception:
+            # Keep the candles for the next flush, unless a newer update arrived
+            for key, candle in buffer.items():
+                self.candle_buffer.setdefault(key, candle)
@@ -4,18 +4,72 @@ Hyperliquid funding rate and open interest collector.
 Collects real-time funding rate and open interest data via WebSocket.
 """
 import asyncio
-import json
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from typing import Any
 
+import orjson
 import websockets
-from websockets.client import WebSocketClientProtocol
+from websockets.asyncio.client import ClientConnection
 
 from src.collectors.base import BaseCollector
 from src.db.connection import get_asyncpg_pool, get_session
 from src.db.repositories import StarlistingRepository
-from src.utils.helpers import timestamp_to_datetime, truncate_to_minute, utc_now
+from src.utils.helpers import truncate_to_minute, utc_now
+
+# Appears in every activeAssetCtx channel message
+_ASSET_CTX_MARKER = b'"activeAssetCtx"'
+
+# Column order matches the rows built by _funding_rows and _oi_rows
+_INSERT_FUNDING_SQL = """
+    INSERT INTO funding_rates (
+        trading_pair_id, time, funding_rate, premium,
+        mark_price, index_price, oracle_price, mid_price, next_funding_time
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+    ON CONFLICT (trading_pair_id, time)
+    DO UPDATE SET
+        funding_rate = EXCLUDED.funding_rate,
+        premium = EXCLUDED.premium,
+        mark_price = EXCLUDED.mark_price,
+        index_price = EXCLUDED.index_price,
+        oracle_price = EXCLUDED.oracle_price,
+        mid_price = EXCLUDED.mid_price,
+        next_funding_time = EXCLUDED.next_funding_time
+"""
+
+_INSERT_OI_SQL = """
+    INSERT INTO open_interest (
+        trading_pair_id, time, open_interest, notional_value,
+        day_base_volume, day_notional_volume
+    )
+    VALUES ($1, $2, $3, $4, $5, $6)
+    ON CONFLICT (trading_pair_id, time)
+    DO UPDATE SET
+        open_interest = EXCLUDED.open_interest,
+        notional_value = EXCLUDED.notional_value,
+        day_base_volume = EXCLUDED.day_base_volume,
+        day_notional_volume = EXCLUDED.day_notional_volume
+"""
+
+
+def _to_decimal(value: str | None) -> Decimal | None:
+    """Parse an optional numeric string from Hyperliquid."""
+    return Decimal(value) if value is not None else None
+
+
+def _merge_slots(newer: list[tuple | None], older: list[tuple | None]) -> list[tuple | None]:
+    """
+    Merge buffer slots taken by a failed flush back into the current buffer.
+
+    Newer updates win. If the slot lists no longer line up (the buffers were
+    rebuilt while the flush was writing), the older slots are kept whole rather
+    than truncated; each slot carries its trading pair, so they still flush
+    correctly.
+    """
+    if len(newer) != len(older):
+        return older
+    return [new if new is not None else old for new, old in zip(newer, older, strict=True)]
 
 
 class HyperliquidFundingCollector(BaseCollector):
@@ -30,12 +84,16 @@ class HyperliquidFundingCollector(BaseCollector):
     def __init__(self):
         """Initialize Hyperliquid funding collector."""
         super().__init__("hyperliquid_funding")
-        self.ws: WebSocketClientProtocol | None = None
+        self.ws: ClientConnection | None = None
         self.subscriptions: dict[str, int] = {}  # coin -> trading_pair_id mapping
-
-        # Buffering for 1-minute intervals
-        self.funding_buffer: dict[str, dict[str, Any]] = {}  # coin -> latest funding data
-        self.oi_buffer: dict[str, dict[str, Any]] = {}  # coin -> latest OI data
+        # coin -> (buffer slot, trading_pair_id of its canonical starlisting)
+        self._coin_slots: dict[str, tuple[int, int]] = {}
+
+        # Buffering for 1-minute intervals: one slot per coin (see _coin_slots),
+        # holding the latest raw values (see _extract_ctx), or None if nothing
+        # arrived yet
+        self.funding_buffer: list[tuple | None] = []
+        self.oi_buffer: list[tuple | None] = []
         self.flush_task: asyncio.Task | None = None
 
     async def initialize(self) -> None:
@@ -61,6 +119,8 @@ class HyperliquidFundingCollector(BaseCollector):
             if sl.exchange.name == "hyperliquid"
         ]
 
+        self._index_starlistings()
+
         self.logger.info(
             "Loaded starlistings",
             exchange=self.exchange_name,
@@ -70,6 +130,29 @@ class HyperliquidFundingCollector(BaseCollector):
         if not self.starlistings:
             self.logger.warning("No active starlistings found for exchange", exchange=self.exchange_name)
 
+    def _index_starlistings(self) -> None:
+        """
+        Map each coin to its buffer slot and trading pair, once, for per-message
+        lookups.
+
+        The trading pair comes from the coin's canonical (first) starlisting;
+        funding/OI are per trading pair, so any starlisting of the coin will do.
+        """
+        trading_pair_ids: dict[str, int] = {}
+        for starlisting in self.starlistings:
+            trading_pair_ids.setdefault(starlisting.coin.symbol, starlisting.trading_pair_id)
+
+        self._coin_slots = {
+            coin: (slot, trading_pair_id)
+            for slot, (coin, trading_pair_id) in enumerate(trading_pair_ids.items())
+        }
+        self._clear_buffers()
+
+    def _clear_buffers(self) -> None:
+        """Empty every buffer slot."""
+        self.funding_buffer = [None] * len(self._coin_slots)
+        self.oi_buffer = [None] * len(self._coin_slots)
+
     async def connect(self) -> None:
         """Connect to Hyperliquid WebSocket API."""
         self.logger.info("Connecting to Hyperliquid WebSocket for funding data", url=self.WEBSOCKET_URL)
@@ -80,6 +163,12 @@ class HyperliquidFundingCollector(BaseCollector):
                 ping_interval=20,
                 ping_timeout=10,
                 close_timeout=10,
+                # Frames are a few hundred bytes; inflating them costs more CPU
+                # than the bandwidth it saves
+                compression=None,
+                # Frames are small, so buffer plenty of them before websockets
+                # pauses reading the socket (the default is 16)
+                max_queue=256,
             )
 
             self.logger.info("Connected to Hyperliquid WebSocket for funding")
@@ -116,8 +205,7 @@ class HyperliquidFundingCollector(BaseCollector):
                 self.ws = None
                 self.subscriptions.clear()
                 # Clear buffers
-                self.funding_buffer.clear()
-                self.oi_buffer.clear()
+                self._clear_buffers()
 
         await super().disconnect()
 
@@ -126,36 +214,36 @@ class HyperliquidFundingCollector(BaseCollector):
         if not self.ws:
             raise RuntimeError("WebSocket not connected")
 
-        # Get unique coins from starlistings
-        # Map coin to trading_pair_id (since funding/OI are per trading pair, not interval)
-        unique_coins = {}
-        for starlisting in self.starlistings:
-            coin = starlisting.coin.symbol
-            if coin not in unique_coins:
-                unique_coins[coin] = starlisting.trading_pair_id
-
-        for coin, trading_pair_id in unique_coins.items():
-            # Create subscription message
-            subscription = {
-                "method": "subscribe",
-                "subscription": {
-                    "type": "activeAssetCtx",
-                    "coin": coin,
-                },
-            }
-
-            # Send subscription
-            await self.ws.send(json.dumps(subscription))
+        # One subscription per unique coin, tracked by trading_pair_id (since
+        # funding/OI are per trading pair, not interval). Build every frame up
+        # front, then send them all at once rather than awaiting each in turn
+        frames = []
+        for coin, (_, trading_pair_id) in self._coin_slots.items():
+            frames.append(
+                orjson.dumps(
+                    {
+                        "method": "subscribe",
+                        "subscription": {
+                            "type": "activeAssetCtx",
+                            "coin": coin,
+                        },
+                    }
+                )
+            )
 
             # Track subscription
             self.subscriptions[coin] = trading_pair_id
 
             self.logger.info(
-                "Subscribed to asset context",
+                "Subscribing to asset context",
                 coin=coin,
                 trading_pair_id=trading_pair_id,
             )
 
+        # Send the UTF-8 bytes as text frames, as Hyperliquid expects
+        send = self.ws.send
+        await asyncio.gather(*(send(frame, text=True) for frame in frames))
+
         self.logger.info(
             "Subscribed to all asset contexts",
             subscription_count=len(self.subscriptions),
@@ -172,28 +260,50 @@ class HyperliquidFundingCollector(BaseCollector):
 
         self.logger.info("Starting funding data collection")
 
+        recv = self.ws.recv
+
         try:
-            async for message in self.ws:
+            while True:
+                # Take text frames as raw UTF-8 bytes, which orjson parses directly,
+                # rather than having websockets decode them to str first
+                try:
+                    message = await recv(decode=False)
+                except websockets.ConnectionClosedOK:
+                    # Normal closure ends collection, as iterating the connection would
+                    break
+
                 # Check if stop requested
                 if self._stop_event.is_set():
                     self.logger.info("Stop event detected, exiting collection loop")
                     break
 
+                # Frames that cannot be asset context updates (pongs and other
+                # channels) are dropped without being parsed. Subscription acks
+                # also name the type, so they still reach _process_message.
+                if _ASSET_CTX_MARKER not in message:
+                    if self.debug_enabled:
+                        self.logger.debug(
+                            "Skipped non-activeAssetCtx message",
+                            message=message[:200].decode(errors="replace"),
+                        )
+                    continue
+
                 try:
                     # Parse message
-                    data = json.loads(message)
+                    data = orjson.loads(message)
 
                     # Log message receipt
-                    self.logger.debug("Received WebSocket message", channel=data.get("channel"))
+                    if self.debug_enabled:
+                        self.logger.debug("Received WebSocket message", channel=data.get("channel"))
 
                     # Process asset context update
-                    await self._process_message(data)
+                    self._process_message(data)
 
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     self.logger.warning(
                         "Failed to parse WebSocket message",
                         error=str(e),
-                        message=message[:200],  # Log first 200 chars
+                        message=message[:200].decode(errors="replace"),  # Log first 200 bytes
                     )
                 except Exception as e:
                     self.logger.error(
@@ -217,17 +327,22 @@ class HyperliquidFundingCollector(BaseCollector):
             )
             raise
 
-    async def _process_message(self, data: dict[str, Any]) -> None:
+    def _process_message(self, data: dict[str, Any]) -> None:
         """
         Process a WebSocket message.
 
+        Synchronous: buffering an update never waits on I/O, so the collect loop
+        handles each frame inline, ahead of the next recv, without creating and
+        awaiting a coroutine.
+
         Args:
             data: Parsed JSON message from WebSocket
         """
         # Check if this is an activeAssetCtx update
         if data.get("channel") != "activeAssetCtx":
             # Not an asset context update, might be subscription confirmation
-            self.logger.debug("Received non-activeAssetCtx message", data=data)
+            if self.debug_enabled:
+                self.logger.debug("Received non-activeAssetCtx message", data=data)
             return
 
         # Extract message data
@@ -248,12 +363,11 @@ class HyperliquidFundingCollector(BaseCollector):
             self.logger.warning("Asset context missing ctx field", msg_data=msg_data)
             return
 
-        # Find all starlistings for this coin (there may be multiple intervals)
-        matching_starlistings = [
-            sl for sl in self.starlistings if sl.coin.symbol == coin
-        ]
+        # Get the coin's buffer slot and trading pair
+        # Funding/OI are per trading pair, not per interval
+        coin_slot = self._coin_slots.get(coin)
 
-        if not matching_starlistings:
+        if coin_slot is None:
             self.logger.warning(
                 "Received context for unknown coin",
                 coin=coin,
@@ -261,39 +375,27 @@ class HyperliquidFundingCollector(BaseCollector):
             return
 
         try:
-            current_time = utc_now()
+            slot, trading_pair_id = coin_slot
 
-            # Extract funding rate data
-            funding_data = self._extract_funding_data(ctx_data, current_time)
-
-            # Extract open interest data
-            oi_data = self._extract_open_interest_data(ctx_data, current_time)
-
-            # Get canonical starlisting (first one for this coin)
-            # Funding/OI are per trading pair, not per interval
-            canonical_starlisting = matching_starlistings[0]
+            # Extract funding rate and open interest data
+            funding_data, oi_data = self._extract_ctx(ctx_data, trading_pair_id)
 
             # Buffer data (will be flushed every minute)
             # Store the latest value for each coin - overwrites previous updates within the same minute
             if funding_data:
-                self.funding_buffer[coin] = {
-                    "trading_pair_id": canonical_starlisting.trading_pair_id,
-                    **funding_data,
-                }
+                self.funding_buffer[slot] = funding_data
 
             if oi_data:
-                self.oi_buffer[coin] = {
-                    "trading_pair_id": canonical_starlisting.trading_pair_id,
-                    **oi_data,
-                }
-
-            self.logger.debug(
-                "Buffered funding/OI data",
-                coin=coin,
-                trading_pair_id=canonical_starlisting.trading_pair_id,
-                funding_rate=str(funding_data.get("funding_rate")) if funding_data else None,
-                open_interest=str(oi_data.get("open_interest")) if oi_data else None,
-            )
+                self.oi_buffer[slot] = oi_data
+
+            if self.debug_enabled:
+                self.logger.debug(
+                    "Buffered funding/OI data",
+                    coin=coin,
+                    trading_pair_id=trading_pair_id,
+                    funding_rate=funding_data[1] if funding_data else None,
+                    open_interest=oi_data[1] if oi_data else None,
+                )
 
         except Exception as e:
             self.logger.error(
@@ -303,67 +405,130 @@ class HyperliquidFundingCollector(BaseCollector):
                 exc_info=True,
             )
 
-    def _extract_funding_data(
-        self, ctx_data: dict[str, Any], current_time: datetime
-    ) -> dict[str, Any] | None:
-        """Extract funding rate data from asset context."""
-        try:
-            funding_rate_str = ctx_data.get("funding")
-            if funding_rate_str is None:
-                return None
-
-            funding_data = {
-                "time": current_time,
-                "funding_rate": Decimal(funding_rate_str),
-                "premium": Decimal(ctx_data["premium"]) if "premium" in ctx_data else None,
-                "mark_price": Decimal(ctx_data["markPx"]) if "markPx" in ctx_data else None,
-                "index_price": Decimal(ctx_data["oraclePx"]) if "oraclePx" in ctx_data else None,
-                "oracle_price": Decimal(ctx_data["oraclePx"]) if "oraclePx" in ctx_data else None,
-                "mid_price": Decimal(ctx_data["midPx"]) if "midPx" in ctx_data else None,
-                "next_funding_time": None,  # Hyperliquid doesn't provide this in context
-            }
-
-            return funding_data
-
-        except (ValueError, KeyError) as e:
-            self.logger.warning(
-                "Failed to extract funding data",
-                error=str(e),
-                ctx_data=ctx_data,
+    def _extract_ctx(
+        self, ctx_data: dict[str, Any], trading_pair_id: int
+    ) -> tuple[tuple | None, tuple | None]:
+        """
+        Extract funding rate and open interest data from asset context.
+
+        Reads each field once for both. Values are kept as the raw strings
+        Hyperliquid sends: most updates are overwritten before the next flush,
+        so they are only parsed to Decimal for the rows actually written (see
+        _funding_rows and _oi_rows).
+
+        Returns:
+            Funding data (trading_pair_id, funding_rate, premium, mark_price,
+            oracle_price, mid_price), or None if the context has no funding
+            rate; and OI data (trading_pair_id, open_interest, mark_price,
+            day_base_volume, day_notional_volume), or None if it has no open
+            interest
+        """
+        get = ctx_data.get
+        funding_rate = get("funding")
+        open_interest = get("openInterest")
+        mark_price = get("markPx")
+
+        funding_data = None
+        if funding_rate is not None:
+            funding_data = (
+                trading_pair_id,
+                funding_rate,
+                get("premium"),
+                mark_price,
+                get("oraclePx"),  # Also stored as the index price
+                get("midPx"),
             )
-            return None
 
-    def _extract_open_interest_data(
-        self, ctx_data: dict[str, Any], current_time: datetime
-    ) -> dict[str, Any] | None:
-        """Extract open interest data from asset context."""
-        try:
-            oi_str = ctx_data.get("openInterest")
-            if oi_str is None:
-                return None
-
-            oi_data = {
-                "time": current_time,
-                "open_interest": Decimal(oi_str),
-                "notional_value": None,  # Calculate if we have price
-                "day_base_volume": Decimal(ctx_data["dayBaseVlm"]) if "dayBaseVlm" in ctx_data else None,
-                "day_notional_volume": Decimal(ctx_data["dayNtlVlm"]) if "dayNtlVlm" in ctx_data else None,
-            }
-
-            # Calculate notional value if we have mark price
-            if "markPx" in ctx_data and ctx_data["markPx"]:
-                mark_price = Decimal(ctx_data["markPx"])
-                oi_data["notional_value"] = oi_data["open_interest"] * mark_price
-
-            return oi_data
-
-        except (ValueError, KeyError) as e:
-            self.logger.warning(
-                "Failed to extract open interest data",
-                error=str(e),
-                ctx_data=ctx_data,
+        oi_data = None
+        if open_interest is not None:
+            oi_data = (
+                trading_pair_id,
+                open_interest,
+                mark_price or None,  # For the notional value
+                get("dayBaseVlm"),
+                get("dayNtlVlm"),
             )
-            return None
+
+        return funding_data, oi_data
+
+    def _funding_rows(self, funding_buffer: list[tuple | None], flush_time: datetime) -> list[tuple]:
+        """
+        Build funding_rates rows from the buffered raw values.
+
+        Args:
+            funding_buffer: Funding buffer slots to write
+            flush_time: Minute timestamp the rows are stored under
+
+        Returns:
+            Rows in INSERT column order; coins with unparseable values are skipped
+        """
+        rows = []
+        for funding_data in funding_buffer:
+            if funding_data is None:
+                continue
+            trading_pair_id, funding_rate, premium, mark, oracle, mid = funding_data
+            try:
+                # Hyperliquid's oracle price is the index price, so parse it once
+                oracle_price = _to_decimal(oracle)
+                rows.append(
+                    (
+                        trading_pair_id,
+                        flush_time,  # Use truncated minute timestamp
+                        Decimal(funding_rate),
+                        _to_decimal(premium),
+                        _to_decimal(mark),
+                        oracle_price,  # index_price
+                        oracle_price,
+                        _to_decimal(mid),
+                        None,  # next_funding_time: Hyperliquid doesn't provide this in context
+                    )
+                )
+            except (InvalidOperation, TypeError) as e:
+                self.logger.warning(
+                    "Dropping unparseable funding data",
+                    trading_pair_id=trading_pair_id,
+                    error=str(e),
+                    funding_data=funding_data,
+                )
+        return rows
+
+    def _oi_rows(self, oi_buffer: list[tuple | None], flush_time: datetime) -> list[tuple]:
+        """
+        Build open_interest rows from the buffered raw values.
+
+        Args:
+            oi_buffer: Open interest buffer slots to write
+            flush_time: Minute timestamp the rows are stored under
+
+        Returns:
+            Rows in INSERT column order; coins with unparseable values are skipped
+        """
+        rows = []
+        for oi_data in oi_buffer:
+            if oi_data is None:
+                continue
+            trading_pair_id, open_interest, mark, day_base_volume, day_notional_volume = oi_data
+            try:
+                open_interest = Decimal(open_interest)
+                mark_price = _to_decimal(mark)
+                rows.append(
+                    (
+                        trading_pair_id,
+                        flush_time,  # Use truncated minute timestamp
+                        open_interest,
+                        open_interest * mark_price if mark_price is not None else None,
+                        _to_decimal(day_base_volume),
+                        _to_decimal(day_notional_volume),
+                    )
+                )
+            except (InvalidOperation, TypeError) as e:
+                self.logger.warning(
+                    "Dropping unparseable open interest data",
+                    trading_pair_id=trading_pair_id,
+                    error=str(e),
+                    oi_data=oi_data,
+                )
+        return rows
 
     async def _start_flush_task(self) -> None:
         """Start the periodic flush task that runs every minute."""
@@ -392,16 +557,25 @@ class HyperliquidFundingCollector(BaseCollector):
         """
         Periodic flush loop that runs every minute on the minute boundary.
 
-        Flushes buffered funding/OI data to database every 60 seconds.
+        Flushes buffered funding/OI data to database every 60 seconds. Ticks are
+        scheduled on the event loop's monotonic clock from a single anchor, so
+        late wake-ups and slow flushes do not accumulate drift.
         """
+        loop = asyncio.get_running_loop()
+
+        # Anchor the first tick on the top of the next minute
+        now = utc_now()
+        next_tick = loop.time() + 60 - now.second - now.microsecond / 1_000_000
+
         while True:
             try:
-                # Calculate time to next minute boundary
-                now = utc_now()
-                seconds_until_next_minute = 60 - now.second
-
                 # Wait until the top of the next minute
-                await asyncio.sleep(seconds_until_next_minute)
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+                # Schedule the following tick, skipping any a slow flush overran
+                next_tick += 60
+                while next_tick <= loop.time():
+                    next_tick += 60
 
                 # Flush buffers
                 await self._flush_buffers()
@@ -416,7 +590,6 @@ class HyperliquidFundingCollector(BaseCollector):
                     exc_info=True,
                 )
                 # Continue on error, try again next minute
-                await asyncio.sleep(60)
 
     async def _flush_buffers(self) -> None:
         """
@@ -424,73 +597,37 @@ class HyperliquidFundingCollector(BaseCollector):
 
         Uses minute-precision timestamps (start of the current minute).
         """
-        if not self.funding_buffer and not self.oi_buffer:
+        funding_count = len(self.funding_buffer) - self.funding_buffer.count(None)
+        oi_count = len(self.oi_buffer) - self.oi_buffer.count(None)
+        if not funding_count and not oi_count:
             return
 
         # Get current minute (truncated timestamp)
         flush_time = truncate_to_minute(utc_now())
 
-        funding_count = len(self.funding_buffer)
-        oi_count = len(self.oi_buffer)
+        # Swap the buffers out so updates arriving during the write start a new batch
+        funding_buffer = self.funding_buffer
+        oi_buffer = self.oi_buffer
+        self._clear_buffers()
 
         try:
+            # Parse the latest value of each coin to Decimal, only now
+            funding_rows = self._funding_rows(funding_buffer, flush_time)
+            oi_rows = self._oi_rows(oi_buffer, flush_time)
+
             pool = await get_asyncpg_pool()
 
-            # Flush funding rates
-            if self.funding_buffer:
-                for coin, funding_data in self.funding_buffer.items():
-                    await pool.execute(
-                        """
-                        INSERT INTO funding_rates (
-                            trading_pair_id, time, funding_rate, premium,
-                            mark_price, index_price, oracle_price, mid_price, next_funding_time
-                        )
-                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                        ON CONFLICT (trading_pair_id, time)
-                        DO UPDATE SET
-                            funding_rate = EXCLUDED.funding_rate,
-                            premium = EXCLUDED.premium,
-                            mark_price = EXCLUDED.mark_price,
-                            index_price = EXCLUDED.index_price,
-                            oracle_price = EXCLUDED.oracle_price,
-                            mid_price = EXCLUDED.mid_price,
-                            next_funding_time = EXCLUDED.next_funding_time
-                        """,
-                        funding_data["trading_pair_id"],
-                        flush_time,  # Use truncated minute timestamp
-                        funding_data["funding_rate"],
-                        funding_data["premium"],
-                        funding_data["mark_price"],
-                        funding_data["index_price"],
-                        funding_data["oracle_price"],
-                        funding_data["mid_price"],
-                        funding_data["next_funding_time"],
-                    )
+            # Write both tables on one connection, in one transaction, so a flush
+            # is stored completely or not at all
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    # Flush funding rates, one round trip for all coins
+                    if funding_rows:
+                        await conn.executemany(_INSERT_FUNDING_SQL, funding_rows)
 
-            # Flush open interest
-            if self.oi_buffer:
-                for coin, oi_data in self.oi_buffer.items():
-                    await pool.execute(
-                        """
-                        INSERT INTO open_interest (
-                            trading_pair_id, time, open_interest, notional_value,
-                            day_base_volume, day_notional_volume
-                        )
-                        VALUES ($1, $2, $3, $4, $5, $6)
-                        ON CONFLICT (trading_pair_id, time)
-                        DO UPDATE SET
-                            open_interest = EXCLUDED.open_interest,
-                            notional_value = EXCLUDED.notional_value,
-                            day_base_volume = EXCLUDED.day_base_volume,
-                            day_notional_volume = EXCLUDED.day_notional_volume
-                        """,
-                        oi_data["trading_pair_id"],
-                        flush_time,  # Use truncated minute timestamp
-                        oi_data["open_interest"],
-                        oi_data["notional_value"],
-                        oi_data["day_base_volume"],
-                        oi_data["day_notional_volume"],
-                    )
+                    # Flush open interest, one round trip for all coins
+                    if oi_rows:
+                        await conn.executemany(_INSERT_OI_SQL, oi_rows)
 
             self.logger.info(
                 "Flushed buffers to database",
@@ -499,10 +636,6 @@ class HyperliquidFundingCollector(BaseCollector):
                 oi_count=oi_count,
             )
 
-            # Clear buffers after successful flush
-            self.funding_buffer.clear()
-            self.oi_buffer.clear()
-
         except Exception as e:
             self.logger.error(
                 "Failed to flush buffers",
@@ -511,4 +644,6 @@ class HyperliquidFundingCollector(BaseCollector):
                 oi_count=oi_count,
                 exc_info=True,
             )
-            # Don't clear buffers on error - will retry next minute
+            # Keep the data for the next flush, unless a newer update arrived
+            self.funding_buffer = _merge_slots(self.funding_buffer, funding_buffer)
+            self.oi_buffer = _merge_slots(self.oi_buffer, oi_buffer)
@@ -5,11 +5,12 @@ Orchestrates all exchange collectors.
 """
 import asyncio
 import signal
+import sys
 from typing import Any
 
 import structlog
 
-from src.collectors.base import BaseCollector
+from src.collectors.base import BaseCollector, CollectorStatus
 from src.collectors.hyperliquid import HyperliquidCollector
 from src.collectors.hyperliquid_funding import HyperliquidFundingCollector
 from src.config.loader import ConfigLoader
@@ -111,7 +112,7 @@ class CollectorManager:
             "total_collectors": len(self.collectors),
             "running_collectors": sum(
                 1 for c in self.collectors.values()
-                if c.status.value == "running"
+                if c.status is CollectorStatus.RUNNING
             ),
         }
 
@@ -122,7 +123,10 @@ async def main() -> None:
     setup_logging()
     logger = structlog.get_logger("kirby.collector")
 
-    logger.info("Starting Kirby Collector Service")
+    logger.info(
+        "Starting Kirby Collector Service",
+        event_loop=type(asyncio.get_running_loop()).__module__,
+    )
 
     # Initialize database connections
     await init_db()
@@ -190,8 +194,16 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # uvloop is a dependency everywhere except Windows, which it does not support
+    if sys.platform == "win32":
+        run = asyncio.run
+    else:
+        import uvloop
+
+        run = uvloop.run
+
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\nCollector service interrupted by user")
     except Exception as e:
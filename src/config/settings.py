@@ -34,6 +34,28 @@ class Settings(BaseSettings):
         le=50,
         description="Maximum overflow connections",
     )
+    database_pool_min_size: int = Field(
+        default=5,
+        ge=0,
+        le=100,
+        description="Connections the asyncpg pool opens up front and keeps warm",
+    )
+    database_statement_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        le=10000,
+        description="Prepared statements cached per asyncpg connection (0 disables)",
+    )
+    database_max_cached_statement_lifetime: float = Field(
+        default=0.0,
+        ge=0,
+        description="Seconds a cached prepared statement is kept, even while in use (0 keeps it)",
+    )
+    database_max_inactive_connection_lifetime: float = Field(
+        default=300.0,
+        ge=0,
+        description="Seconds an idle asyncpg connection is kept open (0 keeps it forever)",
+    )
 
     # TimescaleDB specific
     timescale_chunk_time_interval: str = Field(
@@ -114,6 +136,18 @@ class Settings(BaseSettings):
         default=True,
         description="Automatically backfill gaps after collector restart",
     )
+    collector_candle_flush_interval: float = Field(
+        default=0.2,
+        ge=0.01,
+        le=60.0,
+        description="Maximum time candle updates are buffered before being written (seconds)",
+    )
+    collector_candle_batch_size: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Number of buffered candles that triggers an early write",
+    )
 
     # Rate Limiting
     hyperliquid_rate_limit_per_second: int = Field(
@@ -165,6 +199,25 @@ class Settings(BaseSettings):
         le=10485760,  # 10MB
         description="Maximum WebSocket message size (bytes)",
     )
+    websocket_send_queue_size: int = Field(
+        default=1000,
+        ge=10,
+        le=100000,
+        description="Maximum pending outbound messages per WebSocket client before it is dropped",
+    )
+    websocket_compression_threshold: int = Field(
+        default=4096,
+        ge=256,
+        le=10485760,  # 10MB
+        description="Minimum historical batch size (bytes) zlib-compressed for clients that opt in",
+    )
+    websocket_raw_frames: bool = Field(
+        default=False,
+        description=(
+            "Write shared real-time frames directly to the transport "
+            "(uvicorn websockets-sansio only, without per-message deflate)"
+        ),
+    )
 
     @property
     def database_url_str(self) -> str:
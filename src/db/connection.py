@@ -10,6 +10,7 @@ from src.config.settings import settings
 _asyncpg_pool: asyncpg.Pool | None = None
 _sqlalchemy_engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
+_readonly_session_factory: async_sessionmaker[AsyncSession] | None = None
 
 
 async def get_asyncpg_pool() -> asyncpg.Pool:
@@ -22,11 +23,16 @@ async def get_asyncpg_pool() -> asyncpg.Pool:
     if _asyncpg_pool is None:
         _asyncpg_pool = await asyncpg.create_pool(
             dsn=settings.asyncpg_url_str,
-            min_size=5,
+            min_size=min(settings.database_pool_min_size, settings.database_pool_size),
             max_size=settings.database_pool_size,
             command_timeout=60,
             max_queries=50000,
-            max_cached_statement_lifetime=300,
+            # Keep the upsert statements prepared on every connection. The
+            # lifetime is not renewed by use, so a limit re-prepares statements
+            # that are still being executed every minute
+            statement_cache_size=settings.database_statement_cache_size,
+            max_cached_statement_lifetime=settings.database_max_cached_statement_lifetime,
+            max_inactive_connection_lifetime=settings.database_max_inactive_connection_lifetime,
         )
 
     return _asyncpg_pool
@@ -98,7 +104,15 @@ async def get_session() -> AsyncSession:
     Get a new SQLAlchemy async session.
 
     Usage:
-        async with get_session() as session:
+        session = await get_session()
+        try:
+            # Use session here
+            pass
+        finally:
+            await session.close()
+
+    For one-shot use, prefer the factory as a context manager:
+        async with get_session_factory()() as session:
             # Use session here
             pass
     """
@@ -106,6 +120,42 @@ async def get_session() -> AsyncSession:
     return session_factory()
 
 
+def get_readonly_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Get or create the factory for read-only SQLAlchemy sessions.
+
+    Sessions share the main engine's pool, but every transaction they begin is
+    declared READ ONLY, so Postgres skips write bookkeeping for them. The
+    transaction itself is kept (rather than AUTOCOMMIT) because streamed
+    results rely on server-side cursors, which only live inside a transaction.
+    """
+    global _readonly_session_factory
+
+    if _readonly_session_factory is None:
+        engine = get_sqlalchemy_engine().execution_options(postgresql_readonly=True)
+        _readonly_session_factory = async_sessionmaker(
+            engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+            autocommit=False,
+        )
+
+    return _readonly_session_factory
+
+
+async def get_readonly_session() -> AsyncSession:
+    """
+    Get a new read-only SQLAlchemy async session.
+
+    Used for query-only paths such as WebSocket subscribe validation and
+    historical data fetches. Any write attempted through it is rejected by
+    the database.
+    """
+    session_factory = get_readonly_session_factory()
+    return session_factory()
+
+
 async def init_db() -> None:
     """Initialize database connections."""
     await get_asyncpg_pool()
@@ -232,6 +232,33 @@ class CandleRepository:
     Uses asyncpg for high-performance bulk inserts.
     """
 
+    # Batches at least this large are upserted through COPY instead of executemany
+    COPY_UPSERT_THRESHOLD = 250
+
+    CANDLE_COLUMNS = ["time", "starlisting_id", "open", "high", "low", "close", "volume", "num_trades"]
+
+    _ON_CONFLICT = """
+        ON CONFLICT (time, starlisting_id)
+        DO UPDATE SET
+            open = EXCLUDED.open,
+            high = EXCLUDED.high,
+            low = EXCLUDED.low,
+            close = EXCLUDED.close,
+            volume = EXCLUDED.volume,
+            num_trades = COALESCE(EXCLUDED.num_trades, candles.num_trades)
+    """
+
+    UPSERT_QUERY = """
+        INSERT INTO candles (time, starlisting_id, open, high, low, close, volume, num_trades)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    """ + _ON_CONFLICT
+
+    MERGE_STAGE_QUERY = """
+        INSERT INTO candles (time, starlisting_id, open, high, low, close, volume, num_trades)
+        SELECT time, starlisting_id, open, high, low, close, volume, num_trades
+        FROM candles_stage
+    """ + _ON_CONFLICT
+
     def __init__(self, pool: asyncpg.Pool):
         self.pool = pool
 
@@ -269,11 +296,34 @@ class CandleRepository:
             result = await conn.copy_records_to_table(
                 "candles",
                 records=records,
-                columns=["time", "starlisting_id", "open", "high", "low", "close", "volume", "num_trades"],
+                columns=self.CANDLE_COLUMNS,
             )
 
         return len(records)
 
+    @staticmethod
+    def to_record(candle: dict, starlisting_id: int | None = None) -> tuple:
+        """
+        Convert a candle dictionary to a record in CANDLE_COLUMNS order.
+
+        Args:
+            candle: Candle dictionary
+            starlisting_id: Starlisting ID to use instead of the candle's own
+
+        Returns:
+            Record tuple for upsert_records
+        """
+        return (
+            candle["time"],
+            candle["starlisting_id"] if starlisting_id is None else starlisting_id,
+            Decimal(str(candle["open"])),
+            Decimal(str(candle["high"])),
+            Decimal(str(candle["low"])),
+            Decimal(str(candle["close"])),
+            Decimal(str(candle["volume"])),
+            candle.get("num_trades"),
+        )
+
     async def upsert_candles(self, candles: List[dict]) -> int:
         """
         Upsert candles (insert or update on conflict).
@@ -284,41 +334,60 @@ class CandleRepository:
         Returns:
             Number of rows affected
         """
-        if not candles:
-            return 0
+        to_record = self.to_record
+        return await self.upsert_records([to_record(candle) for candle in candles])
 
-        query = """
-            INSERT INTO candles (time, starlisting_id, open, high, low, close, volume, num_trades)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            ON CONFLICT (time, starlisting_id)
-            DO UPDATE SET
-                open = EXCLUDED.open,
-                high = EXCLUDED.high,
-                low = EXCLUDED.low,
-                close = EXCLUDED.close,
-                volume = EXCLUDED.volume,
-                num_trades = COALESCE(EXCLUDED.num_trades, candles.num_trades)
+    async def upsert_records(self, records: List[tuple]) -> int:
+        """
+        Upsert candle records (insert or update on conflict).
+
+        Batches of COPY_UPSERT_THRESHOLD records or more are COPYed into a
+        temporary staging table and merged with a single INSERT ... SELECT, which
+        is much faster than executemany for bulk loads. Smaller batches use
+        executemany.
+
+        Args:
+            records: Candle records in CANDLE_COLUMNS order (see to_record)
+
+        Returns:
+            Number of rows affected
         """
+        if not records:
+            return 0
 
         async with self.pool.acquire() as conn:
-            await conn.executemany(
-                query,
-                [
-                    (
-                        candle["time"],
-                        candle["starlisting_id"],
-                        Decimal(str(candle["open"])),
-                        Decimal(str(candle["high"])),
-                        Decimal(str(candle["low"])),
-                        Decimal(str(candle["close"])),
-                        Decimal(str(candle["volume"])),
-                        candle.get("num_trades"),
-                    )
-                    for candle in candles
-                ],
-            )
+            if len(records) >= self.COPY_UPSERT_THRESHOLD:
+                await self._copy_upsert(conn, records)
+            else:
+                await conn.executemany(self.UPSERT_QUERY, records)
+
+        return len(records)
+
+    async def _copy_upsert(self, conn: asyncpg.Connection, records: List[tuple]) -> None:
+        """
+        Upsert candle records through a COPY into a staging table.
 
-        return len(candles)
+        Args:
+            conn: Connection to run the upsert on
+            records: Candle records in CANDLE_COLUMNS order
+        """
+        # A single INSERT cannot update the same row twice, so keep only the last
+        # record of each candle, as executemany would have
+        records = list({(record[0], record[1]): record for record in records}.values())
+
+        async with conn.transaction():
+            await conn.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS candles_stage
+                (LIKE candles INCLUDING DEFAULTS) ON COMMIT DELETE ROWS
+                """
+            )
+            await conn.copy_records_to_table(
+                "candles_stage",
+                records=records,
+                columns=self.CANDLE_COLUMNS,
+            )
+            await conn.execute(self.MERGE_STAGE_QUERY)
 
     async def get_latest_candle(
         self,
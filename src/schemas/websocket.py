@@ -46,6 +46,21 @@ class WebSocketSubscribeMessage(BaseModel):
         le=1000,
         description="Optional: Number of historical candles to send (0-1000)",
     )
+    compress: bool = Field(
+        False,
+        description=(
+            "Optional: Accept zlib-compressed binary frames for large historical batches"
+        ),
+    )
+    chunk_size: int | None = Field(
+        None,
+        ge=100,
+        le=1000,
+        description=(
+            "Optional: Stream history in chunks of this many records (100-1000) "
+            "instead of one message per data type"
+        ),
+    )
 
     @field_validator("starlisting_ids")
     @classmethod
@@ -311,6 +326,12 @@ class WebSocketHistoricalDataMessage(BaseModel):
     market_type: str = Field(..., description="Market type")
     interval: str = Field(..., description="Time interval")
     count: int = Field(..., description="Number of candles in data")
+    seq: int | None = Field(
+        None, description="Chunk sequence number (chunked history only)"
+    )
+    final: bool | None = Field(
+        None, description="Whether this is the last chunk (chunked history only)"
+    )
     data: list[CandleResponse] = Field(..., description="Historical candle data")
 
 
@@ -364,6 +385,12 @@ class WebSocketHistoricalFundingMessage(BaseModel):
     trading_pair: str = Field(..., description="Trading pair (e.g., BTC/USD)")
     market_type: str = Field(..., description="Market type")
     count: int = Field(..., description="Number of funding rate snapshots in data")
+    seq: int | None = Field(
+        None, description="Chunk sequence number (chunked history only)"
+    )
+    final: bool | None = Field(
+        None, description="Whether this is the last chunk (chunked history only)"
+    )
     data: list[FundingRateResponse] = Field(..., description="Historical funding rate data")
 
 
@@ -416,4 +443,10 @@ class WebSocketHistoricalOIMessage(BaseModel):
     trading_pair: str = Field(..., description="Trading pair (e.g., BTC/USD)")
     market_type: str = Field(..., description="Market type")
     count: int = Field(..., description="Number of open interest snapshots in data")
+    seq: int | None = Field(
+        None, description="Chunk sequence number (chunked history only)"
+    )
+    final: bool | None = Field(
+        None, description="Whether this is the last chunk (chunked history only)"
+    )
     data: list[OpenInterestResponse] = Field(..., description="Historical open interest data")
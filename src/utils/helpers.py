@@ -137,30 +137,44 @@ def validate_candle(candle: dict[str, Any]) -> bool:
             return False
 
         # Convert to float for validation
-        o = float(candle["open"])
-        h = float(candle["high"])
-        l = float(candle["low"])
-        c = float(candle["close"])
-        v = float(candle["volume"])
-
-        # Basic consistency checks
-        if h < l:  # High must be >= low
-            return False
-        if h < o or h < c:  # High must be >= open and close
-            return False
-        if l > o or l > c:  # Low must be <= open and close
-            return False
-        if o <= 0 or h <= 0 or l <= 0 or c <= 0:  # Prices must be positive
-            return False
-        if v < 0:  # Volume must be non-negative
-            return False
-
-        return True
+        return validate_ohlcv(
+            float(candle["open"]),
+            float(candle["high"]),
+            float(candle["low"]),
+            float(candle["close"]),
+            float(candle["volume"]),
+        )
 
     except (ValueError, TypeError, KeyError):
         return False
 
 
+def validate_ohlcv(
+    open_: float, high: float, low: float, close: float, volume: float
+) -> bool:
+    """
+    Check OHLCV values for basic consistency.
+
+    Fast path of validate_candle for callers that already hold the values as
+    floats, such as collectors validating freshly normalized candles.
+
+    Args:
+        open_: Open price
+        high: High price
+        low: Low price
+        close: Close price
+        volume: Volume
+
+    Returns:
+        True if prices are positive, low <= open/close <= high and volume >= 0
+    """
+    return (
+        0 < low <= open_ <= high
+        and low <= close <= high
+        and volume >= 0
+    )
+
+
 def interval_to_seconds(interval: str) -> int:
     """
     Convert interval string to seconds.
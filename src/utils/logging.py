@@ -25,8 +25,10 @@ def setup_logging() -> None:
         level=getattr(logging, settings.log_level.upper()),
     )
 
-    # Processors for structlog
+    # Processors for structlog (events below the log level are dropped first, before
+    # any timestamping or rendering work is done for them)
     shared_processors = [
+        structlog.stdlib.filter_by_level,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
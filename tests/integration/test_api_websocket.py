@@ -13,6 +13,8 @@ from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.main import app
+from src.api.middleware.auth import invalidate_api_key_cache
+from src.api.starlisting_cache import clear_starlisting_cache
 from src.db.models import Candle
 
 
@@ -23,6 +25,9 @@ class TestWebSocketEndpoint:
     @pytest.fixture
     def sync_client(self):
         """Create a synchronous test client for WebSocket testing."""
+        # Starlisting and API key IDs are reused across tests, so start with cold caches
+        clear_starlisting_cache()
+        invalidate_api_key_cache()
         return TestClient(app)
 
     @pytest.mark.asyncio
@@ -141,8 +146,11 @@ class TestWebSocketEndpoint:
             success_response = websocket.receive_json()
             assert success_response["type"] == "success"
 
-            # Receive historical data
-            historical_response = websocket.receive_json()
+            # Receive historical data (delivered as a single batch frame)
+            batch_response = websocket.receive_json()
+            assert batch_response["type"] == "batch"
+
+            historical_response = batch_response["messages"][0]
 
             assert historical_response["type"] == "historical"
             assert historical_response["starlisting_id"] == starlisting.id
@@ -205,6 +213,20 @@ class TestWebSocketEndpoint:
             assert response["type"] == "pong"
             assert "timestamp" in response
 
+    @pytest.mark.asyncio
+    async def test_websocket_binary_json_message(
+        self, sync_client, seed_base_data, seed_starlistings
+    ):
+        """Test that JSON sent in a binary frame is accepted."""
+        with sync_client.websocket_connect("/ws") as websocket:
+            # Send ping as binary JSON
+            websocket.send_bytes(b'{"action": "ping"}')
+
+            # Receive pong
+            response = websocket.receive_json()
+
+            assert response["type"] == "pong"
+
     @pytest.mark.asyncio
     async def test_websocket_invalid_action(
         self, sync_client, seed_base_data, seed_starlistings
@@ -0,0 +1,88 @@
+"""
+Unit tests for the cached API key validation used by WebSocket connects.
+"""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.api.middleware import auth
+from src.api.middleware.auth import invalidate_api_key_cache, validate_api_key_cached
+from src.utils.auth import hash_api_key
+
+
+class TestValidateApiKeyCached:
+    """Test validate_api_key_cached."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start and end every test with an empty cache."""
+        invalidate_api_key_cache()
+        yield
+        invalidate_api_key_cache()
+
+    @staticmethod
+    def _make_key(expires_at=None):
+        """Create a (user, api_key) pair as returned by validate_api_key."""
+        user = MagicMock(id=1)
+        api_key = MagicMock(id=2, expires_at=expires_at)
+        return user, api_key
+
+    @pytest.mark.asyncio
+    async def test_second_validation_skips_database(self):
+        """Test that a recently validated key is served from the cache."""
+        user, api_key = self._make_key()
+        session = MagicMock()
+
+        with patch.object(
+            auth, "validate_api_key", AsyncMock(return_value=(user, api_key))
+        ) as validate:
+            first = await validate_api_key_cached(session, "kb_test")
+            second = await validate_api_key_cached(session, "kb_test")
+
+        assert first == second == (user, api_key)
+        validate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_validation_not_cached(self):
+        """Test that rejected keys are checked against the database every time."""
+        session = MagicMock()
+
+        with patch.object(
+            auth, "validate_api_key", AsyncMock(side_effect=ValueError("Invalid API key"))
+        ) as validate:
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    await validate_api_key_cached(session, "kb_bad")
+
+        assert validate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidated_key_revalidated(self):
+        """Test that evicting a key forces the next validation to hit the database."""
+        user, api_key = self._make_key()
+        session = MagicMock()
+
+        with patch.object(
+            auth, "validate_api_key", AsyncMock(return_value=(user, api_key))
+        ) as validate:
+            await validate_api_key_cached(session, "kb_test")
+            invalidate_api_key_cache(hash_api_key("kb_test"))
+            await validate_api_key_cached(session, "kb_test")
+
+        assert validate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_key_revalidated(self):
+        """Test that a cached key past its expiry is not served from the cache."""
+        user, api_key = self._make_key()
+        session = MagicMock()
+
+        with patch.object(
+            auth, "validate_api_key", AsyncMock(return_value=(user, api_key))
+        ) as validate:
+            await validate_api_key_cached(session, "kb_test")
+            api_key.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+            await validate_api_key_cached(session, "kb_test")
+
+        assert validate.await_count == 2
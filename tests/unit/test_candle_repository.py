@@ -0,0 +1,95 @@
+"""Unit tests for CandleRepository write paths."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.db.repositories import CandleRepository
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _candles(count: int, starlisting_id: int = 1) -> list[dict]:
+    """Build consecutive one-minute candles."""
+    return [
+        {
+            "time": START + timedelta(minutes=i),
+            "starlisting_id": starlisting_id,
+            "open": 100.0,
+            "high": 110.0,
+            "low": 90.0,
+            "close": 105.0,
+            "volume": 5.0,
+            "num_trades": 10,
+        }
+        for i in range(count)
+    ]
+
+
+class TestUpsertCandles:
+    """Test CandleRepository.upsert_candles."""
+
+    @pytest.fixture
+    def conn(self):
+        """Create a mocked asyncpg connection."""
+        conn = MagicMock()
+        conn.executemany = AsyncMock()
+        conn.execute = AsyncMock()
+        conn.copy_records_to_table = AsyncMock()
+
+        @asynccontextmanager
+        async def transaction():
+            yield
+
+        conn.transaction = transaction
+        return conn
+
+    @pytest.fixture
+    def repo(self, conn):
+        """Create a repository whose pool hands out the mocked connection."""
+
+        @asynccontextmanager
+        async def acquire():
+            yield conn
+
+        pool = MagicMock()
+        pool.acquire = acquire
+        return CandleRepository(pool)
+
+    @pytest.mark.asyncio
+    async def test_small_batch_uses_executemany(self, repo, conn):
+        """Test that batches below the threshold are upserted with executemany."""
+        count = await repo.upsert_candles(_candles(3))
+
+        assert count == 3
+        conn.executemany.assert_awaited_once()
+        # The same query string every time, so asyncpg's statement cache hits
+        assert conn.executemany.await_args.args[0] is CandleRepository.UPSERT_QUERY
+        conn.copy_records_to_table.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_large_batch_copied_through_staging_table(self, repo, conn):
+        """Test that large batches are COPYed to the staging table and merged."""
+        count = await repo.upsert_candles(_candles(CandleRepository.COPY_UPSERT_THRESHOLD))
+
+        assert count == CandleRepository.COPY_UPSERT_THRESHOLD
+        conn.executemany.assert_not_awaited()
+        table = conn.copy_records_to_table.await_args.args[0]
+        records = conn.copy_records_to_table.await_args.kwargs["records"]
+        assert table == "candles_stage"
+        assert len(records) == CandleRepository.COPY_UPSERT_THRESHOLD
+        assert conn.execute.await_args.args[0] == CandleRepository.MERGE_STAGE_QUERY
+
+    @pytest.mark.asyncio
+    async def test_large_batch_keeps_last_update_of_each_candle(self, repo, conn):
+        """Test that duplicate candles in a COPY batch are reduced to the last one."""
+        candles = _candles(CandleRepository.COPY_UPSERT_THRESHOLD)
+        candles.append({**candles[0], "close": 107.0})
+
+        await repo.upsert_candles(candles)
+
+        records = conn.copy_records_to_table.await_args.kwargs["records"]
+        assert len(records) == CandleRepository.COPY_UPSERT_THRESHOLD
+        assert [r[5] for r in records if r[0] == START] == [107]
@@ -12,6 +12,7 @@ from src.utils.helpers import (
     timestamp_to_datetime,
     utc_now,
     validate_candle,
+    validate_ohlcv,
 )
 
 
@@ -234,6 +235,26 @@ class TestValidateCandle:
         assert validate_candle(candle) is True
 
 
+class TestValidateOhlcv:
+    """Test the float-only OHLCV consistency check."""
+
+    def test_validate_consistent_values(self):
+        """Test that consistent values pass validation."""
+        assert validate_ohlcv(40000.0, 40500.0, 39800.0, 40200.0, 0.0) is True
+
+    def test_validate_close_above_high(self):
+        """Test that close > high fails validation."""
+        assert validate_ohlcv(40000.0, 40500.0, 39800.0, 40600.0, 1.0) is False
+
+    def test_validate_non_positive_low(self):
+        """Test that a non-positive low fails validation."""
+        assert validate_ohlcv(40000.0, 40500.0, 0.0, 40200.0, 1.0) is False
+
+    def test_validate_nan_price(self):
+        """Test that NaN prices fail validation."""
+        assert validate_ohlcv(float("nan"), 40500.0, 39800.0, 40200.0, 1.0) is False
+
+
 class TestIntervalToSeconds:
     """Test interval string to seconds conversion."""
 
@@ -0,0 +1,263 @@
+"""Unit tests for the Hyperliquid candle collector."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+
+from src.collectors import base
+from src.collectors.base import CollectorStatus
+from src.collectors.hyperliquid import HyperliquidCollector, _normalize_hl
+from src.utils.helpers import normalize_candle_data
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _candle_message(close: str, start_ms: int = 1700000000000) -> dict:
+    """Build a Hyperliquid candle channel message."""
+    return {
+        "channel": "candle",
+        "data": {
+            "t": start_ms,
+            "T": start_ms + 59999,
+            "s": "BTC",
+            "i": "1m",
+            "o": "100.0",
+            "c": close,
+            "h": "110.0",
+            "l": "90.0",
+            "v": "5.0",
+            "n": 10,
+        },
+    }
+
+
+def _candle(starlisting_id: int | None = None) -> dict:
+    """Build a normalized candle."""
+    candle = {
+        "time": NOW,
+        "open": 100.0,
+        "high": 110.0,
+        "low": 90.0,
+        "close": 105.0,
+        "volume": 5.0,
+        "num_trades": 10,
+    }
+    if starlisting_id is not None:
+        candle["starlisting_id"] = starlisting_id
+    return candle
+
+
+class TestNormalizeHl:
+    """Test the Hyperliquid-specific candle normalizer."""
+
+    def test_matches_generic_normalizer(self):
+        """Test that _normalize_hl agrees with normalize_candle_data."""
+        raw = _candle_message("101.5")["data"]
+
+        assert _normalize_hl(raw) == normalize_candle_data(raw, source="hyperliquid")
+
+
+class TestCandleBuffering:
+    """Test batching of candle updates before they are written."""
+
+    @pytest.fixture
+    def collector(self):
+        """Create a collector subscribed to BTC 1m, with storage mocked out."""
+        collector = HyperliquidCollector()
+        collector.subscriptions[("BTC", "1m")] = 7
+        collector.store_candles = AsyncMock(return_value=1)
+        return collector
+
+    @pytest.mark.asyncio
+    async def test_updates_buffered_until_flush(self, collector):
+        """Test that candle updates are not written as they arrive."""
+        collector._process_message(_candle_message("101.0"))
+
+        collector.store_candles.assert_not_awaited()
+        assert len(collector.candle_buffer) == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_keeps_latest_update_of_each_candle(self, collector):
+        """Test that repeated updates of one candle are written once, latest first."""
+        collector._process_message(_candle_message("101.0"))
+        collector._process_message(_candle_message("102.0"))
+        collector._process_message(_candle_message("103.0", 1700000060000))
+
+        await collector._flush_buffer()
+
+        (candles,) = collector.store_candles.await_args.args
+        assert [str(c["close"]) for c in candles] == ["102.0", "103.0"]
+        assert all(c["starlisting_id"] == 7 for c in candles)
+        assert collector.candle_buffer == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_candles(self, collector):
+        """Test that candles are retried on the next flush if the write fails."""
+        collector.store_candles.side_effect = Exception("database unavailable")
+        collector._process_message(_candle_message("101.0"))
+
+        await collector._flush_buffer()
+
+        assert len(collector.candle_buffer) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("message", "warning"),
+        [
+            ({"channel": "candle"}, "Candle message missing data field"),
+            ({"channel": "candle", "data": {"s": "BTC"}}, "Candle data missing coin or interval"),
+            (
+                {"channel": "candle", "data": {"s": "ETH", "i": "1m"}},
+                "Received candle for unknown subscription",
+            ),
+        ],
+    )
+    async def test_unmatched_candle_rejected(self, collector, message, warning):
+        """Test that malformed or unsubscribed candles are logged and dropped."""
+        collector.logger = MagicMock()
+
+        collector._process_message(message)
+
+        assert collector.candle_buffer == {}
+        assert collector.logger.warning.call_args.args == (warning,)
+
+    @pytest.mark.asyncio
+    async def test_stalled_write_does_not_block_messages(self, collector):
+        """Test that messages keep being processed while a write is in progress."""
+        release = asyncio.Event()
+
+        async def stalled_store(candles):
+            await release.wait()
+            return len(candles)
+
+        collector.store_candles = AsyncMock(side_effect=stalled_store)
+        collector._process_message(_candle_message("101.0"))
+        flush = asyncio.create_task(collector._flush_buffer())
+        await asyncio.sleep(0)
+
+        collector._process_message(_candle_message("102.0"))
+
+        assert [str(c["close"]) for c in collector.candle_buffer.values()] == ["102.0"]
+        release.set()
+        await flush
+
+
+class TestSubscribe:
+    """Test candle subscription setup."""
+
+    @pytest.mark.asyncio
+    async def test_subscribes_every_starlisting_as_text_frames(self):
+        """Test that one text subscription frame is sent per starlisting."""
+        collector = HyperliquidCollector()
+        collector.ws = MagicMock()
+        collector.ws.send = AsyncMock()
+        collector.starlistings = [
+            MagicMock(id=7, coin=MagicMock(symbol="BTC"), interval=MagicMock()),
+            MagicMock(id=8, coin=MagicMock(symbol="ETH"), interval=MagicMock()),
+        ]
+        collector.starlistings[0].interval.name = "1m"
+        collector.starlistings[1].interval.name = "5m"
+
+        await collector._subscribe_to_candles()
+
+        sent = [
+            (orjson.loads(call.args[0])["subscription"], call.kwargs)
+            for call in collector.ws.send.await_args_list
+        ]
+        assert sent == [
+            ({"type": "candle", "coin": "BTC", "interval": "1m"}, {"text": True}),
+            ({"type": "candle", "coin": "ETH", "interval": "5m"}, {"text": True}),
+        ]
+        assert collector.subscriptions == {("BTC", "1m"): 7, ("ETH", "5m"): 8}
+
+
+class TestStoreCandles:
+    """Test BaseCollector.store_candles as used by the candle flush."""
+
+    @staticmethod
+    def _collector():
+        """Create a collector with its candle repository mocked out."""
+        collector = HyperliquidCollector()
+        collector.candle_repo = MagicMock()
+        collector.candle_repo.upsert_records = AsyncMock(return_value=3)
+        return collector
+
+    @pytest.mark.asyncio
+    async def test_repository_created_once_across_flushes(self):
+        """Test that the candle repository, and so its pool, is reused between writes."""
+        collector = HyperliquidCollector()
+        pool = MagicMock()
+
+        with patch.object(base, "get_asyncpg_pool", AsyncMock(return_value=pool)) as get_pool, patch.object(
+            base.CandleRepository, "upsert_records", AsyncMock(return_value=1)
+        ):
+            await collector.store_candles([_candle(7)])
+            repo = collector.candle_repo
+            await collector.store_candles([_candle(7)])
+
+        get_pool.assert_awaited_once()
+        assert collector.candle_repo is repo
+        assert repo.pool is pool
+
+    @pytest.mark.asyncio
+    async def test_starlisting_id_overrides_without_mutating_candles(self):
+        """Test that an explicit starlisting_id is applied to the rows, not the dicts."""
+        collector = self._collector()
+        candles = [_candle()]
+
+        await collector.store_candles(candles, starlisting_id=9)
+
+        (records,) = collector.candle_repo.upsert_records.await_args.args
+        assert records[0][:2] == (NOW, 9)
+        assert "starlisting_id" not in candles[0]
+
+    @pytest.mark.asyncio
+    async def test_collection_time_sampled_once_per_batch(self):
+        """Test that the clock is read once per stored batch, not per candle."""
+        collector = self._collector()
+        candles = [_candle(7) for _ in range(3)]
+
+        with patch.object(base, "utc_now", return_value=NOW) as utc_now:
+            count = await collector.store_candles(candles)
+
+        assert count == 3
+        utc_now.assert_called_once()
+        assert collector.last_collection_time == NOW
+
+
+class TestStartLoop:
+    """Test the BaseCollector.start retry loop."""
+
+    @pytest.mark.asyncio
+    async def test_disconnects_once_per_failure_and_once_on_exit(self):
+        """Test that the connection is closed after a failure and when the loop ends."""
+        collector = HyperliquidCollector()
+        collector.connect = AsyncMock()
+        collector.disconnect = AsyncMock()
+
+        async def collect():
+            if collector.collect.await_count == 1:
+                raise ConnectionError("connection lost")
+            collector._stop_event.set()
+
+        collector.collect = AsyncMock(side_effect=collect)
+
+        with patch.object(base.settings, "collector_restart_delay", 0):
+            await collector.start()
+
+        assert collector.connect.await_count == 2
+        assert collector.disconnect.await_count == 2
+
+    def test_health_reports_status_label(self):
+        """Test that health checks report the status as its lowercase name."""
+        collector = HyperliquidCollector()
+        collector.status = CollectorStatus.RUNNING
+        collector._connection_healthy = True
+
+        health = collector.get_health()
+
+        assert health["status"] == "running"
+        assert health["healthy"] is True
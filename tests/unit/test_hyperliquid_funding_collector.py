@@ -0,0 +1,337 @@
+"""Unit tests for the Hyperliquid funding rate and open interest collector."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+import websockets
+
+from src.collectors import hyperliquid_funding
+from src.collectors.hyperliquid_funding import HyperliquidFundingCollector
+
+
+def _starlisting(coin: str, trading_pair_id: int, starlisting_id: int = 1) -> MagicMock:
+    """Create a starlisting stand-in for the given coin."""
+    starlisting = MagicMock(id=starlisting_id, trading_pair_id=trading_pair_id)
+    starlisting.coin.symbol = coin
+    return starlisting
+
+
+def _ctx_message(coin: str, funding: str = "0.0001", open_interest: str = "1000") -> dict:
+    """Build a Hyperliquid activeAssetCtx channel message."""
+    return {
+        "channel": "activeAssetCtx",
+        "data": {
+            "coin": coin,
+            "ctx": {
+                "funding": funding,
+                "premium": "0.0002",
+                "markPx": "100.5",
+                "oraclePx": "100.4",
+                "midPx": "100.45",
+                "openInterest": open_interest,
+                "dayBaseVlm": "50",
+                "dayNtlVlm": "5000",
+            },
+        },
+    }
+
+
+@asynccontextmanager
+async def _null_context():
+    yield
+
+
+class TestFlushBuffers:
+    """Test writing buffered funding and OI data."""
+
+    @pytest.fixture
+    def collector(self):
+        """Create a collector tracking BTC and ETH."""
+        collector = HyperliquidFundingCollector()
+        collector.starlistings = [
+            _starlisting("BTC", 11, 1),
+            _starlisting("BTC", 11, 2),
+            _starlisting("ETH", 12, 3),
+        ]
+        collector._index_starlistings()
+        return collector
+
+    @pytest.fixture
+    def conn(self):
+        """Patch the asyncpg pool used by the collector to hand out one connection."""
+        conn = MagicMock()
+        conn.executemany = AsyncMock()
+        conn.transaction = MagicMock(side_effect=lambda: _null_context())
+
+        @asynccontextmanager
+        async def acquire():
+            yield conn
+
+        pool = MagicMock()
+        pool.acquire = acquire
+        with patch.object(hyperliquid_funding, "get_asyncpg_pool", AsyncMock(return_value=pool)):
+            yield conn
+
+    @pytest.mark.asyncio
+    async def test_one_batch_per_table(self, collector, conn):
+        """Test that all buffered coins are written in one call per table."""
+        collector._process_message(_ctx_message("BTC"))
+        collector._process_message(_ctx_message("ETH"))
+
+        await collector._flush_buffers()
+
+        assert conn.executemany.await_count == 2
+        (funding_sql, funding_rows), (oi_sql, oi_rows) = (
+            call.args for call in conn.executemany.await_args_list
+        )
+        assert "INSERT INTO funding_rates" in funding_sql
+        assert "INSERT INTO open_interest" in oi_sql
+        assert [row[0] for row in funding_rows] == [11, 12]
+        assert [row[0] for row in oi_rows] == [11, 12]
+        conn.transaction.assert_called_once()
+        assert collector.funding_buffer == [None, None]
+        assert collector.oi_buffer == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_updates_not_written_until_flush(self, collector, conn):
+        """Test that updates only overwrite their coin's slot until the next flush."""
+        for funding in ("0.0001", "0.0002", "0.0003"):
+            collector._process_message(_ctx_message("BTC", funding=funding))
+
+        conn.executemany.assert_not_awaited()
+        await collector._flush_buffers()
+
+        (_, (funding_row,)), _ = (call.args for call in conn.executemany.await_args_list)
+        assert funding_row[2] == Decimal("0.0003")
+
+    @pytest.mark.asyncio
+    async def test_same_statements_every_flush(self, collector, conn):
+        """Test that every flush sends identical SQL, so asyncpg reuses its prepared statements."""
+        for _ in range(2):
+            collector._process_message(_ctx_message("BTC"))
+            await collector._flush_buffers()
+
+        first, second = (
+            [call.args[0] for call in conn.executemany.await_args_list[i : i + 2]] for i in (0, 2)
+        )
+        assert all(a is b for a, b in zip(first, second))
+        assert first == [hyperliquid_funding._INSERT_FUNDING_SQL, hyperliquid_funding._INSERT_OI_SQL]
+
+    @pytest.mark.asyncio
+    async def test_values_parsed_to_decimal_at_flush(self, collector, conn):
+        """Test that the buffered strings are written as Decimals, with notional value."""
+        collector._process_message(_ctx_message("BTC", funding="0.0001", open_interest="1000"))
+
+        await collector._flush_buffers()
+
+        (_, (funding_row,)), (_, (oi_row,)) = (
+            call.args for call in conn.executemany.await_args_list
+        )
+        assert funding_row[2:8] == (
+            Decimal("0.0001"),
+            Decimal("0.0002"),
+            Decimal("100.5"),
+            Decimal("100.4"),
+            Decimal("100.4"),
+            Decimal("100.45"),
+        )
+        assert funding_row[5] is funding_row[6]  # Oracle price parsed once, also the index price
+        assert oi_row[2:] == (Decimal("1000"), Decimal("100500.0"), Decimal("50"), Decimal("5000"))
+
+    @pytest.mark.asyncio
+    async def test_unparseable_coin_dropped(self, collector, conn):
+        """Test that a coin with a malformed value does not block the other rows."""
+        collector._process_message(_ctx_message("BTC", funding="not-a-number"))
+        collector._process_message(_ctx_message("ETH"))
+
+        await collector._flush_buffers()
+
+        funding_rows = conn.executemany.await_args_list[0].args[1]
+        assert [row[0] for row in funding_rows] == [12]
+        assert collector.funding_buffer == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_buffers(self, collector, conn):
+        """Test that buffered data is kept for the next flush if the write fails."""
+        conn.executemany.side_effect = Exception("database unavailable")
+        collector._process_message(_ctx_message("BTC"))
+
+        await collector._flush_buffers()
+
+        assert collector.funding_buffer[0][0] == 11
+        assert collector.oi_buffer[0][0] == 11
+
+    @pytest.mark.asyncio
+    async def test_update_during_write_kept_for_next_flush(self, collector, conn):
+        """Test that an update arriving while a flush is writing is not cleared by it."""
+
+        async def update_during_write(query, rows):
+            collector._process_message(_ctx_message("BTC", funding="0.0009"))
+
+        conn.executemany.side_effect = update_during_write
+        collector._process_message(_ctx_message("BTC"))
+
+        await collector._flush_buffers()
+
+        assert collector.funding_buffer[0][1] == "0.0009"
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_prefers_newer_updates(self, collector, conn):
+        """Test that a failed flush restores its data without overwriting newer updates."""
+
+        async def update_then_fail(query, rows):
+            collector._process_message(_ctx_message("BTC", funding="0.0009"))
+            raise Exception("database unavailable")
+
+        conn.executemany.side_effect = update_then_fail
+        collector._process_message(_ctx_message("BTC"))
+        collector._process_message(_ctx_message("ETH"))
+
+        await collector._flush_buffers()
+
+        assert [slot[1] for slot in collector.funding_buffer] == ["0.0009", "0.0001"]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_data_when_buffers_rebuilt(self, collector, conn):
+        """Test that a failed flush does not truncate its data into resized buffers."""
+
+        async def rebuild_then_fail(query, rows):
+            collector._coin_slots = {"BTC": (0, 11)}
+            collector._clear_buffers()
+            raise Exception("database unavailable")
+
+        conn.executemany.side_effect = rebuild_then_fail
+        collector._process_message(_ctx_message("BTC"))
+        collector._process_message(_ctx_message("ETH"))
+
+        await collector._flush_buffers()
+
+        assert [slot[0] for slot in collector.funding_buffer] == [11, 12]
+
+
+class TestProcessMessage:
+    """Test buffering of asset context updates."""
+
+    @pytest.fixture
+    def collector(self):
+        """Create a collector with two BTC starlistings on different trading pairs."""
+        collector = HyperliquidFundingCollector()
+        collector.starlistings = [_starlisting("BTC", 11, 1), _starlisting("BTC", 21, 2)]
+        collector._index_starlistings()
+        return collector
+
+    @pytest.mark.asyncio
+    async def test_buffered_under_first_starlisting_of_coin(self, collector):
+        """Test that updates are attributed to the coin's first starlisting."""
+        collector._process_message(_ctx_message("BTC"))
+
+        assert collector.funding_buffer == [(11, "0.0001", "0.0002", "100.5", "100.4", "100.45")]
+        assert collector.oi_buffer == [(11, "1000", "100.5", "50", "5000")]
+
+    @pytest.mark.asyncio
+    async def test_clock_not_read_per_message(self, collector):
+        """Test that buffering an update does not read the wall clock."""
+        with patch.object(hyperliquid_funding, "utc_now") as utc_now:
+            for _ in range(3):
+                collector._process_message(_ctx_message("BTC"))
+
+        utc_now.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_coin_ignored(self, collector):
+        """Test that updates for untracked coins are not buffered."""
+        collector._process_message(_ctx_message("DOGE"))
+
+        assert collector.funding_buffer == [None]
+        assert collector.oi_buffer == [None]
+
+
+class TestSubscribe:
+    """Test asset context subscription setup."""
+
+    @pytest.mark.asyncio
+    async def test_subscribes_each_coin_once_as_text_frames(self):
+        """Test that one text subscription frame is sent per unique coin."""
+        collector = HyperliquidFundingCollector()
+        collector.ws = MagicMock()
+        collector.ws.send = AsyncMock()
+        collector.starlistings = [
+            _starlisting("BTC", 11, 1),
+            _starlisting("BTC", 11, 2),
+            _starlisting("ETH", 12, 3),
+        ]
+        collector._index_starlistings()
+
+        await collector._subscribe_to_asset_contexts()
+
+        sent = [
+            (orjson.loads(call.args[0])["subscription"], call.kwargs)
+            for call in collector.ws.send.await_args_list
+        ]
+        assert sent == [
+            ({"type": "activeAssetCtx", "coin": "BTC"}, {"text": True}),
+            ({"type": "activeAssetCtx", "coin": "ETH"}, {"text": True}),
+        ]
+        assert collector.subscriptions == {"BTC": 11, "ETH": 12}
+
+
+class TestCollect:
+    """Test the funding collect loop."""
+
+    @pytest.mark.asyncio
+    async def test_frames_without_asset_context_not_parsed(self):
+        """Test that only frames that can be asset context updates are processed."""
+        collector = HyperliquidFundingCollector()
+        collector.ws = MagicMock()
+        collector.ws.recv = AsyncMock(
+            side_effect=[
+                b'{"channel":"pong"}',
+                orjson.dumps(_ctx_message("BTC")),
+                websockets.ConnectionClosedOK(None, None),
+            ]
+        )
+        collector._process_message = MagicMock()
+
+        await collector.collect()
+
+        (data,) = collector._process_message.call_args.args
+        assert data["data"]["coin"] == "BTC"
+        # Frames are read as raw bytes for orjson, without decoding to str first
+        assert all(call.kwargs == {"decode": False} for call in collector.ws.recv.await_args_list)
+
+
+class TestFlushLoop:
+    """Test scheduling of the once-a-minute flush."""
+
+    @pytest.mark.asyncio
+    async def test_late_wakeups_do_not_drift(self):
+        """Test that each wait is shortened by how late the previous one woke."""
+        collector = HyperliquidFundingCollector()
+        collector._flush_buffers = AsyncMock()
+        loop = asyncio.get_running_loop()
+        clock = [1000.0]
+        sleeps = []
+
+        async def late_sleep(delay):
+            sleeps.append(delay)
+            if len(sleeps) == 3:
+                raise asyncio.CancelledError
+            clock[0] += delay + 0.25
+
+        with patch.object(loop, "time", lambda: clock[0]), patch.object(
+            hyperliquid_funding.asyncio, "sleep", late_sleep
+        ), patch.object(
+            hyperliquid_funding,
+            "utc_now",
+            return_value=datetime(2025, 1, 1, 12, 0, 30, 500000, tzinfo=timezone.utc),
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await collector._flush_loop()
+
+        assert sleeps == pytest.approx([29.5, 59.75, 59.75])
+        assert collector._flush_buffers.await_count == 2
@@ -0,0 +1,82 @@
+"""Unit tests for the PostgreSQL notification listener."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.api import postgres_listener
+from src.api.postgres_listener import PostgresNotificationListener
+from src.api.starlisting_cache import clear_starlisting_cache, starlisting_active_cache
+
+
+class TestNotificationCallback:
+    """Test PostgresNotificationListener._notification_callback."""
+
+    @pytest.fixture
+    def listener(self):
+        """Create a listener with a mocked connection manager."""
+        return PostgresNotificationListener(MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_repeated_notification_handled_once(self, listener):
+        """Test that a repeat arriving before the handler runs is dropped."""
+        listener._handle_candle_notification = AsyncMock()
+        payload = '{"starlisting_id": 1, "time": "2025-11-17T17:33:00+00"}'
+
+        listener._notification_callback(MagicMock(), 1, "candle_updates", payload)
+        listener._notification_callback(MagicMock(), 1, "candle_updates", payload)
+        await asyncio.sleep(0)
+
+        listener._handle_candle_notification.assert_awaited_once_with(
+            1, "2025-11-17T17:33:00+00"
+        )
+
+    @pytest.mark.asyncio
+    async def test_notification_after_handler_started_is_handled(self, listener):
+        """Test that a repeat arriving once the handler has started is handled again."""
+        listener.connection_manager.get_subscriber_count.return_value = 0
+        payload = '{"starlisting_id": 1, "time": "2025-11-17T17:33:00+00"}'
+
+        listener._notification_callback(MagicMock(), 1, "candle_updates", payload)
+        await asyncio.sleep(0)
+        listener._notification_callback(MagicMock(), 1, "candle_updates", payload)
+        await asyncio.sleep(0)
+
+        assert listener.connection_manager.get_subscriber_count.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_different_records_not_deduplicated(self, listener):
+        """Test that notifications for different records are all handled."""
+        listener._handle_funding_notification = AsyncMock()
+
+        listener._notification_callback(
+            MagicMock(), 1, "funding_updates", '{"trading_pair_id": 1, "time": "t1"}'
+        )
+        listener._notification_callback(
+            MagicMock(), 1, "funding_updates", '{"trading_pair_id": 1, "time": "t2"}'
+        )
+        await asyncio.sleep(0)
+
+        assert listener._handle_funding_notification.await_count == 2
+
+    def test_starlisting_notification_evicts_cache(self, listener):
+        """Test that a starlisting change evicts only that starlisting's cache entries."""
+        starlisting_active_cache.update({1: (True, float("inf")), 2: (True, float("inf"))})
+
+        listener._notification_callback(
+            MagicMock(), 1, "starlisting_updates", '{"starlisting_id": 1}'
+        )
+
+        assert 1 not in starlisting_active_cache
+        assert 2 in starlisting_active_cache
+        clear_starlisting_cache()
+
+    def test_api_key_notification_evicts_cached_validation(self, listener):
+        """Test that a revoked key is evicted from this worker's validation cache."""
+        with patch.object(postgres_listener, "invalidate_api_key_cache") as invalidate:
+            listener._notification_callback(
+                MagicMock(), 1, "api_key_updates", '{"key_hash": "abc123"}'
+            )
+
+        invalidate.assert_called_once_with("abc123")
@@ -0,0 +1,127 @@
+"""Unit tests for chunked historical data delivery over WebSocket."""
+
+from collections import namedtuple
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.api.routers import websocket as ws_router
+
+Row = namedtuple("Row", ["value", "starlisting_id"])
+
+HEADER = {"exchange": "hyperliquid", "coin": "BTC"}
+
+
+def _fetch_returning(*partitions):
+    """Create a fetch function whose result streams the given row partitions."""
+
+    async def stream():
+        for partition in partitions:
+            yield partition
+
+    result = MagicMock()
+    result.partitions = stream
+    return AsyncMock(return_value=result)
+
+
+@asynccontextmanager
+async def _session():
+    yield MagicMock()
+
+
+class TestStreamChunksWithSession:
+    """Test _stream_chunks_with_session."""
+
+    @pytest.fixture(autouse=True)
+    def manager(self):
+        """Replace the connection manager and session factory used by the router."""
+        manager = MagicMock()
+        manager.send_history_chunk = AsyncMock(return_value=True)
+        with patch.object(ws_router, "connection_manager", manager), patch.object(
+            ws_router, "get_readonly_session_factory", return_value=_session
+        ):
+            yield manager
+
+    async def _stream(self, fetch, chunk_size=2, meta_by_id=None, compress=False):
+        await ws_router._stream_chunks_with_session(
+            MagicMock(),
+            fetch,
+            [1, 2],
+            10,
+            lambda row: {"value": row.value},
+            "historical",
+            meta_by_id or {1: (HEADER, "1m"), 2: (HEADER, "5m")},
+            chunk_size,
+            compress,
+        )
+
+    @staticmethod
+    def _sent(manager):
+        return [call.args[1] for call in manager.send_history_chunk.await_args_list]
+
+    @pytest.mark.asyncio
+    async def test_records_split_into_numbered_chunks(self, manager):
+        """Test that each starlisting's records are sent in sequenced chunks."""
+        fetch = _fetch_returning(
+            [Row(1, 1), Row(2, 1), Row(3, 1)],
+            [Row(4, 1), Row(5, 2), Row(6, 2)],
+        )
+
+        await self._stream(fetch)
+
+        sent = [
+            (m["starlisting_id"], m["seq"], m["final"], [r["value"] for r in m["data"]])
+            for m in self._sent(manager)
+        ]
+        assert sent == [
+            (1, 0, False, [1, 2]),
+            (1, 1, True, [3, 4]),
+            (2, 0, True, [5, 6]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_chunk_carries_header(self, manager):
+        """Test that every chunk carries the starlisting header and record count."""
+        await self._stream(_fetch_returning([Row(1, 2)]))
+
+        (message,) = self._sent(manager)
+        assert message == {
+            "type": "historical",
+            "starlisting_id": 2,
+            **HEADER,
+            "interval": "5m",
+            "count": 1,
+            "seq": 0,
+            "final": True,
+            "data": [{"value": 1}],
+        }
+
+    @pytest.mark.asyncio
+    async def test_stops_when_client_dropped(self, manager):
+        """Test that streaming stops once the client can no longer be sent to."""
+        manager.send_history_chunk.return_value = False
+        fetch = _fetch_returning([Row(i, 1) for i in range(10)])
+
+        await self._stream(fetch)
+
+        manager.send_history_chunk.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_starlisting_without_metadata_skipped(self, manager):
+        """Test that rows of starlistings missing from the metadata are not sent."""
+        fetch = _fetch_returning([Row(1, 1), Row(2, 2)])
+
+        await self._stream(fetch, meta_by_id={2: (HEADER, "5m")})
+
+        assert [m["starlisting_id"] for m in self._sent(manager)] == [2]
+
+    @pytest.mark.asyncio
+    async def test_compress_passed_to_every_chunk(self, manager):
+        """Test that chunks are sent compressible when the client opted in."""
+        await self._stream(_fetch_returning([Row(1, 1), Row(2, 1), Row(3, 1)]), compress=True)
+
+        assert [call.args[2] for call in manager.send_history_chunk.await_args_list] == [
+            True,
+            True,
+        ]
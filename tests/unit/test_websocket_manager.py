@@ -1,11 +1,22 @@
 """Unit tests for WebSocket connection manager."""
 
 import asyncio
+import json
+import zlib
+from datetime import datetime, timezone
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.api.websocket_manager import ConnectionManager
+from src.api.websocket_manager import (
+    COMPRESSION_THRESHOLD,
+    MSGPACK_SUBPROTOCOL,
+    ConnectionManager,
+    _dumps,
+    _SendQueue,
+    _text_frame,
+)
 
 
 class TestConnectionManager:
@@ -22,6 +33,7 @@ class TestConnectionManager:
         ws = MagicMock()
         ws.accept = AsyncMock()
         ws.send_text = AsyncMock()
+        ws.send_bytes = AsyncMock()
         ws.close = AsyncMock()
         return ws
 
@@ -88,21 +100,59 @@ class TestConnectionManager:
         manager.subscribers[2] = {mock_websocket}
         manager.subscribers[3] = {mock_websocket}
 
-        # Mock heartbeat task
-        mock_task = MagicMock()
-        mock_task.cancel = MagicMock()
-        manager._heartbeat_tasks[mock_websocket] = mock_task
-
         # Disconnect
         await manager.disconnect(mock_websocket)
 
         # Verify cleanup
         assert mock_websocket not in manager.connections
-        assert 1 not in manager.subscribers
-        assert 2 not in manager.subscribers
-        assert 3 not in manager.subscribers
-        assert mock_websocket not in manager._heartbeat_tasks
-        mock_task.cancel.assert_called_once()
+        assert manager.subscribers[1] == set()
+        assert manager.subscribers[2] == set()
+        assert manager.subscribers[3] == set()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_writer_and_heartbeat(self, manager, mock_websocket):
+        """Test that disconnecting cancels the client's background tasks."""
+        await manager.connect(mock_websocket)
+        writer = manager._writer_tasks[mock_websocket]
+        heartbeat = manager._heartbeat_task
+
+        await manager.disconnect(mock_websocket)
+        await asyncio.sleep(0)
+
+        assert writer.done()
+        assert heartbeat.done()
+        assert manager._heartbeat_task is None
+        assert mock_websocket not in manager._send_queues
+        assert mock_websocket not in manager._writer_tasks
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_shared_by_connections(self, manager):
+        """Test that one heartbeat task serves all connections until the last leaves."""
+        websockets = [MagicMock(accept=AsyncMock(), send_text=AsyncMock()) for _ in range(2)]
+        for ws in websockets:
+            await manager.connect(ws)
+        heartbeat = manager._heartbeat_task
+
+        await manager.disconnect(websockets[0])
+        assert manager._heartbeat_task is heartbeat
+
+        await manager.disconnect(websockets[1])
+        await asyncio.sleep(0)
+        assert heartbeat.done()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_sends_ping(self, mock_websocket):
+        """Test that the heartbeat sends a timestamped ping message."""
+        manager = ConnectionManager(max_connections=10, heartbeat_interval=0)
+
+        await manager.connect(mock_websocket)
+        await self._drain()
+        await manager.disconnect(mock_websocket)
+
+        frame = json.loads(mock_websocket.send_text.call_args_list[0][0][0])
+        ping = frame["messages"][0] if frame["type"] == "batch" else frame
+        assert ping["type"] == "ping"
+        assert datetime.fromisoformat(ping["timestamp"]).tzinfo is not None
 
     @pytest.mark.asyncio
     async def test_subscribe(self, manager, mock_websocket):
@@ -142,20 +192,26 @@ class TestConnectionManager:
 
         # Check remaining subscriptions
         assert manager.connections[mock_websocket] == {3}
-        assert 1 not in manager.subscribers
-        assert 2 not in manager.subscribers
+        assert mock_websocket not in manager.subscribers[1]
+        assert mock_websocket not in manager.subscribers[2]
         assert mock_websocket in manager.subscribers[3]
 
     @pytest.mark.asyncio
-    async def test_unsubscribe_cleans_empty_sets(self, manager, mock_websocket):
-        """Test that unsubscribe cleans up empty subscriber sets."""
+    async def test_unsubscribe_keeps_empty_sets(self, manager, mock_websocket):
+        """Test that unsubscribe keeps emptied subscriber sets for reuse."""
         manager.connections[mock_websocket] = {1}
-        manager.subscribers[1] = {mock_websocket}
+        subscribers = manager.subscribers[1] = {mock_websocket}
 
         await manager.unsubscribe(mock_websocket, [1])
 
-        # Empty set should be cleaned up
-        assert 1 not in manager.subscribers
+        # Empty set is kept and reused by the next subscribe
+        assert manager.subscribers[1] is subscribers
+        assert manager.get_subscriber_count(1) == 0
+        assert await manager.broadcast_to_subscribers(1, {"type": "candle"}) == 0
+
+        await manager.subscribe(mock_websocket, [1])
+        assert manager.subscribers[1] is subscribers
+        assert manager.get_subscriber_count(1) == 1
 
     def test_get_subscriptions(self, manager, mock_websocket):
         """Test getting subscriptions for a client."""
@@ -190,27 +246,87 @@ class TestConnectionManager:
 
         assert count == 0
 
+    @staticmethod
+    def _make_websocket():
+        """Create a mock WebSocket connection."""
+        ws = MagicMock()
+        ws.accept = AsyncMock()
+        ws.send_text = AsyncMock()
+        ws.send_bytes = AsyncMock()
+        ws.close = AsyncMock()
+        return ws
+
+    @staticmethod
+    async def _drain():
+        """Let writer tasks run until their queues are empty."""
+        for _ in range(3):
+            await asyncio.sleep(0)
+
     @pytest.mark.asyncio
     async def test_broadcast_to_subscribers(self, manager):
         """Test broadcasting message to subscribers."""
         # Create multiple websockets
-        ws1 = MagicMock()
-        ws1.send_text = AsyncMock()
-        ws2 = MagicMock()
-        ws2.send_text = AsyncMock()
+        ws1 = self._make_websocket()
+        ws2 = self._make_websocket()
 
-        manager.connections[ws1] = {1}
-        manager.connections[ws2] = {1}
-        manager.subscribers[1] = {ws1, ws2}
+        await manager.connect(ws1)
+        await manager.connect(ws2)
+        await manager.subscribe(ws1, [1])
+        await manager.subscribe(ws2, [1])
 
         message = {"type": "candle", "data": "test"}
 
         sent_count = await manager.broadcast_to_subscribers(1, message)
+        await self._drain()
 
         assert sent_count == 2
         ws1.send_text.assert_called_once()
         ws2.send_text.assert_called_once()
 
+        await manager.disconnect(ws1)
+        await manager.disconnect(ws2)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_serializes_once(self, manager):
+        """Test that all subscribers are sent the same serialized frame."""
+        ws1 = self._make_websocket()
+        ws2 = self._make_websocket()
+
+        await manager.connect(ws1)
+        await manager.connect(ws2)
+        await manager.subscribe(ws1, [1])
+        await manager.subscribe(ws2, [1])
+
+        with patch("src.api.websocket_manager._dumps", wraps=_dumps) as dumps:
+            await manager.broadcast_to_subscribers(1, {"type": "candle", "data": "test"})
+        await self._drain()
+
+        dumps.assert_called_once()
+        assert ws1.send_text.call_args[0][0] is ws2.send_text.call_args[0][0]
+
+        await manager.disconnect(ws1)
+        await manager.disconnect(ws2)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_only_queues_for_subscribers(self, manager):
+        """Test that clients subscribed elsewhere are not queued anything."""
+        ws1 = self._make_websocket()
+        ws2 = self._make_websocket()
+
+        await manager.connect(ws1)
+        await manager.connect(ws2)
+        await manager.subscribe(ws1, [1])
+        await manager.subscribe(ws2, [2])
+
+        sent_count = await manager.broadcast_to_subscribers(1, {"type": "candle"})
+
+        assert sent_count == 1
+        assert manager._send_queues[ws1].qsize() == 1
+        assert manager._send_queues[ws2].qsize() == 0
+
+        await manager.disconnect(ws1)
+        await manager.disconnect(ws2)
+
     @pytest.mark.asyncio
     async def test_broadcast_to_subscribers_no_subscribers(self, manager):
         """Test broadcasting when no subscribers."""
@@ -224,51 +340,552 @@ class TestConnectionManager:
     async def test_broadcast_handles_failed_send(self, manager):
         """Test that broadcast handles failed sends gracefully."""
         # Create websockets - one will fail
-        ws1 = MagicMock()
-        ws1.send_text = AsyncMock()
-        ws2 = MagicMock()
+        ws1 = self._make_websocket()
+        ws2 = self._make_websocket()
         ws2.send_text = AsyncMock(side_effect=Exception("Send failed"))
 
-        manager.connections[ws1] = {1}
-        manager.connections[ws2] = {1}
-        manager.subscribers[1] = {ws1, ws2}
+        await manager.connect(ws1)
+        await manager.connect(ws2)
+        await manager.subscribe(ws1, [1])
+        await manager.subscribe(ws2, [1])
 
         message = {"type": "candle", "data": "test"}
 
-        sent_count = await manager.broadcast_to_subscribers(1, message)
+        await manager.broadcast_to_subscribers(1, message)
+        await self._drain()
 
-        # Should send to one, fail on other
-        assert sent_count == 1
-        # Failed connection should be cleaned up
+        ws1.send_text.assert_called_once()
+        # Failed connection should be cleaned up by its writer
         assert ws2 not in manager.connections
+        assert ws1 in manager.subscribers[1]
+
+        await manager.disconnect(ws1)
+
+    @pytest.mark.asyncio
+    async def test_slow_client_dropped_when_queue_full(self, mock_websocket):
+        """Test that a client whose send queue overflows is disconnected."""
+        manager = ConnectionManager(max_connections=10, send_queue_size=2)
+        await manager.connect(mock_websocket)
+        await manager.subscribe(mock_websocket, [1])
+
+        message = {"type": "candle", "data": "test"}
+
+        # Writer never gets to run, so the queue fills up
+        assert await manager.broadcast_to_subscribers(1, message) == 1
+        assert await manager.broadcast_to_subscribers(1, message) == 1
+        assert await manager.broadcast_to_subscribers(1, message) == 0
+
+        assert mock_websocket not in manager.connections
+        assert mock_websocket not in manager.subscribers[1]
+        assert len(manager._close_tasks) == 1
+        await manager.wait_closed()
+        mock_websocket.close.assert_called_once()
+        assert manager._close_tasks == set()
 
     @pytest.mark.asyncio
     async def test_send_to_client_success(self, manager, mock_websocket):
         """Test sending message to specific client."""
-        manager.connections[mock_websocket] = set()
+        await manager.connect(mock_websocket)
 
         message = {"type": "success", "message": "test"}
 
         result = await manager.send_to_client(mock_websocket, message)
+        await self._drain()
 
         assert result is True
         mock_websocket.send_text.assert_called_once()
+        assert json.loads(mock_websocket.send_text.call_args[0][0]) == message
+
+        await manager.disconnect(mock_websocket)
 
     @pytest.mark.asyncio
-    async def test_send_to_client_failure(self, manager, mock_websocket):
-        """Test sending message failure handling."""
-        manager.connections[mock_websocket] = set()
-        mock_websocket.send_text.side_effect = Exception("Send failed")
+    async def test_send_to_client_serializes_decimal_and_datetime(
+        self, manager, mock_websocket
+    ):
+        """Test that Decimal and datetime values are serialized."""
+        await manager.connect(mock_websocket)
+
+        message = {
+            "type": "candle",
+            "time": datetime(2025, 11, 17, 22, 0, tzinfo=timezone.utc),
+            "close": Decimal("92125.50"),
+        }
 
-        # Mock heartbeat task
-        mock_task = MagicMock()
-        mock_task.cancel = MagicMock()
-        manager._heartbeat_tasks[mock_websocket] = mock_task
+        result = await manager.send_to_client(mock_websocket, message)
+        await self._drain()
+
+        assert result is True
+        payload = json.loads(mock_websocket.send_text.call_args[0][0])
+        assert payload["time"] == "2025-11-17T22:00:00+00:00"
+        assert payload["close"] == "92125.50"
 
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_send_to_client_not_connected(self, manager, mock_websocket):
+        """Test sending to a client that is not connected."""
         message = {"type": "success", "message": "test"}
 
         result = await manager.send_to_client(mock_websocket, message)
 
         assert result is False
+        mock_websocket.send_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_serialized(self, manager, mock_websocket):
+        """Test that pre-serialized messages are sent unchanged."""
+        await manager.connect(mock_websocket)
+        message = {"type": "pong", "timestamp": "2025-01-01T00:00:00+00:00"}
+        message_json = _dumps(message)
+
+        result = await manager.send_serialized(mock_websocket, message_json, message)
+        await self._drain()
+
+        assert result is True
+        mock_websocket.send_text.assert_called_once_with(message_json)
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_msgpack_client_gets_binary_frames(self, manager):
+        """Test that a MessagePack client gets binary frames while others get JSON."""
+        ormsgpack = pytest.importorskip("ormsgpack")
+        json_ws = self._make_websocket()
+        msgpack_ws = self._make_websocket()
+
+        await manager.connect(json_ws)
+        await manager.connect(msgpack_ws, subprotocol=MSGPACK_SUBPROTOCOL)
+        await manager.subscribe(json_ws, [1])
+        await manager.subscribe(msgpack_ws, [1])
+
+        message = {"type": "candle", "starlisting_id": 1, "data": {"close": "1.5"}}
+        assert await manager.broadcast_to_subscribers(1, message) == 2
+        await self._drain()
+
+        msgpack_ws.accept.assert_called_once_with(subprotocol=MSGPACK_SUBPROTOCOL)
+        assert json.loads(json_ws.send_text.call_args[0][0]) == message
+        assert ormsgpack.unpackb(msgpack_ws.send_bytes.call_args[0][0]) == message
+        msgpack_ws.send_text.assert_not_called()
+
+        await manager.disconnect(json_ws)
+        await manager.disconnect(msgpack_ws)
+
+    @pytest.mark.asyncio
+    async def test_msgpack_client_batch_not_compressed(self, manager, mock_websocket):
+        """Test that MessagePack clients get batches packed, never zlib-compressed."""
+        ormsgpack = pytest.importorskip("ormsgpack")
+        await manager.connect(mock_websocket, subprotocol=MSGPACK_SUBPROTOCOL)
+        messages = [{"type": "historical", "data": "x" * COMPRESSION_THRESHOLD}]
+
+        await manager.send_batch(mock_websocket, messages, compress=True)
+        await self._drain()
+
+        frame = ormsgpack.unpackb(mock_websocket.send_bytes.call_args[0][0])
+        assert frame == {"type": "batch", "messages": messages}
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_send_to_client_failure(self, manager, mock_websocket):
+        """Test sending message failure handling."""
+        mock_websocket.send_text.side_effect = Exception("Send failed")
+        await manager.connect(mock_websocket)
+
+        message = {"type": "success", "message": "test"}
+
+        await manager.send_to_client(mock_websocket, message)
+        await self._drain()
+
         # Connection should be cleaned up
         assert mock_websocket not in manager.connections
+        assert mock_websocket not in manager._writer_tasks
+
+    @pytest.mark.asyncio
+    async def test_send_batch(self, manager, mock_websocket):
+        """Test sending several messages in a single frame."""
+        await manager.connect(mock_websocket)
+
+        messages = [
+            {"type": "historical", "starlisting_id": 1},
+            {"type": "historical_funding", "starlisting_id": 1},
+        ]
+
+        result = await manager.send_batch(mock_websocket, messages)
+        await self._drain()
+
+        assert result is True
+        mock_websocket.send_text.assert_called_once()
+        payload = json.loads(mock_websocket.send_text.call_args[0][0])
+        assert payload == {"type": "batch", "messages": messages}
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_send_batch_empty(self, manager, mock_websocket):
+        """Test that an empty batch sends nothing."""
+        await manager.connect(mock_websocket)
+
+        result = await manager.send_batch(mock_websocket, [])
+        await self._drain()
+
+        assert result is True
+        mock_websocket.send_text.assert_not_called()
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_pending_messages_coalesced(self, manager, mock_websocket):
+        """Test that messages queued before the writer runs share one frame."""
+        await manager.connect(mock_websocket)
+        await manager.subscribe(mock_websocket, [1, 2])
+
+        await manager.broadcast_to_subscribers(1, {"type": "candle", "starlisting_id": 1})
+        await manager.broadcast_to_subscribers(2, {"type": "candle", "starlisting_id": 2})
+        await self._drain()
+
+        mock_websocket.send_text.assert_called_once()
+        payload = json.loads(mock_websocket.send_text.call_args[0][0])
+        assert payload["type"] == "batch"
+        assert [m["starlisting_id"] for m in payload["messages"]] == [1, 2]
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_send_batch_compressed(self, manager, mock_websocket):
+        """Test that large batches are zlib-compressed for clients that opt in."""
+        await manager.connect(mock_websocket)
+
+        messages = [{"type": "historical", "starlisting_id": 1, "data": ["x" * 100] * 100}]
+
+        result = await manager.send_batch(mock_websocket, messages, compress=True)
+        await self._drain()
+
+        assert result is True
+        mock_websocket.send_text.assert_not_called()
+        mock_websocket.send_bytes.assert_called_once()
+        frame = mock_websocket.send_bytes.call_args[0][0]
+        payload = json.loads(zlib.decompress(frame))
+        assert payload == {"type": "batch", "messages": messages}
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_history_chunks_paced_by_client(self, mock_websocket):
+        """Test that more history chunks than the queue holds are sent, not dropped."""
+        manager = ConnectionManager(max_connections=10, send_queue_size=4)
+        await manager.connect(mock_websocket)
+
+        for seq in range(10):
+            assert await manager.send_history_chunk(
+                mock_websocket, {"type": "historical", "seq": seq}
+            )
+        await self._drain()
+
+        assert mock_websocket in manager.connections
+        sent = [json.loads(call.args[0]) for call in mock_websocket.send_text.await_args_list]
+        seqs = [
+            message["seq"]
+            for frame in sent
+            for message in (frame["messages"] if frame["type"] == "batch" else [frame])
+        ]
+        assert seqs == list(range(10))
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_history_chunk_compressed_as_batch(self, mock_websocket):
+        """Test that a large chunk is compressed like a historical batch."""
+        manager = ConnectionManager(max_connections=10, compression_threshold=256)
+        await manager.connect(mock_websocket)
+
+        message = {"type": "historical", "seq": 0, "data": ["x" * 300]}
+
+        await manager.send_history_chunk(mock_websocket, message, compress=True)
+        await self._drain()
+
+        frame = mock_websocket.send_bytes.call_args[0][0]
+        assert json.loads(zlib.decompress(frame)) == {"type": "batch", "messages": [message]}
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_history_chunk_released_on_disconnect(self, mock_websocket):
+        """Test that a chunk waiting for room fails once the client disconnects."""
+        manager = ConnectionManager(max_connections=10, send_queue_size=2)
+        await manager.connect(mock_websocket)
+        manager._writer_tasks[mock_websocket].cancel()
+        await manager.send_history_chunk(mock_websocket, {"seq": 0})
+        sender = asyncio.create_task(manager.send_history_chunk(mock_websocket, {"seq": 1}))
+        await asyncio.sleep(0)
+        assert not sender.done()
+
+        await manager.disconnect(mock_websocket)
+
+        assert await sender is False
+
+    @pytest.mark.asyncio
+    async def test_send_batch_small_not_compressed(self, manager, mock_websocket):
+        """Test that small batches stay uncompressed text even when compression is on."""
+        await manager.connect(mock_websocket)
+
+        messages = [{"type": "historical", "starlisting_id": 1, "data": []}]
+
+        await manager.send_batch(mock_websocket, messages, compress=True)
+        await self._drain()
+
+        mock_websocket.send_bytes.assert_not_called()
+        mock_websocket.send_text.assert_called_once()
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_send_batch_custom_compression_threshold(self, mock_websocket):
+        """Test that the compression threshold is configurable."""
+        manager = ConnectionManager(max_connections=10, compression_threshold=256)
+        await manager.connect(mock_websocket)
+
+        messages = [{"type": "historical", "starlisting_id": 1, "data": ["x" * 300]}]
+
+        await manager.send_batch(mock_websocket, messages, compress=True)
+        await self._drain()
+
+        frame = mock_websocket.send_bytes.call_args[0][0]
+        assert json.loads(zlib.decompress(frame))["messages"] == messages
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_compression_threshold_counts_bytes(self, mock_websocket):
+        """Test that the threshold is compared with the UTF-8 size, not the character count."""
+        manager = ConnectionManager(max_connections=10, compression_threshold=256)
+        await manager.connect(mock_websocket)
+
+        # 100 characters, but 300 bytes once encoded
+        messages = [{"type": "historical", "starlisting_id": 1, "data": ["\u20ac" * 100]}]
+
+        await manager.send_batch(mock_websocket, messages, compress=True)
+        await self._drain()
+
+        frame = mock_websocket.send_bytes.call_args[0][0]
+        assert json.loads(zlib.decompress(frame))["messages"] == messages
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_single_message_batch_keeps_envelope(self, manager, mock_websocket):
+        """Test that a one-message batch is still delivered as a batch."""
+        await manager.connect(mock_websocket)
+
+        messages = [{"type": "historical", "starlisting_id": 1}]
+
+        await manager.send_batch(mock_websocket, messages)
+        await self._drain()
+
+        payload = json.loads(mock_websocket.send_text.call_args[0][0])
+        assert payload == {"type": "batch", "messages": messages}
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_coalesced_batches_are_flattened(self, manager, mock_websocket):
+        """Test that a pending batch merged with other messages is not nested."""
+        await manager.connect(mock_websocket)
+
+        await manager.send_to_client(mock_websocket, {"type": "success"})
+        await manager.send_batch(mock_websocket, [{"type": "historical"}, {"type": "historical_oi"}])
+        await self._drain()
+
+        mock_websocket.send_text.assert_called_once()
+        payload = json.loads(mock_websocket.send_text.call_args[0][0])
+        assert [m["type"] for m in payload["messages"]] == [
+            "success",
+            "historical",
+            "historical_oi",
+        ]
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_backlog_drops_superseded_updates(self, mock_websocket):
+        """Test that a backlogged client only gets the newest update of each record."""
+        manager = ConnectionManager(max_connections=10, send_queue_size=10)
+        await manager.connect(mock_websocket)
+        await manager.subscribe(mock_websocket, [1])
+
+        await manager.send_to_client(mock_websocket, {"type": "success"})
+        for close in range(6):
+            await manager.broadcast_to_subscribers(
+                1, {"type": "candle", "data": {"time": "t1", "close": close}}
+            )
+        await manager.broadcast_to_subscribers(
+            1, {"type": "candle", "data": {"time": "t2", "close": 9}}
+        )
+        await self._drain()
+
+        payload = json.loads(mock_websocket.send_text.call_args[0][0])
+        assert payload["messages"] == [
+            {"type": "success"},
+            {"type": "candle", "data": {"time": "t1", "close": 5}},
+            {"type": "candle", "data": {"time": "t2", "close": 9}},
+        ]
+
+        await manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_small_backlog_keeps_every_update(self, manager, mock_websocket):
+        """Test that updates are not coalesced below the backlog threshold."""
+        await manager.connect(mock_websocket)
+        await manager.subscribe(mock_websocket, [1])
+
+        for close in range(3):
+            await manager.broadcast_to_subscribers(
+                1, {"type": "candle", "data": {"time": "t1", "close": close}}
+            )
+        await self._drain()
+
+        payload = json.loads(mock_websocket.send_text.call_args[0][0])
+        assert [m["data"]["close"] for m in payload["messages"]] == [0, 1, 2]
+
+        await manager.disconnect(mock_websocket)
+
+
+class TestSendQueue:
+    """Test the per-client send queue."""
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_put(self):
+        """Test that a waiting writer is woken by the next frame."""
+        queue = _SendQueue(10)
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+
+        queue.put_nowait((None, "a"))
+
+        assert await getter == (None, "a")
+
+    def test_put_raises_when_full(self):
+        """Test that a full queue rejects further frames."""
+        queue = _SendQueue(1)
+        queue.put_nowait((None, "a"))
+
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait((None, "b"))
+
+    def test_drain_returns_frames_in_order(self):
+        """Test that draining empties the queue oldest first."""
+        queue = _SendQueue(10)
+        for item in ("a", "b", "c"):
+            queue.put_nowait((None, item))
+
+        assert [item for _, item in queue.drain()] == ["a", "b", "c"]
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_put_waits_for_room(self):
+        """Test that a waiting put resumes once the writer takes a frame."""
+        queue = _SendQueue(10)
+        queue.put_nowait((None, "a"))
+        putter = asyncio.create_task(queue.put((None, "b"), 1))
+        await asyncio.sleep(0)
+        assert not putter.done()
+
+        assert await queue.get() == (None, "a")
+
+        assert await putter is True
+        assert [item for _, item in queue.drain()] == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_put_fails_when_closed(self):
+        """Test that closing the queue releases a waiting put without appending."""
+        queue = _SendQueue(10)
+        queue.put_nowait((None, "a"))
+        putter = asyncio.create_task(queue.put((None, "b"), 1))
+        await asyncio.sleep(0)
+
+        queue.close()
+
+        assert await putter is False
+        assert queue.qsize() == 1
+
+
+class TestRawFrames:
+    """Test writing text frames directly to the transport."""
+
+    @staticmethod
+    def _mock_websocket():
+        ws = MagicMock()
+        ws.accept = AsyncMock()
+        ws.send_text = AsyncMock()
+        ws.close = AsyncMock()
+        return ws
+
+    @staticmethod
+    def _mock_protocol():
+        protocol = MagicMock()
+        protocol.writable = asyncio.Event()
+        protocol.writable.set()
+        protocol.close_sent = False
+        protocol.transport.is_closing.return_value = False
+        return protocol
+
+    @pytest.mark.parametrize(
+        "length, header",
+        [
+            (5, bytes([0x81, 5])),
+            (300, bytes([0x81, 126, 0x01, 0x2C])),
+            (70000, bytes([0x81, 127, 0, 0, 0, 0, 0, 0x01, 0x11, 0x70])),
+        ],
+    )
+    def test_text_frame_header(self, length, header):
+        """Test that the payload length is encoded in the shortest form."""
+        frame = _text_frame(b"x" * length)
+
+        assert frame[: len(header)] == header
+        assert len(frame) == len(header) + length
+
+    @pytest.mark.asyncio
+    async def test_broadcast_frame_written_once_encoded(self):
+        """Test that subscribers share one encoded frame written to their transports."""
+        manager = ConnectionManager(raw_frames=True)
+        websockets = [self._mock_websocket() for _ in range(2)]
+        protocols = [self._mock_protocol() for _ in range(2)]
+
+        with patch(
+            "src.api.websocket_manager._find_raw_protocol", side_effect=protocols
+        ):
+            for ws in websockets:
+                await manager.connect(ws)
+                await manager.subscribe(ws, [1])
+
+        await manager.broadcast_to_subscribers(1, {"type": "candle", "data": {"time": "t"}})
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        frames = [p.transport.write.call_args[0][0] for p in protocols]
+        assert frames[0] is frames[1]
+        assert frames[0] == _text_frame(b'{"type":"candle","data":{"time":"t"}}')
+        for ws in websockets:
+            ws.send_text.assert_not_awaited()
+            await manager.disconnect(ws)
+
+    @pytest.mark.asyncio
+    async def test_paused_transport_uses_regular_send(self):
+        """Test that a client whose transport is paused is sent to through ASGI."""
+        manager = ConnectionManager(raw_frames=True)
+        ws = self._mock_websocket()
+        protocol = self._mock_protocol()
+        protocol.writable.clear()
+
+        with patch(
+            "src.api.websocket_manager._find_raw_protocol", return_value=protocol
+        ):
+            await manager.connect(ws)
+
+        await manager.send_to_client(ws, {"type": "success"})
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        protocol.transport.write.assert_not_called()
+        ws.send_text.assert_awaited_once_with('{"type":"success"}')
+        await manager.disconnect(ws)